@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Backfill responsive derivatives for the existing catalog
+- Walks the images table and generates any missing/outdated derivatives
+- Runs Pillow work in a process pool (one worker per CPU by default)
+- Resumable: derivatives newer than their original are skipped
+- Reports throughput (images/sec) and bytes saved vs. serving originals
+
+Usage: python backfill_derivatives.py [--workers N] [--limit N] [--force]
+"""
+import os
+import sys
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+def process_image(filename, force=False):
+    """Worker: generate derivatives for one original (runs in a child process)"""
+    from src.config import PHOTOGRAPHY_ASSETS_DIR, DERIVATIVE_WIDTHS
+    from src.derivatives import generate_derivatives, derivative_path, is_derivative_fresh
+
+    source_path = os.path.join(PHOTOGRAPHY_ASSETS_DIR, filename)
+    result = {'filename': filename, 'widths': [], 'written': 0,
+              'original_bytes': 0, 'derivative_bytes': 0, 'error': None}
+    try:
+        source_mtime = os.path.getmtime(source_path)
+        result['original_bytes'] = os.path.getsize(source_path)
+        fresh_before = {width for width in DERIVATIVE_WIDTHS.values()
+                        if not force and is_derivative_fresh(filename, width, source_mtime)}
+
+        widths = generate_derivatives(filename, skip_fresh=not force)
+        result['widths'] = widths
+        result['written'] = len([width for width in widths if width not in fresh_before])
+        if widths:
+            # Largest derivative is what a full-width view downloads instead of the original
+            result['derivative_bytes'] = os.path.getsize(derivative_path(filename, widths[-1]))
+    except Exception as e:
+        result['error'] = str(e)
+    return result
+
+def format_bytes(size):
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if abs(size) < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} TB"
+
+def backfill_derivatives(workers=None, limit=None, force=False, batch_size=100):
+    """Generate derivatives for every image and record the widths in the database"""
+    from src.main import app
+    from src.models import db, Image
+    from src.derivatives import format_widths
+
+    workers = workers or os.cpu_count() or 1
+
+    with app.app_context():
+        query = db.session.query(Image.id, Image.filename, Image.derivative_widths).order_by(Image.id)
+        if limit:
+            query = query.limit(limit)
+        rows = query.all()
+        stored = {filename: (image_id, widths) for image_id, filename, widths in rows}
+
+        print(f"🔄 Backfilling derivatives for {len(rows)} images with {workers} workers...")
+
+        started = time.time()
+        done = written = skipped = failed = 0
+        original_bytes = derivative_bytes = 0
+        pending_updates = []
+
+        # Release the SQLite connection before forking workers
+        db.session.remove()
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(process_image, filename, force) for filename in stored]
+            for future in as_completed(futures):
+                result = future.result()
+                done += 1
+                image_id, current = stored[result['filename']]
+
+                if result['error']:
+                    failed += 1
+                    print(f"❌ {result['filename']}: {result['error']}")
+                else:
+                    if result['written']:
+                        written += 1
+                    else:
+                        skipped += 1
+                    if result['widths']:
+                        original_bytes += result['original_bytes']
+                        derivative_bytes += result['derivative_bytes']
+                    value = format_widths(result['widths']) or None
+                    if value != current:
+                        pending_updates.append({'id': image_id, 'derivative_widths': value})
+
+                if len(pending_updates) >= batch_size:
+                    db.session.bulk_update_mappings(Image, pending_updates)
+                    db.session.commit()
+                    pending_updates = []
+
+                if done % 50 == 0 or done == len(futures):
+                    elapsed = time.time() - started
+                    print(f"📊 {done}/{len(futures)} images ({done / elapsed:.1f} images/sec)")
+
+        if pending_updates:
+            db.session.bulk_update_mappings(Image, pending_updates)
+            db.session.commit()
+
+        elapsed = time.time() - started
+        print(f"✅ Backfill complete in {elapsed:.1f}s ({done / elapsed if elapsed else 0:.1f} images/sec)")
+        print(f"   Generated: {written}  Up to date: {skipped}  Failed: {failed}")
+        print(f"   Originals: {format_bytes(original_bytes)}  Largest derivatives: {format_bytes(derivative_bytes)}")
+        print(f"   Bytes saved vs. serving originals: {format_bytes(original_bytes - derivative_bytes)}")
+        print("ℹ️ Running web processes pick up the new srcsets after their next catalog change or restart")
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Generate missing image derivatives')
+    parser.add_argument('--workers', type=int, default=None, help='worker processes (default: CPU count)')
+    parser.add_argument('--limit', type=int, default=None, help='only process the first N images')
+    parser.add_argument('--force', action='store_true', help='regenerate even up-to-date derivatives')
+    args = parser.parse_args()
+    backfill_derivatives(workers=args.workers, limit=args.limit, force=args.force)
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Backfill stored EXIF metadata for existing images
+- Extracts camera/lens/exposure/date/GPS for rows whose exif_data is empty
+- Only image headers are read, so this is I/O bound (thread pool)
+- Commits in batches; safe to rerun (already extracted rows are skipped)
+
+Usage: python backfill_exif.py [--workers N] [--force]
+"""
+import os
+import sys
+import time
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+def backfill_exif(workers=8, force=False, batch_size=200):
+    """Store EXIF JSON for every image that doesn't have it yet"""
+    from src.main import app
+    from src.models import db, Image
+    from src.config import PHOTOGRAPHY_ASSETS_DIR
+    from src.image_metadata import extract_exif_data, dump_exif
+
+    def read_exif(row):
+        image_id, filename = row
+        path = os.path.join(PHOTOGRAPHY_ASSETS_DIR, filename)
+        if not os.path.exists(path):
+            return image_id, filename, None
+        return image_id, filename, dump_exif(extract_exif_data(path))
+
+    with app.app_context():
+        query = db.session.query(Image.id, Image.filename)
+        if not force:
+            query = query.filter((Image.exif_data.is_(None)) | (Image.exif_data == ''))
+        rows = query.all()
+        print(f"🔄 Extracting EXIF for {len(rows)} images...")
+
+        started = time.time()
+        updated = missing = 0
+        pending = []
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for image_id, filename, exif_json in pool.map(read_exif, rows):
+                if exif_json is None:
+                    missing += 1
+                    print(f"⚠️  File not found: {filename}")
+                    continue
+                pending.append({'id': image_id, 'exif_data': exif_json})
+                if len(pending) >= batch_size:
+                    db.session.bulk_update_mappings(Image, pending)
+                    db.session.commit()
+                    updated += len(pending)
+                    pending = []
+
+        if pending:
+            db.session.bulk_update_mappings(Image, pending)
+            db.session.commit()
+            updated += len(pending)
+
+        elapsed = time.time() - started
+        print(f"✅ Stored EXIF for {updated} images in {elapsed:.1f}s ({missing} files missing)")
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Extract and store EXIF metadata')
+    parser.add_argument('--workers', type=int, default=8, help='reader threads (default: 8)')
+    parser.add_argument('--force', action='store_true', help='re-extract rows that already have EXIF')
+    args = parser.parse_args()
+    backfill_exif(workers=args.workers, force=args.force)
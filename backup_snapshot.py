@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Incremental backup snapshots (content-addressed, see src/snapshots.py)
+- create:  snapshot new/changed files + a consistent database copy
+- list:    show snapshots with their size and change counts
+- restore: rebuild the volume as of a snapshot into a directory
+- prune:   apply the daily/weekly retention policy and drop unreferenced objects
+
+Usage:
+  python backup_snapshot.py create [--label TEXT]
+  python backup_snapshot.py list
+  python backup_snapshot.py restore <snapshot_id|latest> --target /restore/dir [--no-verify]
+  python backup_snapshot.py prune [--keep-daily N] [--keep-weekly N]
+"""
+import os
+import sys
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.config import BACKUP_KEEP_DAILY, BACKUP_KEEP_WEEKLY
+from src.snapshots import create_snapshot, list_snapshots, latest_snapshot, restore_snapshot, prune_snapshots
+
+def format_mb(size):
+    return f"{size / (1024 * 1024):.1f} MB"
+
+def cmd_create(args):
+    manifest = create_snapshot(label=args.label)
+    stats = manifest['stats']
+    print(f"   Library size: {format_mb(stats['bytes_total'])}  read: {format_mb(stats['bytes_read'])}  "
+          f"newly stored: {format_mb(stats['bytes_stored'])}")
+
+def cmd_list(args):
+    snapshots = list_snapshots()
+    if not snapshots:
+        print("ℹ️  No snapshots yet")
+        return
+    for manifest in snapshots:
+        stats = manifest['stats']
+        label = f" [{manifest['label']}]" if manifest.get('label') else ''
+        print(f"📦 {manifest['id']}{label}  {manifest['created']}  {stats['files']} files  "
+              f"{format_mb(stats['bytes_total'])}  (+{stats['new_files']} new, {stats['changed_files']} changed, "
+              f"{format_mb(stats['bytes_stored'])} stored)")
+
+def cmd_restore(args):
+    snapshot_id = args.snapshot_id
+    if snapshot_id == 'latest':
+        latest = latest_snapshot()
+        if latest is None:
+            print("❌ No snapshots to restore")
+            sys.exit(1)
+        snapshot_id = latest['id']
+    if os.path.exists(args.target) and os.listdir(args.target):
+        print(f"❌ Target directory {args.target} is not empty")
+        sys.exit(1)
+    print(f"🔄 Restoring snapshot {snapshot_id} into {args.target}...")
+    restored = restore_snapshot(snapshot_id, args.target, verify=not args.no_verify)
+    print(f"✅ Restored {restored} files. Point RAILWAY_VOLUME_MOUNT_PATH at {args.target} (or copy it onto the volume) and restart.")
+
+def cmd_prune(args):
+    result = prune_snapshots(args.keep_daily, args.keep_weekly)
+    for snapshot_id in result['snapshots_removed']:
+        print(f"   removed {snapshot_id}")
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Incremental backup snapshots')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    create_parser = subparsers.add_parser('create', help='take a snapshot')
+    create_parser.add_argument('--label', default=None, help='optional note stored with the snapshot')
+    create_parser.set_defaults(func=cmd_create)
+
+    list_parser = subparsers.add_parser('list', help='list snapshots')
+    list_parser.set_defaults(func=cmd_list)
+
+    restore_parser = subparsers.add_parser('restore', help='restore a snapshot into a directory')
+    restore_parser.add_argument('snapshot_id', help="snapshot id or 'latest'")
+    restore_parser.add_argument('--target', required=True, help='empty directory to restore into')
+    restore_parser.add_argument('--no-verify', action='store_true', help='skip checksum verification')
+    restore_parser.set_defaults(func=cmd_restore)
+
+    prune_parser = subparsers.add_parser('prune', help='delete snapshots outside the retention policy')
+    prune_parser.add_argument('--keep-daily', type=int, default=BACKUP_KEEP_DAILY, help=f'daily snapshots to keep (default: {BACKUP_KEEP_DAILY})')
+    prune_parser.add_argument('--keep-weekly', type=int, default=BACKUP_KEEP_WEEKLY, help=f'weekly snapshots to keep (default: {BACKUP_KEEP_WEEKLY})')
+    prune_parser.set_defaults(func=cmd_prune)
+
+    args = parser.parse_args()
+    args.func(args)
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Bulk operation benchmark (see src/bulk_operations.py)
+Builds a scratch catalog, then times recategorizing and deleting selections
+of each size two ways: the old per-image loop (get, delete links, insert
+links one by one) and the set-based bulk functions. Reports wall time and
+the number of SQL statements each run sent to SQLite
+
+Usage: python benchmark_bulk.py [--sizes 1000,10000] [--dir /tmp/scratch]
+"""
+import os
+import sys
+import time
+import uuid
+import argparse
+import tempfile
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+CATEGORIES = ['Wildlife', 'Landscapes', 'Nature']
+
+def seed_catalog(count):
+    """count images with one category each (and an empty file per original)"""
+    from src.models import db, Image, Category, ImageCategory
+    from src.config import PHOTOGRAPHY_ASSETS_DIR
+    category_ids = dict(db.session.query(Category.name, Category.id).filter(Category.name.in_(CATEGORIES)))
+    image_rows, link_rows = [], []
+    for number in range(count):
+        image_id = str(uuid.uuid4())
+        filename = f"bench_{number}_{image_id[:8]}.jpg"
+        open(os.path.join(PHOTOGRAPHY_ASSETS_DIR, filename), 'wb').close()
+        image_rows.append({'id': image_id, 'filename': filename, 'title': filename,
+                           'upload_date': datetime.utcnow(), 'display_order': 0})
+        link_rows.append({'id': str(uuid.uuid4()), 'image_id': image_id, 'category_id': category_ids['Wildlife']})
+    db.session.execute(db.insert(Image), image_rows)
+    db.session.execute(db.insert(ImageCategory), link_rows)
+    db.session.commit()
+    return [row['id'] for row in image_rows]
+
+def loop_set_categories(image_ids, category_names):
+    """The per-image version this benchmark compares against"""
+    from src.models import db, Image, Category, ImageCategory
+    category_objects = Category.query.filter(Category.name.in_(category_names)).all()
+    for image_id in image_ids:
+        image = db.session.get(Image, image_id)
+        if image:
+            ImageCategory.query.filter_by(image_id=image_id).delete()
+            for category in category_objects:
+                db.session.add(ImageCategory(image_id=image_id, category_id=category.id))
+    db.session.commit()
+
+def loop_delete(image_ids):
+    from src.models import db, Image, ImageCategory
+    from src.config import PHOTOGRAPHY_ASSETS_DIR
+    for image_id in image_ids:
+        image = db.session.get(Image, image_id)
+        if image:
+            path = os.path.join(PHOTOGRAPHY_ASSETS_DIR, image.filename)
+            if os.path.exists(path):
+                os.remove(path)
+            ImageCategory.query.filter_by(image_id=image_id).delete()
+            db.session.delete(image)
+    db.session.commit()
+
+def measure(engine, func, *args):
+    """(seconds, statements) for one call"""
+    from sqlalchemy import event
+    statements = [0]
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements[0] += 1
+
+    event.listen(engine, 'before_cursor_execute', count)
+    try:
+        started = time.perf_counter()
+        func(*args)
+        return time.perf_counter() - started, statements[0]
+    finally:
+        event.remove(engine, 'before_cursor_execute', count)
+
+def main(sizes):
+    from src.app_factory import create_app, init_database
+    from src.models import db
+    from src.bulk_operations import bulk_set_categories, bulk_delete_images
+
+    app = create_app(start_services=False)
+    init_database(app, import_volume=False)
+    with app.app_context():
+        print(f"{'operation':<22}{'selection':>10}{'loop s':>10}{'stmts':>8}{'bulk s':>10}{'stmts':>8}{'speedup':>9}")
+        for size in sizes:
+            for name, loop, bulk, extra in (
+                ('set categories', loop_set_categories, bulk_set_categories, (CATEGORIES[1:],)),
+                ('delete', loop_delete, bulk_delete_images, ()),
+            ):
+                loop_ids = seed_catalog(size)
+                bulk_ids = seed_catalog(size)
+                db.session.expunge_all()
+                loop_seconds, loop_statements = measure(db.engine, loop, loop_ids, *extra)
+                db.session.expunge_all()
+                bulk_seconds, bulk_statements = measure(db.engine, bulk, bulk_ids, *extra)
+                print(f"{name:<22}{size:>10}{loop_seconds:>10.2f}{loop_statements:>8}"
+                      f"{bulk_seconds:>10.2f}{bulk_statements:>8}{loop_seconds / max(bulk_seconds, 1e-6):>8.1f}x")
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark bulk category updates and deletes')
+    parser.add_argument('--sizes', default='1000,10000', help='comma separated selection sizes (default: 1000,10000)')
+    parser.add_argument('--dir', default=None, help='scratch volume directory (default: a new temp dir)')
+    args = parser.parse_args()
+
+    scratch = args.dir or tempfile.mkdtemp(prefix='mindseye-bulk-')
+    os.environ['RAILWAY_VOLUME_MOUNT_PATH'] = scratch
+    print(f"📁 Scratch volume: {scratch}")
+    main([int(size) for size in args.sizes.split(',')])
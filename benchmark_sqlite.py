@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Benchmark public read throughput while an admin is writing
+Builds a scratch copy of the schema with a synthetic catalog, then runs
+reader processes (featured lookup, portfolio page, category counts) against a
+writer process doing admin-style update transactions - once with SQLite's
+defaults (rollback journal, synchronous=FULL) and once with the engine
+profile from src/db_profile.py (WAL, pragmas, sized pool)
+
+Usage: python benchmark_sqlite.py [--images N] [--readers N] [--seconds S] [--write-hold-ms MS] [--dir PATH]
+"""
+import os
+import sys
+import time
+import uuid
+import random
+import argparse
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+def build_catalog(url, image_count):
+    """Scratch database with the app schema and image_count images in 6 categories"""
+    from sqlalchemy import create_engine
+    from src.models import db, Image, Category, ImageCategory
+
+    engine = create_engine(url)
+    db.metadata.create_all(engine)
+    categories = [{'id': str(uuid.uuid4()), 'name': f"cat{i}", 'display_name': f"Category {i}",
+                   'display_order': i, 'is_active': True} for i in range(6)]
+    images, links = [], []
+    start = datetime(2020, 1, 1)
+    for i in range(image_count):
+        image_id = str(uuid.uuid4())
+        images.append({'id': image_id, 'filename': f"img-{i}.jpg", 'title': f"Image {i}",
+                       'description': 'Benchmark image ' * 8, 'upload_date': start + timedelta(minutes=i),
+                       'file_size': 4_000_000, 'width': 6000, 'height': 4000, 'is_featured': i == 0,
+                       'is_background': i == 1, 'is_slideshow_background': i % 200 == 0, 'display_order': i})
+        for category in random.sample(categories, 2):
+            links.append({'id': str(uuid.uuid4()), 'image_id': image_id, 'category_id': category['id']})
+    with engine.begin() as connection:
+        connection.execute(Category.__table__.insert(), categories)
+        connection.execute(Image.__table__.insert(), images)
+        connection.execute(ImageCategory.__table__.insert(), links)
+    engine.dispose()
+
+def _profile_engine(url, tuned, pool_size=2):
+    from sqlalchemy import create_engine
+    from src.db_profile import engine_options, install_sqlite_profile
+
+    if tuned:
+        engine = create_engine(url, **engine_options(pool_size=pool_size))
+        install_sqlite_profile(engine)
+    else:
+        engine = create_engine(url, connect_args={'check_same_thread': False})
+    return engine
+
+def reader_worker(url, tuned, deadline):
+    """Public page queries in a loop until the deadline - returns (latencies, errors)"""
+    from sqlalchemy import select, func
+    from src.models import Image, ImageCategory
+
+    engine = _profile_engine(url, tuned)
+    latencies, errors = [], []
+    while time.time() < deadline:
+        started = time.perf_counter()
+        try:
+            with engine.connect() as connection:
+                connection.execute(select(Image.__table__).where(Image.is_featured == True).limit(1)).first()
+                connection.execute(select(Image.__table__).order_by(Image.display_order, Image.upload_date)
+                                   .limit(50)).all()
+                connection.execute(select(ImageCategory.category_id, func.count())
+                                   .group_by(ImageCategory.category_id)).all()
+            latencies.append(time.perf_counter() - started)
+        except Exception as e:
+            errors.append(str(e))
+    engine.dispose()
+    return latencies, errors
+
+def writer_worker(url, tuned, deadline, write_hold_ms):
+    """Admin-style update transactions in a loop until the deadline - returns (writes, errors)"""
+    from sqlalchemy import select, update, func
+    from src.models import Image
+
+    engine = _profile_engine(url, tuned)
+    writes, errors = 0, []
+    while time.time() < deadline:
+        try:
+            with engine.begin() as connection:
+                ids = connection.execute(select(Image.id).order_by(func.random()).limit(20)).scalars().all()
+                connection.execute(update(Image.__table__).where(Image.id.in_(ids))
+                                   .values(title=f"Edited {uuid.uuid4().hex[:6]}"))
+                time.sleep(write_hold_ms / 1000)  # Work done inside the transaction
+            writes += 1
+        except Exception as e:
+            errors.append(f"writer: {e}")
+        time.sleep(0.01)
+    engine.dispose()
+    return writes, errors
+
+def run_profile(url, tuned, readers, seconds, write_hold_ms):
+    """Readers and the writer run in separate processes so the GIL doesn't serialize them"""
+    from src.db_profile import describe_connection
+
+    engine = _profile_engine(url, tuned)
+    with engine.begin() as connection:
+        if not tuned:
+            connection.exec_driver_sql("PRAGMA journal_mode=DELETE")  # WAL persists in the file
+        settings = describe_connection(connection)
+    engine.dispose()
+
+    deadline = time.time() + seconds
+    with ProcessPoolExecutor(max_workers=readers + 1) as pool:
+        writer = pool.submit(writer_worker, url, tuned, deadline, write_hold_ms)
+        reader_futures = [pool.submit(reader_worker, url, tuned, deadline) for _ in range(readers)]
+        latencies, errors = [], []
+        for future in reader_futures:
+            worker_latencies, worker_errors = future.result()
+            latencies.extend(worker_latencies)
+            errors.extend(worker_errors)
+        writes, writer_errors = writer.result()
+        errors.extend(writer_errors)
+
+    latencies.sort()
+    def percentile(p):
+        return latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 1000 if latencies else 0
+    return {
+        'settings': settings,
+        'reads_per_second': len(latencies) / seconds,
+        'p50_ms': percentile(0.50),
+        'p95_ms': percentile(0.95),
+        'p99_ms': percentile(0.99),
+        'max_ms': latencies[-1] * 1000 if latencies else 0,
+        'writes': writes,
+        'errors': errors
+    }
+
+def main(image_count, readers, seconds, write_hold_ms, directory=None):
+    with tempfile.TemporaryDirectory(dir=directory) as directory:
+        url = f"sqlite:///{os.path.join(directory, 'bench.db')}"
+        print(f"🔄 Building scratch catalog with {image_count} images...")
+        build_catalog(url, image_count)
+
+        results = {}
+        for label, tuned in (('default', False), ('tuned', True)):
+            print(f"🔄 Running '{label}' profile: {readers} readers + 1 writer for {seconds}s...")
+            results[label] = run_profile(url, tuned, readers, seconds, write_hold_ms)
+
+    print(f"\n📊 Read throughput under concurrent admin writes ({readers} readers, {write_hold_ms} ms write transactions)")
+    for label, result in results.items():
+        settings = result['settings']
+        print(f"   {label:8s} journal={settings['journal_mode']:<6} sync={settings['synchronous']}  "
+              f"{result['reads_per_second']:8.1f} reads/s  p50 {result['p50_ms']:6.1f} ms  "
+              f"p95 {result['p95_ms']:6.1f} ms  p99 {result['p99_ms']:6.1f} ms  max {result['max_ms']:7.1f} ms  "
+              f"writes {result['writes']:4d}  errors {len(result['errors'])}")
+        for error in sorted(set(result['errors']))[:3]:
+            print(f"      ❌ {error[:120]}")
+    speedup = results['tuned']['reads_per_second'] / max(results['default']['reads_per_second'], 0.001)
+    print(f"\n✅ Tuned profile: {speedup:.1f}x read throughput")
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark SQLite read throughput under concurrent writes')
+    parser.add_argument('--images', type=int, default=5000, help='synthetic catalog size (default: 5000)')
+    parser.add_argument('--readers', type=int, default=4, help='concurrent reader processes (default: 4)')
+    parser.add_argument('--seconds', type=float, default=10, help='duration of each run (default: 10)')
+    parser.add_argument('--write-hold-ms', type=int, default=50, help='time each write transaction stays open (default: 50)')
+    parser.add_argument('--dir', default=None, help='where to create the scratch database (e.g. the volume, to include its fsync cost)')
+    args = parser.parse_args()
+    main(args.images, args.readers, args.seconds, args.write_hold_ms, args.dir)
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Startup-time benchmark and side-effect guard for worker boot
+Imports src.main in fresh interpreters pointed at an empty scratch volume and
+reports the median import time and create_app() time. Fails (exit 1) if the
+median exceeds --max-ms or if importing touched the volume (created the
+database or any file) or started background threads
+
+Usage: python benchmark_startup.py [--runs N] [--max-ms MS]
+"""
+import os
+import sys
+import json
+import argparse
+import tempfile
+import subprocess
+import statistics
+
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+
+PROBE = r'''
+import json, os, sys, time, threading
+started = time.perf_counter()
+import src.main
+imported = time.perf_counter()
+from src.app_factory import create_app
+create_app(start_services=False)
+factory = time.perf_counter()
+print(json.dumps({
+    'import_ms': (imported - started) * 1000,
+    'create_app_ms': (factory - imported) * 1000,
+    'threads': threading.active_count(),
+    'volume_files': sorted(os.listdir(os.environ['RAILWAY_VOLUME_MOUNT_PATH']))
+}))
+'''
+
+def run_probe(volume):
+    env = dict(os.environ, RAILWAY_VOLUME_MOUNT_PATH=volume, PYTHONDONTWRITEBYTECODE='1')
+    result = subprocess.run([sys.executable, '-c', PROBE], cwd=PROJECT_ROOT, env=env,
+                            capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+def main(runs, max_ms):
+    samples = []
+    problems = set()
+    for _ in range(runs):
+        with tempfile.TemporaryDirectory() as volume:
+            sample = run_probe(volume)
+        samples.append(sample)
+        if sample['volume_files']:
+            problems.add(f"import touched the volume: {', '.join(sample['volume_files'])}")
+        if sample['threads'] > 1:
+            problems.add(f"import started {sample['threads'] - 1} background thread(s)")
+
+    import_ms = statistics.median(sample['import_ms'] for sample in samples)
+    factory_ms = statistics.median(sample['create_app_ms'] for sample in samples)
+    print(f"📊 import src.main: median {import_ms:.0f} ms (min {min(s['import_ms'] for s in samples):.0f}, "
+          f"max {max(s['import_ms'] for s in samples):.0f}) over {runs} runs")
+    print(f"📊 create_app():    median {factory_ms:.1f} ms")
+
+    for problem in sorted(problems):
+        print(f"❌ {problem}")
+    if import_ms > max_ms:
+        print(f"❌ Startup regression: {import_ms:.0f} ms > {max_ms} ms budget")
+        problems.add('slow')
+    if problems:
+        sys.exit(1)
+    print(f"✅ Startup within {max_ms} ms budget with no import-time side effects")
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark application startup')
+    parser.add_argument('--runs', type=int, default=5, help='fresh interpreters to time (default: 5)')
+    parser.add_argument('--max-ms', type=int, default=2000, help='import time budget in ms (default: 2000)')
+    args = parser.parse_args()
+    main(args.runs, args.max_ms)
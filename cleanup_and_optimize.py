@@ -11,11 +11,11 @@ import sys
 import os
 import re
 
-# Add the src directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from main import app
-from models import db, Image, Category, ImageCategory
+from src.main import app
+from src.models import db, Image, Category, ImageCategory
+from src.migrations import run_migrations, get_schema_version
 
 def cleanup_and_optimize():
     with app.app_context():
@@ -49,37 +49,11 @@ def cleanup_and_optimize():
         db.session.commit()
         print(f'🎉 Successfully cleaned up {updated_count} images!')
         
-        # Add database indexes for better performance (if they don't exist)
+        # Indexes are created by the schema migrations - make sure they're applied
         try:
             print('🔧 Optimizing database indexes...')
-            
-            # Check if indexes exist and create them if needed
-            inspector = db.inspect(db.engine)
-            existing_indexes = inspector.get_indexes('image')
-            index_names = [idx['name'] for idx in existing_indexes]
-            
-            if 'idx_image_title' not in index_names:
-                db.engine.execute('CREATE INDEX idx_image_title ON image(title)')
-                print('✅ Created title index')
-            
-            if 'idx_image_upload_date' not in index_names:
-                db.engine.execute('CREATE INDEX idx_image_upload_date ON image(upload_date)')
-                print('✅ Created upload_date index')
-            
-            # Check image_category table indexes
-            existing_ic_indexes = inspector.get_indexes('image_category')
-            ic_index_names = [idx['name'] for idx in existing_ic_indexes]
-            
-            if 'idx_image_category_image_id' not in ic_index_names:
-                db.engine.execute('CREATE INDEX idx_image_category_image_id ON image_category(image_id)')
-                print('✅ Created image_category image_id index')
-                
-            if 'idx_image_category_category_id' not in ic_index_names:
-                db.engine.execute('CREATE INDEX idx_image_category_category_id ON image_category(category_id)')
-                print('✅ Created image_category category_id index')
-            
-            print('🚀 Database optimization complete!')
-            
+            run_migrations()
+            print(f'🚀 Database optimization complete! (schema version {get_schema_version()})')
         except Exception as e:
             print(f'ℹ️  Index optimization note: {e}')
         
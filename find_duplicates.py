@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Find and merge duplicate images on the volume
+- Hashes originals that don't have a content_hash yet (SHA-256)
+- Groups images with identical content; the oldest upload is kept and
+  inherits the duplicates' categories and featured/background/slideshow flags
+- Also finds stray files on the volume that are byte-identical to a catalog image
+- Dry run by default - pass --apply to delete duplicate rows and files
+
+Usage: python find_duplicates.py [--apply] [--workers N]
+"""
+import os
+import sys
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp', '.tif', '.tiff'}
+
+def format_bytes(size):
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if abs(size) < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} TB"
+
+def find_duplicates(apply=False, workers=8):
+    """Report (and with apply=True, merge) duplicate images"""
+    from src.main import app
+    from src.models import db, Image
+    from src.config import PHOTOGRAPHY_ASSETS_DIR
+    from src.dedup import file_sha256, merge_duplicate_images, remove_duplicate_file
+    from src.response_cache import bump_catalog_version
+
+    def hash_file(filename):
+        path = os.path.join(PHOTOGRAPHY_ASSETS_DIR, filename)
+        try:
+            return filename, file_sha256(path)
+        except OSError:
+            return filename, None
+
+    with app.app_context():
+        mode = "APPLY" if apply else "DRY RUN"
+        print(f"🔍 Looking for duplicate images ({mode})...")
+
+        # 1. Hash catalog images that predate content hashing
+        unhashed = db.session.query(Image.id, Image.filename).filter(Image.content_hash.is_(None)).all()
+        if unhashed:
+            print(f"🔄 Hashing {len(unhashed)} images without a content hash...")
+            ids = {filename: image_id for image_id, filename in unhashed}
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                updates = [{'id': ids[filename], 'content_hash': digest}
+                           for filename, digest in pool.map(hash_file, ids) if digest]
+            if updates:
+                db.session.bulk_update_mappings(Image, updates)
+                db.session.commit()
+
+        # 2. Catalog rows sharing the same content
+        duplicate_hashes = [row[0] for row in db.session.query(Image.content_hash)
+                            .filter(Image.content_hash.isnot(None))
+                            .group_by(Image.content_hash)
+                            .having(db.func.count(Image.id) > 1).all()]
+
+        duplicate_rows = 0
+        reclaimable = 0
+        for content_hash in duplicate_hashes:
+            group = Image.query.filter_by(content_hash=content_hash).order_by(Image.upload_date, Image.id).all()
+            keeper, duplicates = group[0], group[1:]
+            duplicate_rows += len(duplicates)
+            print(f"📋 {keeper.filename} ({keeper.title}) has {len(duplicates)} duplicate(s):")
+            for duplicate in duplicates:
+                print(f"     - {duplicate.filename} ({duplicate.title})")
+                path = os.path.join(PHOTOGRAPHY_ASSETS_DIR, duplicate.filename)
+                if os.path.exists(path):
+                    reclaimable += os.path.getsize(path)
+
+            if apply:
+                removed = merge_duplicate_images(keeper, duplicates)
+                db.session.commit()
+                for filename in removed:
+                    remove_duplicate_file(filename, PHOTOGRAPHY_ASSETS_DIR)
+
+        # 3. Stray files on the volume identical to a catalog image
+        known = {filename: (content_hash, size) for filename, content_hash, size in
+                 db.session.query(Image.filename, Image.content_hash, Image.file_size).all()}
+        catalog_hashes = {content_hash for content_hash, _ in known.values() if content_hash}
+        catalog_sizes = {size for _, size in known.values() if size}
+
+        stray_candidates = []
+        with os.scandir(PHOTOGRAPHY_ASSETS_DIR) as it:
+            for entry in it:
+                if not entry.is_file() or entry.name in known:
+                    continue
+                if os.path.splitext(entry.name)[1].lower() not in IMAGE_EXTENSIONS:
+                    continue
+                # Only same-size files can be identical - skip hashing the rest
+                if entry.stat().st_size in catalog_sizes:
+                    stray_candidates.append(entry.name)
+
+        stray_duplicates = []
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for filename, digest in pool.map(hash_file, stray_candidates):
+                if digest in catalog_hashes:
+                    stray_duplicates.append(filename)
+                    reclaimable += os.path.getsize(os.path.join(PHOTOGRAPHY_ASSETS_DIR, filename))
+                    print(f"📋 Stray copy on volume: {filename}")
+                    if apply:
+                        remove_duplicate_file(filename, PHOTOGRAPHY_ASSETS_DIR)
+
+        if apply and (duplicate_hashes or stray_duplicates):
+            bump_catalog_version()
+
+        print(f"\n{'✅' if apply else '📊'} Duplicate groups: {len(duplicate_hashes)}  "
+              f"duplicate rows: {duplicate_rows}  stray copies: {len(stray_duplicates)}")
+        action = "Reclaimed" if apply else "Reclaimable"
+        print(f"   {action}: {format_bytes(reclaimable)}")
+        if not apply and (duplicate_rows or stray_duplicates):
+            print("   Run again with --apply to merge duplicates and delete the extra files")
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Find and merge duplicate images')
+    parser.add_argument('--apply', action='store_true', help='merge duplicate rows and delete duplicate files')
+    parser.add_argument('--workers', type=int, default=8, help='hashing threads (default: 8)')
+    args = parser.parse_args()
+    find_duplicates(apply=args.apply, workers=args.workers)
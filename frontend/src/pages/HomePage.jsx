@@ -125,6 +125,8 @@ const HomePage = () => {
           <img
             key={image.id || index}
             src={image.url}
+            srcSet={image.srcset || undefined}
+            sizes="100vw"
             alt={image.title || 'Slideshow Image'}
             className="absolute inset-0 w-full h-full object-cover transition-opacity duration-1000"
             style={{
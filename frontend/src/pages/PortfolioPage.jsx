@@ -1,57 +1,102 @@
-import React, { useState, useEffect } from 'react'
+import React, { useState, useEffect, useRef } from 'react'
 import { motion, AnimatePresence } from 'framer-motion'
 import { Grid, List, Search } from 'lucide-react'
 import { Button } from '@/components/ui/button'
 
+const API_BASE = 'https://minds-eye-master-production.up.railway.app'
+const PAGE_SIZE = 24
+const DEFAULT_CATEGORIES = ['All Work', 'Landscapes', 'Wildlife', 'Portraits', 'Events']
+
 const PortfolioPage = () => {
   const [images, setImages] = useState([])
-  const [categories, setCategories] = useState([])
+  const [categories, setCategories] = useState(DEFAULT_CATEGORIES)
   const [selectedCategory, setSelectedCategory] = useState('All Work')
   const [loading, setLoading] = useState(true)
+  const [loadingMore, setLoadingMore] = useState(false)
   const [error, setError] = useState(null)
   const [viewMode, setViewMode] = useState('grid')
   const [searchTerm, setSearchTerm] = useState('')
+  const [debouncedSearch, setDebouncedSearch] = useState('')
+  const [total, setTotal] = useState(0)
+  const [nextCursor, setNextCursor] = useState(null)
+  // Bumped whenever the filters change - pages for older filters are dropped
+  const filterGeneration = useRef(0)
+
+  // Category buttons (defaults until the API answers)
+  useEffect(() => {
+    fetch(`${API_BASE}/api/categories`)
+      .then(response => response.ok ? response.json() : [])
+      .then(data => {
+        const names = data.map(category => category.name)
+        setCategories([...new Set([...DEFAULT_CATEGORIES, ...names])])
+      })
+      .catch(err => console.error('Error loading categories:', err))
+  }, [])
+
+  // Wait for typing to pause before searching on the server
+  useEffect(() => {
+    const timer = setTimeout(() => setDebouncedSearch(searchTerm.trim()), 300)
+    return () => clearTimeout(timer)
+  }, [searchTerm])
+
+  // Fetch one page of the portfolio - filtering happens on the server
+  const fetchPage = async (cursor) => {
+    const params = new URLSearchParams({ limit: PAGE_SIZE })
+    if (selectedCategory !== 'All Work') params.set('category', selectedCategory)
+    if (debouncedSearch) params.set('q', debouncedSearch)
+    if (cursor) params.set('cursor', cursor)
+
+    const response = await fetch(`${API_BASE}/api/portfolio/page?${params}`)
+    if (!response.ok) {
+      throw new Error(`HTTP error! status: ${response.status}`)
+    }
+    return response.json()
+  }
 
-  // Fetch portfolio data
+  // First page whenever the filters change
   useEffect(() => {
-    const fetchPortfolio = async () => {
+    let cancelled = false
+    filterGeneration.current += 1
+    setLoadingMore(false)
+    const loadFirstPage = async () => {
       try {
         setLoading(true)
-        const response = await fetch('https://minds-eye-master-production.up.railway.app/api/portfolio-new')
-        
-        if (!response.ok) {
-          throw new Error(`HTTP error! status: ${response.status}`)
-        }
-        
-        const data = await response.json()
-        console.log('Portfolio data loaded:', data)
-        
-        setImages(data)
-        
-        // Extract unique categories
-        const allCategories = data.flatMap(img => img.categories || [])
-        const uniqueCategories = ['All Work', 'Landscapes', 'Wildlife', 'Portraits', 'Events', ...new Set(allCategories)]
-        setCategories([...new Set(uniqueCategories)])
-        
+        setError(null)
+        const page = await fetchPage(null)
+        if (cancelled) return
+        setImages(page.items)
+        setTotal(page.total)
+        setNextCursor(page.next_cursor)
       } catch (err) {
         console.error('Error loading portfolio:', err)
-        setError(err.message)
+        if (!cancelled) setError(err.message)
       } finally {
-        setLoading(false)
+        if (!cancelled) setLoading(false)
       }
     }
 
-    fetchPortfolio()
-  }, [])
+    loadFirstPage()
+    return () => { cancelled = true }
+  }, [selectedCategory, debouncedSearch])
 
-  // Filter images by category and search term
-  const filteredImages = images.filter(img => {
-    const matchesCategory = selectedCategory === 'All Work' || img.categories?.includes(selectedCategory)
-    const matchesSearch = !searchTerm || 
-      img.title?.toLowerCase().includes(searchTerm.toLowerCase()) ||
-      img.description?.toLowerCase().includes(searchTerm.toLowerCase())
-    return matchesCategory && matchesSearch
-  })
+  const loadMore = async () => {
+    if (!nextCursor || loadingMore) return
+    const generation = filterGeneration.current
+    const isStale = () => generation !== filterGeneration.current
+    try {
+      setLoadingMore(true)
+      const page = await fetchPage(nextCursor)
+      if (isStale()) return
+      setImages(current => [...current, ...page.items])
+      setTotal(page.total)
+      setNextCursor(page.next_cursor)
+    } catch (err) {
+      console.error('Error loading more images:', err)
+      if (!isStale()) setError(err.message)
+    } finally {
+      if (!isStale()) setLoadingMore(false)
+    }
+  }
 
   return (
     <div className="min-h-screen bg-slate-50 pt-20">
@@ -71,7 +116,7 @@ const PortfolioPage = () => {
             transition={{ delay: 0.2 }}
             className="text-xl text-slate-300"
           >
-            Explore my collection of {images.length} professional photographs
+            Explore my collection of {total} professional photographs
           </motion.p>
         </div>
       </div>
@@ -152,7 +197,7 @@ const PortfolioPage = () => {
               Try Again
             </Button>
           </div>
-        ) : filteredImages.length === 0 ? (
+        ) : images.length === 0 ? (
           <div className="text-center py-20">
             <p className="text-slate-500 text-lg">
               {searchTerm ? `No images found for "${searchTerm}"` : `No images found in "${selectedCategory}"`}
@@ -168,19 +213,21 @@ const PortfolioPage = () => {
             }`}
           >
             <AnimatePresence>
-              {filteredImages.map((image, index) => (
+              {images.map((image, index) => (
                 <motion.div
                   key={image.id}
                   layout
                   initial={{ opacity: 0, scale: 0.9 }}
                   animate={{ opacity: 1, scale: 1 }}
                   exit={{ opacity: 0, scale: 0.9 }}
-                  transition={{ duration: 0.3, delay: index * 0.05 }}
+                  transition={{ duration: 0.3, delay: (index % PAGE_SIZE) * 0.05 }}
                   className="bg-white rounded-lg shadow-md overflow-hidden hover:shadow-xl transition-all duration-300 group"
                 >
                   <div className="aspect-square bg-slate-200 relative overflow-hidden">
                     <img
                       src={image.url || `https://minds-eye-master-production.up.railway.app/static/assets/${image.filename}`}
+                      srcSet={image.srcset || undefined}
+                      sizes="(min-width: 1280px) 25vw, (min-width: 1024px) 33vw, (min-width: 640px) 50vw, 100vw"
                       alt={image.title}
                       className="w-full h-full object-cover group-hover:scale-110 transition-transform duration-500"
                       loading="lazy"
@@ -209,6 +256,19 @@ const PortfolioPage = () => {
             </AnimatePresence>
           </motion.div>
         )}
+
+        {/* Next page */}
+        {!loading && !error && nextCursor && (
+          <div className="text-center mt-10">
+            <Button
+              onClick={loadMore}
+              disabled={loadingMore}
+              className="bg-orange-500 hover:bg-orange-600"
+            >
+              {loadingMore ? 'Loading...' : `Load More (${images.length} of ${total})`}
+            </Button>
+          </div>
+        )}
       </div>
     </div>
   )
@@ -148,6 +148,8 @@ const SQLPortfolio = () => {
                   <div className="aspect-[3/2] relative overflow-hidden">
                     <img
                       src={image.url}
+                      srcSet={image.srcset || undefined}
+                      sizes="(min-width: 1280px) 25vw, (min-width: 1024px) 33vw, (min-width: 768px) 50vw, 100vw"
                       alt={cleanTitle(image.title)}
                       className="w-full h-full object-cover group-hover:scale-110 transition-transform duration-300"
                       onError={(e) => {
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+One-time setup and maintenance commands (kept out of app startup)
+- init:    create tables, default categories/config, apply schema migrations
+           and import volume images into an empty catalog - run once per deploy
+- migrate: apply pending schema migrations only
+- import-images: catalog image files on the volume that have no database row
+- sync:    reconcile the catalog with new/changed/deleted files on the volume
+- gc:      remove files on the volume that no image/About row refers to
+- reindex-search: rebuild the full-text search index from the images table
+- status:  asset paths, schema version and catalog counts
+
+Usage: python manage.py init [--skip-import] | migrate | status
+       python manage.py import-images [--workers N] [--batch-size N]
+       python manage.py sync [--dry-run] [--allow-mass-delete]
+       python manage.py gc [--dry-run] [--grace-hours N] [--untracked]
+       python manage.py reindex-search
+"""
+import os
+import sys
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+def cmd_init(args):
+    from src.app_factory import create_app, init_database
+    app = create_app(start_services=False)
+    init_database(app, import_volume=not args.skip_import)
+
+def cmd_migrate(args):
+    from src.app_factory import create_app
+    from src.migrations import run_migrations, get_schema_version
+    app = create_app(start_services=False)
+    with app.app_context():
+        applied = run_migrations()
+        if not applied:
+            print(f"✅ Schema already at version {get_schema_version()} - nothing to apply")
+
+def cmd_import_images(args):
+    from src.app_factory import create_app
+    from src.volume_import import import_volume_images
+    app = create_app(start_services=False)
+    with app.app_context():
+        stats = import_volume_images(workers=args.workers, batch_size=args.batch_size)
+    if stats['imported']:
+        print(f"✅ Imported {stats['imported']} images in {stats['seconds']}s "
+              f"({stats['imported'] / max(stats['seconds'], 0.001):.0f} images/sec)")
+
+def cmd_sync(args):
+    from src.app_factory import create_app
+    from src.catalog_sync import sync_catalog
+    app = create_app(start_services=False)
+    with app.app_context():
+        result = sync_catalog(dry_run=args.dry_run, allow_mass_delete=args.allow_mass_delete)
+    if result is None:
+        return
+    if args.dry_run:
+        for key in ('new', 'changed', 'deleted', 'adopted'):
+            for filename in result['plan'][key]:
+                print(f"   {key:8s} {filename}")
+    if not any(result['plan'].values()):
+        print("✅ Catalog already in sync with the volume")
+    elif not args.dry_run:
+        print("ℹ️  Derivatives and hashes for new/changed files are generated by the app's job workers")
+
+def cmd_gc(args):
+    from src.app_factory import create_app
+    from src.asset_gc import collect_garbage
+    app = create_app(start_services=False)
+    with app.app_context():
+        result = collect_garbage(dry_run=args.dry_run, grace_seconds=int(args.grace_hours * 3600),
+                                 reclaim_untracked=args.untracked)
+    for area, counts in result['areas'].items():
+        if counts['files']:
+            print(f"   {area:12s} {counts['files']} file(s), {counts['bytes'] / (1024 * 1024):.1f} MB")
+    for filename in result['missing_originals'][:20]:
+        print(f"⚠️  Row without file: {filename}")
+    if result['untracked_originals']:
+        print(f"ℹ️  {result['untracked_originals']} untracked original(s) kept - import them "
+              f"(python manage.py sync) or delete them with --untracked")
+
+def cmd_reindex_search(args):
+    from src.app_factory import create_app
+    from src.models import db
+    from src.search_index import rebuild_search_index
+    app = create_app(start_services=False)
+    with app.app_context():
+        indexed = rebuild_search_index()
+        db.session.commit()
+    print(f"✅ Search index rebuilt ({indexed} images)")
+
+def cmd_status(args):
+    from src.config import PHOTOGRAPHY_ASSETS_DIR, RAILWAY_VOLUME_PATH
+    from src.app_factory import create_app
+    from src.models import db, Image, Category
+    from src.migrations import get_schema_version, MIGRATIONS
+
+    print(f"🔍 PHOTOGRAPHY_ASSETS_DIR set to: {PHOTOGRAPHY_ASSETS_DIR}")
+    print(f"🔍 RAILWAY_VOLUME_MOUNT_PATH: {RAILWAY_VOLUME_PATH}")
+    print(f"🔍 Directory exists: {os.path.exists(PHOTOGRAPHY_ASSETS_DIR)}")
+    if not os.path.exists(os.path.join(PHOTOGRAPHY_ASSETS_DIR, 'mindseye.db')):
+        print("⚠️  No database yet - run: python manage.py init")
+        return
+
+    app = create_app(start_services=False)
+    with app.app_context():
+        version = get_schema_version()
+        latest = MIGRATIONS[-1][0]
+        print(f"📊 Schema version: {version}/{latest}{'' if version == latest else ' - run: python manage.py migrate'}")
+        print(f"📊 Images: {Image.query.count()}  Categories: {Category.query.count()}")
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Mind's Eye setup and maintenance")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    init_parser = subparsers.add_parser('init', help='create/upgrade the database (once per deploy)')
+    init_parser.add_argument('--skip-import', action='store_true', help="don't import volume images into an empty catalog")
+    init_parser.set_defaults(func=cmd_init)
+
+    migrate_parser = subparsers.add_parser('migrate', help='apply pending schema migrations')
+    migrate_parser.set_defaults(func=cmd_migrate)
+
+    import_parser = subparsers.add_parser('import-images', help='catalog image files on the volume without a database row')
+    import_parser.add_argument('--workers', type=int, default=8, help='header reader threads (default: 8)')
+    import_parser.add_argument('--batch-size', type=int, default=500, help='rows per committed batch (default: 500)')
+    import_parser.set_defaults(func=cmd_import_images)
+
+    sync_parser = subparsers.add_parser('sync', help='reconcile the catalog with files on the volume')
+    sync_parser.add_argument('--dry-run', action='store_true', help='only report what would change')
+    sync_parser.add_argument('--allow-mass-delete', action='store_true', help='delete rows even if many originals are missing')
+    sync_parser.set_defaults(func=cmd_sync)
+
+    gc_parser = subparsers.add_parser('gc', help='remove orphaned originals, derivatives and About images')
+    gc_parser.add_argument('--dry-run', action='store_true', help='only report what would be removed')
+    gc_parser.add_argument('--grace-hours', type=float, default=1, help='keep unreferenced files younger than this (default: 1)')
+    gc_parser.add_argument('--untracked', action='store_true', help='also delete originals that were never cataloged')
+    gc_parser.set_defaults(func=cmd_gc)
+
+    reindex_parser = subparsers.add_parser('reindex-search', help='rebuild the full-text search index')
+    reindex_parser.set_defaults(func=cmd_reindex_search)
+
+    status_parser = subparsers.add_parser('status', help='show paths, schema version and counts')
+    status_parser.set_defaults(func=cmd_status)
+
+    args = parser.parse_args()
+    args.func(args)
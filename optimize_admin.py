@@ -7,11 +7,11 @@ import sys
 import os
 import re
 
-# Add the src directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from main import app
-from models import db, Image
+from src.main import app
+from src.models import db, Image
+from src.migrations import run_migrations
 
 def optimize_and_cleanup():
     with app.app_context():
@@ -44,12 +44,9 @@ def optimize_and_cleanup():
         print(f'🎉 Successfully cleaned up {updated_count} images!')
         print(f'📊 Total images in database: {len(images)}')
         
-        # Add database indexes for better performance
+        # Add database indexes for better performance (applied once, see src/migrations.py)
         try:
-            # These will be created if they don't exist
-            db.engine.execute('CREATE INDEX IF NOT EXISTS idx_image_title ON image(title)')
-            db.engine.execute('CREATE INDEX IF NOT EXISTS idx_image_upload_date ON image(upload_date)')
-            db.engine.execute('CREATE INDEX IF NOT EXISTS idx_image_categories ON image_category(image_id)')
+            run_migrations()
             print('✅ Database indexes optimized for better performance')
         except Exception as e:
             print(f'ℹ️  Index optimization: {e}')
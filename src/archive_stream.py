@@ -0,0 +1,128 @@
+"""
+Streaming ZIP Archives for Mind's Eye Photography
+Builds backup archives on the fly as a generator of byte chunks - files are
+read straight from the volume, nothing is staged in a temp directory, and
+memory use stays constant regardless of library size
+"""
+import os
+import time
+import zipfile
+
+READ_CHUNK_SIZE = 1024 * 1024
+
+# Already-compressed formats are stored as-is (deflating them wastes CPU for ~0% gain)
+STORED_EXTENSIONS = {
+    '.jpg', '.jpeg', '.png', '.gif', '.webp', '.heic', '.avif',
+    '.mp4', '.mov', '.zip', '.gz', '.tgz', '.bz2', '.xz', '.7z'
+}
+
+# SQLite journals and in-progress writes - never archived
+SKIPPED_SUFFIXES = ('-wal', '-shm', '-journal', '.part', '.tmp')
+
+class _ChunkBuffer:
+    """Write-only, unseekable file object that collects output between yields"""
+
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = b''.join(self._chunks)
+        self._chunks = []
+        return data
+
+def compression_for(name):
+    """ZIP_STORED for already-compressed media, ZIP_DEFLATED for everything else"""
+    if os.path.splitext(name)[1].lower() in STORED_EXTENSIONS:
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
+
+def is_archivable(name):
+    """False for SQLite journals and half-written files"""
+    return not name.endswith(SKIPPED_SUFFIXES)
+
+def file_entry(arcname, path):
+    """Archive entry read from a file on disk"""
+    return (arcname, path, None)
+
+def temp_file_entry(arcname, producer):
+    """
+    Archive entry whose file is produced only when the archive reaches it
+    producer() returns a temp file path; the file is deleted once streamed
+    """
+    return (arcname, producer, None)
+
+def bytes_entry(arcname, data):
+    """Archive entry from in-memory bytes/str (small generated files)"""
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    return (arcname, None, data)
+
+def directory_entries(directory, arc_prefix, skip_dirs=('__pycache__', 'node_modules', '.git')):
+    """Entries for every file below a directory (walked lazily)"""
+    for dirpath, dirnames, filenames in os.walk(directory):
+        dirnames[:] = sorted(name for name in dirnames if name not in skip_dirs)
+        for filename in sorted(filenames):
+            if not is_archivable(filename):
+                continue
+            path = os.path.join(dirpath, filename)
+            relative = os.path.relpath(path, directory).replace(os.sep, '/')
+            yield file_entry(f"{arc_prefix}/{relative}", path)
+
+def stream_zip(entries, stats=None):
+    """
+    Generate a ZIP archive chunk by chunk
+    entries: iterable of file_entry()/bytes_entry() tuples (may be a generator)
+    stats: optional dict that receives file/byte counts as the archive is written
+    """
+    buffer = _ChunkBuffer()
+    if stats is None:
+        stats = {}
+    stats.update({'files': 0, 'bytes': 0, 'skipped': []})
+
+    with zipfile.ZipFile(buffer, 'w', allowZip64=True) as archive:
+        for arcname, path, data in entries:
+            temporary = callable(path)
+            if temporary:
+                path = path()
+            if path is not None:
+                try:
+                    stat = os.stat(path)
+                    source = open(path, 'rb')
+                    if temporary:
+                        # Unlinked now, still readable through the open handle
+                        os.remove(path)
+                except OSError as e:
+                    # File vanished or is unreadable - keep going with the rest
+                    print(f"⚠️  Skipping {path} in archive: {e}")
+                    stats['skipped'].append(arcname)
+                    continue
+                info = zipfile.ZipInfo(arcname, date_time=time.localtime(stat.st_mtime)[:6])
+                info.compress_type = compression_for(arcname)
+                info.external_attr = 0o644 << 16
+                with source, archive.open(info, 'w', force_zip64=stat.st_size >= zipfile.ZIP64_LIMIT) as dest:
+                    for chunk in iter(lambda: source.read(READ_CHUNK_SIZE), b''):
+                        dest.write(chunk)
+                        stats['bytes'] += len(chunk)
+                        output = buffer.drain()
+                        if output:
+                            yield output
+            else:
+                info = zipfile.ZipInfo(arcname, date_time=time.localtime()[:6])
+                info.compress_type = compression_for(arcname)
+                info.external_attr = 0o644 << 16
+                archive.writestr(info, data)
+                stats['bytes'] += len(data)
+            stats['files'] += 1
+            output = buffer.drain()
+            if output:
+                yield output
+
+    # Central directory
+    yield buffer.drain()
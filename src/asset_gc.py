@@ -0,0 +1,192 @@
+"""
+Asset Deletion & Garbage Collection for Mind's Eye Photography
+Deleting an image or About image removes its row and enqueues a
+'files.delete' job in the same transaction - that job row is the durable
+mark that files still have to go. A worker unlinks them once the delete is
+committed, so a crash leaves either the row with its files, or a queued job
+that finishes the removal after restart - never a row without its file.
+collect_garbage() is the safety net: one pass comparing the Image/AboutImage
+filenames with the directory listings (derivatives and the resize cache
+included) reclaims whatever no row refers to
+"""
+import os
+import json
+import time
+import threading
+from src.models import db, Image, AboutImage, Job
+from src.config import PHOTOGRAPHY_ASSETS_DIR, DERIVATIVES_DIR, DERIVATIVE_WIDTHS, ASSET_GC_INTERVAL_HOURS
+from src.jobs import enqueue, job_handler
+from src.derivatives import derivative_filename, delete_derivatives
+from src.image_resizer import RESIZE_CACHE_DIR, resize_cache, variant_prefix, purge_variants
+from src.storage_stats import record_removed
+from src.volume_import import IMAGE_EXTENSIONS
+
+FILES_DELETE_JOB = 'files.delete'
+ABOUT_DIR = os.path.join(PHOTOGRAPHY_ASSETS_DIR, 'about')
+LOCK_FILE = os.path.join(PHOTOGRAPHY_ASSETS_DIR, 'cache', 'asset_gc.lock')
+
+# Unreferenced files younger than this are left alone - an upload may be
+# between writing its file and committing its row
+GC_GRACE_SECONDS = 60 * 60
+
+_gc_lock = threading.Lock()
+_thread = None
+_last_result = None
+
+def enqueue_file_removal(originals=(), about=()):
+    """
+    Queue removal of originals (+ derivatives) and About images in the
+    caller's session - commit it together with the row deletes, then notify_workers()
+    """
+    return enqueue(FILES_DELETE_JOB, {'originals': list(originals), 'about': list(about)})
+
+def pending_removals():
+    """Original filenames whose removal is queued or failed (their rows are already gone)"""
+    filenames = set()
+    for (payload,) in db.session.query(Job.payload).filter(
+        Job.job_type == FILES_DELETE_JOB, Job.status.in_(('pending', 'running', 'failed'))
+    ):
+        filenames.update(json.loads(payload or '{}').get('originals', []))
+    return filenames
+
+def _unlink(path):
+    """Remove a file, returning the bytes freed (0 if it was already gone)"""
+    try:
+        size = os.path.getsize(path)
+        os.remove(path)
+    except FileNotFoundError:
+        return 0
+    record_removed(path, size)
+    return size
+
+@job_handler(FILES_DELETE_JOB)
+def remove_deleted_files(payload):
+    """Unlink files of deleted rows (derivatives and resized variants too) - names reused by a newer upload are kept"""
+    originals = payload.get('originals', [])
+    about = payload.get('about', [])
+    in_use = {filename for (filename,) in db.session.query(Image.filename).filter(Image.filename.in_(originals))} if originals else set()
+    about_in_use = {filename for (filename,) in db.session.query(AboutImage.filename).filter(AboutImage.filename.in_(about))} if about else set()
+
+    removed = [filename for filename in originals if filename not in in_use]
+    for filename in removed:
+        _unlink(os.path.join(PHOTOGRAPHY_ASSETS_DIR, filename))
+        delete_derivatives(filename)
+    purge_variants(removed)
+    for filename in about:
+        if filename not in about_in_use:
+            _unlink(os.path.join(ABOUT_DIR, filename))
+
+def _scan(directory):
+    """(name, stat) of the regular, non-hidden files in a directory"""
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.name.startswith('.') or not entry.is_file(follow_symlinks=False):
+                    continue
+                try:
+                    yield entry.name, entry.stat()
+                except OSError:
+                    continue
+    except FileNotFoundError:
+        return
+
+def collect_garbage(dry_run=False, grace_seconds=GC_GRACE_SECONDS, reclaim_untracked=False):
+    """
+    Reclaim files no row refers to (call inside an app context):
+    - derivatives and resized variants whose original has no Image row
+    - About images without an AboutImage row
+    - originals of deleted rows (pending/failed removal jobs), and any other
+      untracked original only when reclaim_untracked - files copied onto the
+      volume wait there for the catalog sync or a manual import
+    Rows whose original is missing are reported, not changed
+    Returns stats incl. reclaimed_bytes per area
+    """
+    global _last_result
+    with _gc_lock:
+        started = time.time()
+        cutoff = started - grace_seconds
+        originals = {filename for (filename,) in db.session.query(Image.filename)}
+        about = {filename for (filename,) in db.session.query(AboutImage.filename)}
+        removed = pending_removals()
+        expected_derivatives = {derivative_filename(filename, width)
+                                for filename in originals for width in DERIVATIVE_WIDTHS.values()}
+        variant_prefixes = {variant_prefix(filename) for filename in originals}
+
+        candidates = []  # (area, path, size)
+        on_volume = set()
+        untracked = 0
+        for name, stat in _scan(PHOTOGRAPHY_ASSETS_DIR):
+            if os.path.splitext(name)[1].lower() not in IMAGE_EXTENSIONS:
+                continue
+            on_volume.add(name)
+            if name in originals:
+                continue
+            if name in removed or (reclaim_untracked and stat.st_mtime < cutoff):
+                candidates.append(('originals', os.path.join(PHOTOGRAPHY_ASSETS_DIR, name), stat.st_size))
+            else:
+                untracked += 1
+        for name, stat in _scan(DERIVATIVES_DIR):
+            if name not in expected_derivatives and stat.st_mtime < cutoff:
+                candidates.append(('derivatives', os.path.join(DERIVATIVES_DIR, name), stat.st_size))
+        for name, stat in _scan(ABOUT_DIR):
+            if name not in about and stat.st_mtime < cutoff:
+                candidates.append(('about', os.path.join(ABOUT_DIR, name), stat.st_size))
+        for name, stat in _scan(RESIZE_CACHE_DIR):
+            # Variants of live originals are left to the cache's own LRU eviction
+            if f"{name.partition('-')[0]}-" not in variant_prefixes and stat.st_mtime < cutoff:
+                candidates.append(('resized', os.path.join(RESIZE_CACHE_DIR, name), stat.st_size))
+
+        result = {
+            'dry_run': dry_run,
+            'reclaimed_files': 0,
+            'reclaimed_bytes': 0,
+            'areas': {area: {'files': 0, 'bytes': 0} for area in ('originals', 'derivatives', 'about', 'resized')},
+            'untracked_originals': untracked,
+            'missing_originals': sorted(originals - on_volume),
+        }
+        for area, path, size in candidates:
+            if not dry_run:
+                try:
+                    size = resize_cache.discard(os.path.basename(path)) if area == 'resized' else _unlink(path)
+                except OSError as e:
+                    print(f"⚠️  Could not remove {path}: {e}")
+                    continue
+            result['reclaimed_files'] += 1
+            result['reclaimed_bytes'] += size
+            result['areas'][area]['files'] += 1
+            result['areas'][area]['bytes'] += size
+
+        result['seconds'] = round(time.time() - started, 2)
+        _last_result = dict(result, finished_at=time.time())
+        verb = 'Would reclaim' if dry_run else 'Reclaimed'
+        print(f"🧹 Asset GC: {verb} {result['reclaimed_files']} file(s), "
+              f"{result['reclaimed_bytes'] / (1024 * 1024):.1f} MB in {result['seconds']}s"
+              f" ({untracked} untracked original(s), {len(result['missing_originals'])} row(s) missing their file)")
+        return result
+
+def _gc_loop(app):
+    from src.service_utils import lower_thread_priority
+    lower_thread_priority()
+    while True:
+        time.sleep(ASSET_GC_INTERVAL_HOURS * 60 * 60)
+        try:
+            with app.app_context():
+                collect_garbage()
+        except Exception as e:
+            print(f"❌ Asset GC failed: {e}")
+
+def start_asset_gc(app):
+    """Start the periodic collector (one process per volume; no-op when disabled)"""
+    global _thread
+    from src.service_utils import acquire_process_lock
+    with _gc_lock:
+        if _thread is not None or ASSET_GC_INTERVAL_HOURS <= 0:
+            return
+        if not acquire_process_lock(LOCK_FILE):
+            return
+        _thread = threading.Thread(target=_gc_loop, args=(app,), name='asset-gc', daemon=True)
+        _thread.start()
+        print(f"✅ Asset garbage collector started (every {ASSET_GC_INTERVAL_HOURS}h)")
+
+def get_gc_status():
+    return {'enabled': _thread is not None, 'interval_hours': ASSET_GC_INTERVAL_HOURS, 'last_result': _last_result}
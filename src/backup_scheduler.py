@@ -0,0 +1,85 @@
+"""
+Scheduled Backups for Mind's Eye Photography
+A background thread takes an incremental snapshot whenever the latest one is
+older than BACKUP_INTERVAL_HOURS, then prunes snapshots outside the
+daily/weekly retention policy. The thread runs at the lowest CPU priority
+(nice 19) and in the idle I/O class where the kernel allows it, so backups
+don't compete with serving the site
+"""
+import os
+import time
+import threading
+from datetime import datetime, timedelta
+from src.config import BACKUPS_DIR, BACKUP_INTERVAL_HOURS, BACKUP_KEEP_DAILY, BACKUP_KEEP_WEEKLY
+from src.snapshots import create_snapshot, latest_snapshot, prune_snapshots
+from src.service_utils import lower_thread_priority, acquire_process_lock
+
+CHECK_INTERVAL_SECONDS = 5 * 60
+LOCK_FILE = os.path.join(BACKUPS_DIR, '.scheduler.lock')
+
+_status = {'enabled': False, 'running': False, 'last_run': None, 'last_result': None,
+           'last_error': None, 'next_due': None}
+_start_lock = threading.Lock()
+_thread = None
+
+def next_backup_due(interval_hours=BACKUP_INTERVAL_HOURS):
+    """When the next scheduled snapshot is due (now if there are none)"""
+    latest = latest_snapshot()
+    if latest is None:
+        return datetime.utcnow()
+    return datetime.fromisoformat(latest['created']) + timedelta(hours=interval_hours)
+
+def run_scheduled_backup(force=False):
+    """Snapshot + prune if a backup is due (or force=True) - returns the manifest or None"""
+    due = next_backup_due()
+    if not force and datetime.utcnow() < due:
+        _status['next_due'] = due.isoformat()
+        return None
+
+    _status['running'] = True
+    try:
+        manifest = create_snapshot(label='scheduled')
+        pruned = prune_snapshots(BACKUP_KEEP_DAILY, BACKUP_KEEP_WEEKLY)
+        _status['last_result'] = {
+            'snapshot_id': manifest['id'],
+            'stats': manifest['stats'],
+            'snapshots_removed': len(pruned['snapshots_removed']),
+            'bytes_freed': pruned['bytes_freed']
+        }
+        _status['last_error'] = None
+        return manifest
+    except Exception as e:
+        _status['last_error'] = str(e)
+        print(f"❌ Scheduled backup failed: {e}")
+        return None
+    finally:
+        _status['running'] = False
+        _status['last_run'] = datetime.utcnow().isoformat()
+        _status['next_due'] = next_backup_due().isoformat()
+
+def _scheduler_loop():
+    lower_thread_priority()
+    while True:
+        run_scheduled_backup()
+        time.sleep(CHECK_INTERVAL_SECONDS)
+
+def start_backup_scheduler():
+    """Start the scheduler thread once per process (no-op when disabled)"""
+    global _thread
+    with _start_lock:
+        if _thread is not None or BACKUP_INTERVAL_HOURS <= 0:
+            return
+        if not acquire_process_lock(LOCK_FILE):
+            print("ℹ️  Backup scheduler already running in another process")
+            return
+        _status['enabled'] = True
+        _thread = threading.Thread(target=_scheduler_loop, name='backup-scheduler', daemon=True)
+        _thread.start()
+        print(f"✅ Backup scheduler started (every {BACKUP_INTERVAL_HOURS:g}h, "
+              f"keeping {BACKUP_KEEP_DAILY} daily / {BACKUP_KEEP_WEEKLY} weekly)")
+
+def get_scheduler_status():
+    status = dict(_status)
+    status.update({'interval_hours': BACKUP_INTERVAL_HOURS,
+                   'keep_daily': BACKUP_KEEP_DAILY, 'keep_weekly': BACKUP_KEEP_WEEKLY})
+    return status
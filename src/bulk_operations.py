@@ -0,0 +1,91 @@
+"""
+Set-Based Bulk Operations for Mind's Eye Photography
+Recategorize or delete a whole selection with a handful of statements per
+chunk - IN-list SELECT/DELETE plus one executemany INSERT - in a single
+transaction, instead of a get/delete/insert round trip per image. Every
+call reports a per-image outcome so the admin UI can show what happened
+"""
+from src.models import db, Image, Category, ImageCategory
+
+# Ids per IN list - well under SQLite's bound-parameter limit
+BULK_CHUNK_SIZE = 500
+
+def _chunks(items, size=BULK_CHUNK_SIZE):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+def _unique(image_ids):
+    """Ids as strings, duplicates dropped, request order kept"""
+    return list(dict.fromkeys(str(image_id) for image_id in image_ids))
+
+def _existing_images(image_ids):
+    """{id: filename} for the ids that exist (one query per chunk)"""
+    found = {}
+    for chunk in _chunks(image_ids):
+        found.update(db.session.query(Image.id, Image.filename).filter(Image.id.in_(chunk)))
+    return found
+
+def bulk_set_categories(image_ids, category_names):
+    """
+    Replace the categories of every selected image
+    Raises ValueError if a category doesn't exist (nothing is changed)
+    Returns {'updated': n, 'results': [{'id', 'status'}]} - status updated/not_found
+    """
+    image_ids = _unique(image_ids)
+    category_ids = dict(db.session.query(Category.name, Category.id).filter(Category.name.in_(category_names)))
+    unknown = [name for name in category_names if name not in category_ids]
+    if unknown:
+        raise ValueError(f"Unknown categories: {', '.join(unknown)}")
+
+    found = _existing_images(image_ids)
+    try:
+        for chunk in _chunks([image_id for image_id in image_ids if image_id in found]):
+            ImageCategory.query.filter(ImageCategory.image_id.in_(chunk)).delete(synchronize_session=False)
+            db.session.execute(db.insert(ImageCategory), [
+                {'image_id': image_id, 'category_id': category_id}
+                for image_id in chunk for category_id in dict.fromkeys(category_ids.values())
+            ])
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+
+    from src.response_cache import bump_catalog_version
+    bump_catalog_version()
+    return {
+        'updated': len(found),
+        'results': [{'id': image_id, 'status': 'updated' if image_id in found else 'not_found'}
+                    for image_id in image_ids]
+    }
+
+def bulk_delete_images(image_ids):
+    """
+    Delete every selected image's rows in one transaction, which also queues
+    the removal of their files (see asset_gc) - a failed delete never leaves
+    rows pointing at removed originals
+    Returns {'deleted': n, 'results': [{'id', 'status'}]} - status deleted/not_found
+    """
+    from src.asset_gc import enqueue_file_removal
+    from src.jobs import notify_workers
+
+    image_ids = _unique(image_ids)
+    found = _existing_images(image_ids)
+    try:
+        for chunk in _chunks(list(found)):
+            ImageCategory.query.filter(ImageCategory.image_id.in_(chunk)).delete(synchronize_session=False)
+            Image.query.filter(Image.id.in_(chunk)).delete(synchronize_session=False)
+        if found:
+            enqueue_file_removal(originals=found.values())
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+
+    notify_workers()
+    from src.response_cache import bump_catalog_version
+    bump_catalog_version()
+    return {
+        'deleted': len(found),
+        'results': [{'id': image_id, 'status': 'deleted' if image_id in found else 'not_found'}
+                    for image_id in image_ids]
+    }
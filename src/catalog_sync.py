@@ -0,0 +1,182 @@
+"""
+Catalog Sync for Mind's Eye Photography
+Keeps the images table in step with files copied onto the volume outside the
+app (rsync, SFTP). A periodic scan compares each original's size and mtime
+with the values stored on its Image row (file_size/file_mtime), so only new,
+changed and deleted files are touched:
+- new files are imported (see volume_import) and queued for derivatives
+- changed files get fresh header metadata, derivatives and content hash
+- rows whose file disappeared are deleted, unless the volume looks unmounted
+  or the deletion would remove a large share of the catalog
+A periodic scan rather than inotify: inotify doesn't see changes made on the
+other side of a network volume
+"""
+import os
+import time
+import threading
+from src.models import db, Image
+from src.config import PHOTOGRAPHY_ASSETS_DIR, CATALOG_SYNC_INTERVAL_SECONDS
+from src.volume_import import IMAGE_EXTENSIONS, import_files, read_image_header
+
+SETTLE_SECONDS = 60  # Files modified more recently may still be uploading/copying
+MAX_DELETE_FRACTION = 0.25  # Larger deletions need allow_mass_delete=True
+SYNC_JOB_TYPES = ('image.derivatives', 'image.hash')
+LOCK_FILE = os.path.join(PHOTOGRAPHY_ASSETS_DIR, 'cache', 'catalog_sync.lock')
+
+_sync_lock = threading.Lock()
+_thread = None
+_last_result = None
+
+def scan_originals(assets_dir=PHOTOGRAPHY_ASSETS_DIR, settle_seconds=SETTLE_SECONDS):
+    """
+    ({filename: (size, mtime_ns)} of settled image files, set of files still being written)
+    Hidden files (rsync temp files) are ignored
+    """
+    settled, unsettled = {}, set()
+    cutoff = time.time_ns() - settle_seconds * 1_000_000_000
+    with os.scandir(assets_dir) as it:
+        for entry in it:
+            if entry.name.startswith('.') or os.path.splitext(entry.name)[1].lower() not in IMAGE_EXTENSIONS:
+                continue
+            try:
+                if not entry.is_file():
+                    continue
+                stat = entry.stat()
+            except OSError:
+                continue
+            if stat.st_mtime_ns > cutoff:
+                unsettled.add(entry.name)
+            else:
+                settled[entry.name] = (stat.st_size, stat.st_mtime_ns)
+    return settled, unsettled
+
+def plan_sync(catalog, files, unsettled):
+    """
+    Compare catalog rows {filename: (id, size, mtime_ns)} with the scan
+    Returns dict of new / changed / adopted / deleted filenames
+    """
+    plan = {'new': [], 'changed': [], 'adopted': [], 'deleted': []}
+    for filename, (size, mtime) in files.items():
+        row = catalog.get(filename)
+        if row is None:
+            plan['new'].append(filename)
+            continue
+        _, known_size, known_mtime = row
+        if known_size is not None and known_size != size:
+            plan['changed'].append(filename)
+        elif known_size is None or known_mtime is None:
+            # Cataloged before size/mtime were recorded - nothing to compare, take it as is
+            plan['adopted'].append(filename)
+        elif known_mtime != mtime:
+            plan['changed'].append(filename)
+    plan['deleted'] = [filename for filename in catalog if filename not in files and filename not in unsettled]
+    for key in plan:
+        plan[key].sort()
+    return plan
+
+def sync_catalog(assets_dir=PHOTOGRAPHY_ASSETS_DIR, dry_run=False, allow_mass_delete=False):
+    """Reconcile the images table with the volume (call inside an app context) - returns the plan + counts"""
+    global _last_result
+    from src.image_jobs import enqueue_image_processing
+    from src.jobs import notify_workers
+    from src.asset_gc import enqueue_file_removal, pending_removals
+    from src.response_cache import bump_catalog_version
+
+    with _sync_lock:
+        if not os.path.isdir(assets_dir):
+            print(f"⚠️  Catalog sync skipped - volume not found: {assets_dir}")
+            return None
+
+        started = time.time()
+        catalog = {filename: (image_id, size, mtime) for image_id, filename, size, mtime in
+                   db.session.query(Image.id, Image.filename, Image.file_size, Image.file_mtime)}
+        files, unsettled = scan_originals(assets_dir)
+        # Deleted in the app, file removal still queued - not new files
+        for filename in pending_removals():
+            files.pop(filename, None)
+        plan = plan_sync(catalog, files, unsettled)
+
+        # Never mirror an unmounted/emptied volume into the database
+        if catalog and not files and not unsettled:
+            print("⚠️  Catalog sync: volume has no images but the catalog does - is the volume mounted? Skipping deletions")
+            plan['deleted'] = []
+        elif len(plan['deleted']) > 10 and len(plan['deleted']) > MAX_DELETE_FRACTION * len(catalog) \
+                and not allow_mass_delete:
+            print(f"⚠️  Catalog sync: {len(plan['deleted'])} of {len(catalog)} originals are missing - "
+                  f"not deleting their rows (run: python manage.py sync --allow-mass-delete)")
+            plan['deleted'] = []
+
+        result = {key: len(names) for key, names in plan.items()}
+        result['dry_run'] = dry_run
+        if dry_run or not any(plan.values()):
+            result['seconds'] = round(time.time() - started, 2)
+            _last_result = result
+            return dict(result, plan=plan)
+
+        # New files - bulk import, then derivatives + hash in the background
+        for image_id in import_files(plan['new'], assets_dir):
+            enqueue_image_processing(image_id, job_types=SYNC_JOB_TYPES)
+
+        # Changed files - refresh header metadata, regenerate derivatives and hash
+        for filename in plan['changed']:
+            image_id = catalog[filename][0]
+            info = read_image_header(os.path.join(assets_dir, filename))
+            db.session.query(Image).filter_by(id=image_id).update(dict(info, content_hash=None))
+            enqueue_image_processing(image_id, job_types=SYNC_JOB_TYPES)
+
+        # Cataloged before file_size/file_mtime were tracked - just record them
+        if plan['adopted']:
+            db.session.bulk_update_mappings(Image, [
+                {'id': catalog[filename][0], 'file_size': files[filename][0], 'file_mtime': files[filename][1]}
+                for filename in plan['adopted']
+            ])
+
+        # Files removed from the volume - rows go now, derivatives via a job
+        gone = []
+        for filename in plan['deleted']:
+            if os.path.exists(os.path.join(assets_dir, filename)):
+                continue  # Came back since the scan
+            image = db.session.get(Image, catalog[filename][0])
+            if image is not None:
+                db.session.delete(image)
+                gone.append(filename)
+        if gone:
+            enqueue_file_removal(originals=gone)
+
+        db.session.commit()
+        notify_workers()
+        if plan['new'] or plan['changed'] or plan['deleted']:
+            bump_catalog_version()
+
+        result['seconds'] = round(time.time() - started, 2)
+        _last_result = result
+        print(f"✅ Catalog sync: {result['new']} new, {result['changed']} changed, "
+              f"{result['deleted']} deleted, {result['adopted']} adopted in {result['seconds']}s")
+        return dict(result, plan=plan)
+
+def _sync_loop(app):
+    from src.service_utils import lower_thread_priority
+    lower_thread_priority()
+    while True:
+        try:
+            with app.app_context():
+                sync_catalog()
+        except Exception as e:
+            print(f"❌ Catalog sync failed: {e}")
+        time.sleep(CATALOG_SYNC_INTERVAL_SECONDS)
+
+def start_catalog_sync(app):
+    """Start the periodic sync thread (one process per volume; no-op when disabled)"""
+    global _thread
+    from src.service_utils import acquire_process_lock
+    with _sync_lock:
+        if _thread is not None or CATALOG_SYNC_INTERVAL_SECONDS <= 0:
+            return
+        if not acquire_process_lock(LOCK_FILE):
+            return
+        _thread = threading.Thread(target=_sync_loop, args=(app,), name='catalog-sync', daemon=True)
+        _thread.start()
+        print(f"✅ Catalog sync started (every {CATALOG_SYNC_INTERVAL_SECONDS}s)")
+
+def get_sync_status():
+    return {'enabled': _thread is not None, 'interval_seconds': CATALOG_SYNC_INTERVAL_SECONDS, 'last_result': _last_result}
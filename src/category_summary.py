@@ -0,0 +1,37 @@
+"""
+Category Summary for Mind's Eye Photography
+All categories with their image counts from a single GROUP BY over
+image_categories (an index-only scan of ix_image_categories_category_image),
+instead of one COUNT - or one relationship load - per category. The public
+payload is cached until the next catalog write (see response_cache)
+"""
+from src.models import db, Category, ImageCategory
+
+def category_image_counts():
+    """{category_id: image count} for every category with at least one image"""
+    return dict(
+        db.session.query(ImageCategory.category_id, db.func.count(ImageCategory.image_id))
+        .group_by(ImageCategory.category_id)
+    )
+
+def category_image_count(category_id):
+    """Image count of a single category"""
+    return db.session.query(db.func.count(ImageCategory.image_id)).filter(
+        ImageCategory.category_id == category_id
+    ).scalar()
+
+def category_summaries():
+    """Every category (display order, then name) as a dict with image_count - two queries total"""
+    counts = category_image_counts()
+    categories = Category.query.order_by(Category.display_order, Category.name).all()
+    return [category.to_dict(image_count=counts.get(category.id, 0)) for category in categories]
+
+def build_public_categories():
+    """/api/categories payload"""
+    return [{
+        'id': str(summary['id']),
+        'name': summary['name'],
+        'display_name': summary['display_name'],
+        'color': summary['color'],
+        'image_count': summary['image_count']
+    } for summary in category_summaries()]
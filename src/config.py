@@ -21,15 +21,59 @@ else:
     # Local development fallback
     PHOTOGRAPHY_ASSETS_DIR = os.path.join(BASE_DIR, '..', 'photography-assets')
 
-print(f"🔍 PHOTOGRAPHY_ASSETS_DIR set to: {PHOTOGRAPHY_ASSETS_DIR}")
-print(f"🔍 RAILWAY_VOLUME_MOUNT_PATH: {RAILWAY_VOLUME_PATH}")
-print(f"🔍 Directory exists: {os.path.exists(PHOTOGRAPHY_ASSETS_DIR)}")
-
 # Data files (keep with website for easy admin updates)
 PORTFOLIO_DATA_FILE = os.path.join(STATIC_DIR, 'assets', 'portfolio-data-multicategory.json')
 CATEGORIES_CONFIG_FILE = os.path.join(STATIC_DIR, 'assets', 'categories-config.json')
 FEATURED_DATA_FILE = os.path.join(STATIC_DIR, 'assets', 'featured-image.json')
 
+# Downscaled derivatives (thumbnails etc.) generated from uploaded originals
+DERIVATIVES_DIR = os.path.join(PHOTOGRAPHY_ASSETS_DIR, 'derivatives')
+DERIVATIVE_WIDTHS = {
+    'small': 320,
+    'medium': 800,
+    'large': 1600,
+}
+
+# On-demand resized images (/img/<filename>?w=...) cached on the volume
+RESIZE_CACHE_DIR = os.path.join(PHOTOGRAPHY_ASSETS_DIR, 'cache', 'resized')
+RESIZE_CACHE_MAX_BYTES = int(os.environ.get('RESIZE_CACHE_MAX_BYTES', 2 * 1024 * 1024 * 1024))
+RESIZE_ALLOWED_WIDTHS = (160, 320, 480, 640, 800, 1024, 1280, 1600, 2048)
+
+# Background job workers (upload post-processing)
+JOB_WORKERS = int(os.environ.get('JOB_WORKERS', 2))
+JOB_MAX_ATTEMPTS = 3
+
+# SQLite engine profile (see db_profile) - pragmas applied to every connection
+SQLITE_JOURNAL_MODE = os.environ.get('SQLITE_JOURNAL_MODE', 'WAL')
+SQLITE_SYNCHRONOUS = os.environ.get('SQLITE_SYNCHRONOUS', 'NORMAL')
+SQLITE_BUSY_TIMEOUT_MS = int(os.environ.get('SQLITE_BUSY_TIMEOUT_MS', 5000))
+SQLITE_CACHE_SIZE_KB = int(os.environ.get('SQLITE_CACHE_SIZE_KB', 16 * 1024))
+SQLITE_MMAP_SIZE = int(os.environ.get('SQLITE_MMAP_SIZE', 256 * 1024 * 1024))
+SQLITE_TEMP_STORE = os.environ.get('SQLITE_TEMP_STORE', 'MEMORY')
+
+# Connection pool: one connection per WSGI request thread plus the background workers
+WSGI_THREADS = int(os.environ.get('WSGI_THREADS', 8))
+DB_POOL_SIZE = int(os.environ.get('DB_POOL_SIZE', WSGI_THREADS + JOB_WORKERS + 2))
+DB_POOL_OVERFLOW = int(os.environ.get('DB_POOL_OVERFLOW', 4))
+DB_POOL_TIMEOUT = int(os.environ.get('DB_POOL_TIMEOUT', 30))
+
+# Catalog sync: files added/changed/removed on the volume outside the app (0 disables)
+CATALOG_SYNC_INTERVAL_SECONDS = int(os.environ.get('CATALOG_SYNC_INTERVAL_SECONDS', 5 * 60))
+
+# Orphan file garbage collection on the volume (0 disables the background run)
+ASSET_GC_INTERVAL_HOURS = float(os.environ.get('ASSET_GC_INTERVAL_HOURS', 24))
+
+# Expose EXIF GPS coordinates in public API payloads (off: location stays in the database only)
+PUBLIC_EXIF_GPS = os.environ.get('PUBLIC_EXIF_GPS', '').lower() in ('1', 'true', 'yes')
+
+# Incremental content-addressed backup snapshots
+BACKUPS_DIR = os.environ.get('BACKUPS_DIR', os.path.join(PHOTOGRAPHY_ASSETS_DIR, 'backups'))
+
+# Scheduled snapshots (0 disables the scheduler) and how many to retain
+BACKUP_INTERVAL_HOURS = float(os.environ.get('BACKUP_INTERVAL_HOURS', 24))
+BACKUP_KEEP_DAILY = int(os.environ.get('BACKUP_KEEP_DAILY', 7))
+BACKUP_KEEP_WEEKLY = int(os.environ.get('BACKUP_KEEP_WEEKLY', 4))
+
 # Legacy paths for backward compatibility
 LEGACY_ASSETS_DIR = os.path.join(STATIC_DIR, 'assets')
 
@@ -37,6 +81,9 @@ LEGACY_ASSETS_DIR = os.path.join(STATIC_DIR, 'assets')
 PHOTOGRAPHY_ASSETS_URL_PREFIX = '/static/assets/'
 LEGACY_ASSETS_URL_PREFIX = '/static/assets/'
 
+# Public site URL used for absolute image URLs in API payloads
+PUBLIC_SITE_URL = os.environ.get('PUBLIC_SITE_URL', 'https://minds-eye-master-production.up.railway.app')
+
 def get_image_url(filename):
     """
     Get the URL for an image file
@@ -0,0 +1,99 @@
+"""
+Online SQLite Backups for Mind's Eye Photography
+Consistent copies of the live database via SQLite's backup API - safe while
+the app is writing, never a torn file like a plain copy can be. Each run's
+timing and page counts are recorded so growth can be tracked over time
+"""
+import os
+import json
+import time
+import sqlite3
+import tempfile
+import threading
+from datetime import datetime
+from src.config import PHOTOGRAPHY_ASSETS_DIR, BACKUPS_DIR
+
+DATABASE_PATH = os.path.join(PHOTOGRAPHY_ASSETS_DIR, 'mindseye.db')
+STATS_FILE = os.path.join(BACKUPS_DIR, 'db_backup_stats.jsonl')
+PAGES_PER_STEP = 1024  # Copy in steps so writers can get in between
+STATS_HISTORY_LIMIT = 500
+
+_stats_lock = threading.Lock()
+
+def backup_database(destination, database_path=DATABASE_PATH, pages=PAGES_PER_STEP):
+    """
+    Copy the live database to destination with the online backup API
+    Returns stats: pages, page_size, bytes, steps, duration_ms
+    """
+    started = time.perf_counter()
+    progress = {'steps': 0, 'total': 0}
+
+    def on_progress(status, remaining, total):
+        progress['steps'] += 1
+        progress['total'] = total
+
+    source = sqlite3.connect(database_path)
+    try:
+        target = sqlite3.connect(destination)
+        try:
+            source.backup(target, pages=pages, progress=on_progress)
+            page_size = target.execute('PRAGMA page_size').fetchone()[0]
+            page_count = target.execute('PRAGMA page_count').fetchone()[0]
+        finally:
+            target.close()
+    finally:
+        source.close()
+
+    stats = {
+        'timestamp': datetime.utcnow().isoformat(),
+        'pages': page_count,
+        'page_size': page_size,
+        'bytes': os.path.getsize(destination),
+        'steps': progress['steps'],
+        'duration_ms': round((time.perf_counter() - started) * 1000, 1)
+    }
+    record_backup_stats(stats)
+    print(f"✅ Database snapshot: {stats['pages']} pages ({stats['bytes'] / (1024 * 1024):.1f} MB) in {stats['duration_ms']} ms")
+    return stats
+
+def backup_database_to_temp(database_path=DATABASE_PATH, directory=None):
+    """Backup into a new temp file - returns (path, stats); caller removes the file"""
+    directory = directory or BACKUPS_DIR
+    os.makedirs(directory, exist_ok=True)
+    fd, path = tempfile.mkstemp(dir=directory, suffix='.db.tmp')
+    os.close(fd)
+    try:
+        return path, backup_database(path, database_path)
+    except Exception:
+        os.remove(path)
+        raise
+
+def record_backup_stats(stats):
+    """Append one run to the stats history (trimmed to the last STATS_HISTORY_LIMIT runs)"""
+    try:
+        with _stats_lock:
+            os.makedirs(os.path.dirname(STATS_FILE), exist_ok=True)
+            history = recent_backup_stats(limit=STATS_HISTORY_LIMIT - 1)
+            history.append(stats)
+            temp_path = f"{STATS_FILE}.tmp"
+            with open(temp_path, 'w') as f:
+                for entry in history:
+                    f.write(json.dumps(entry) + '\n')
+            os.replace(temp_path, STATS_FILE)
+    except OSError as e:
+        print(f"⚠️  Could not record database backup stats: {e}")
+
+def recent_backup_stats(limit=20):
+    """Most recent backup runs, oldest first"""
+    try:
+        with open(STATS_FILE) as f:
+            lines = f.readlines()[-limit:] if limit else []
+    except OSError:
+        return []
+    history = []
+    for line in lines:
+        try:
+            history.append(json.loads(line))
+        except ValueError:
+            continue
+    return history
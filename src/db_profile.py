@@ -0,0 +1,61 @@
+"""
+SQLite Engine Profile for Mind's Eye Photography
+WAL journaling (readers never wait for an admin write), a busy timeout
+instead of immediate "database is locked" errors, and per-connection
+cache/mmap/temp_store/synchronous tuning - all configurable in config.py.
+Pragmas are applied on every new pooled connection
+"""
+from sqlalchemy import event
+from sqlalchemy.pool import QueuePool
+from src.config import (
+    SQLITE_JOURNAL_MODE, SQLITE_SYNCHRONOUS, SQLITE_BUSY_TIMEOUT_MS, SQLITE_CACHE_SIZE_KB,
+    SQLITE_MMAP_SIZE, SQLITE_TEMP_STORE, DB_POOL_SIZE, DB_POOL_OVERFLOW, DB_POOL_TIMEOUT
+)
+
+def sqlite_pragmas():
+    """(pragma, value) pairs for a new connection - empty/None settings are skipped"""
+    pragmas = [
+        ('journal_mode', SQLITE_JOURNAL_MODE),
+        ('synchronous', SQLITE_SYNCHRONOUS),
+        ('busy_timeout', SQLITE_BUSY_TIMEOUT_MS),
+        ('cache_size', -SQLITE_CACHE_SIZE_KB),  # Negative = KiB rather than pages
+        ('mmap_size', SQLITE_MMAP_SIZE),
+        ('temp_store', SQLITE_TEMP_STORE),
+    ]
+    return [(name, value) for name, value in pragmas if value not in (None, '')]
+
+def engine_options(pool_size=DB_POOL_SIZE):
+    """SQLALCHEMY_ENGINE_OPTIONS for the SQLite database"""
+    return {
+        'poolclass': QueuePool,
+        'pool_size': pool_size,
+        'max_overflow': DB_POOL_OVERFLOW,
+        'pool_timeout': DB_POOL_TIMEOUT,
+        'pool_pre_ping': False,  # Local file - connections don't go stale
+        'connect_args': {
+            'timeout': SQLITE_BUSY_TIMEOUT_MS / 1000,
+            'check_same_thread': False  # Pooled connections move between request threads
+        }
+    }
+
+def apply_pragmas(dbapi_connection, connection_record=None, pragmas=None):
+    """'connect' event listener - tune a fresh DB-API connection"""
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in (pragmas if pragmas is not None else sqlite_pragmas()):
+            cursor.execute(f"PRAGMA {name}={value}")
+    finally:
+        cursor.close()
+
+def install_sqlite_profile(engine):
+    """Apply the pragmas to every connection the engine opens (call before first use)"""
+    if engine.dialect.name != 'sqlite' or event.contains(engine, 'connect', apply_pragmas):
+        return
+    event.listen(engine, 'connect', apply_pragmas)
+
+def describe_connection(connection):
+    """Effective settings of a live connection (for the debug/benchmark output)"""
+    settings = {}
+    for name in ('journal_mode', 'synchronous', 'busy_timeout', 'cache_size', 'mmap_size', 'temp_store'):
+        settings[name] = connection.exec_driver_sql(f"PRAGMA {name}").scalar()
+    return settings
@@ -0,0 +1,89 @@
+"""
+Content-Hash Deduplication for Mind's Eye Photography
+SHA-256 of each original (stored in Image.content_hash) is used to detect
+re-uploads of the same photo and link them to the existing record instead
+of storing another copy
+"""
+import os
+import hashlib
+from src.models import db, Image, Category, ImageCategory
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+def file_sha256(path):
+    """SHA-256 of a file, read in chunks"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def save_stream_with_hash(stream, path):
+    """
+    Copy an upload stream to path while hashing it (single pass, no re-read)
+    Returns (sha256 hex digest, bytes written)
+    """
+    digest = hashlib.sha256()
+    size = 0
+    with open(path, 'wb') as f:
+        for chunk in iter(lambda: stream.read(HASH_CHUNK_SIZE), b''):
+            f.write(chunk)
+            digest.update(chunk)
+            size += len(chunk)
+    return digest.hexdigest(), size
+
+def find_image_by_hash(content_hash):
+    """Existing image with the same content (oldest first), or None"""
+    if not content_hash:
+        return None
+    return Image.query.filter_by(content_hash=content_hash).order_by(Image.upload_date).first()
+
+def link_categories(image, category_names):
+    """Add categories to an image, skipping ones it already has - returns number added"""
+    existing_ids = {link.category_id for link in image.categories}
+    added = 0
+    for category in Category.query.filter(Category.name.in_(category_names)).all():
+        if category.id not in existing_ids:
+            db.session.add(ImageCategory(image_id=image.id, category_id=category.id))
+            existing_ids.add(category.id)
+            added += 1
+    return added
+
+def merge_duplicate_images(keeper, duplicates):
+    """
+    Fold duplicate rows into keeper: categories and featured/background/slideshow
+    flags move over, then the duplicate rows are deleted (caller commits)
+    Returns the filenames of the removed duplicates
+    """
+    keeper_category_ids = {link.category_id for link in keeper.categories}
+    removed_files = []
+    for duplicate in duplicates:
+        for link in duplicate.categories:
+            if link.category_id not in keeper_category_ids:
+                db.session.add(ImageCategory(image_id=keeper.id, category_id=link.category_id))
+                keeper_category_ids.add(link.category_id)
+        if duplicate.is_featured:
+            keeper.is_featured = True
+            keeper.featured_story = keeper.featured_story or duplicate.featured_story
+        if duplicate.is_background:
+            keeper.is_background = True
+        if duplicate.is_slideshow_background:
+            keeper.is_slideshow_background = True
+        if not keeper.description and duplicate.description:
+            keeper.description = duplicate.description
+        removed_files.append(duplicate.filename)
+        db.session.delete(duplicate)
+    return removed_files
+
+def remove_duplicate_file(filename, assets_dir):
+    """Delete a duplicate original and its derivatives - returns bytes reclaimed"""
+    from src.derivatives import delete_derivatives
+    from src.storage_stats import record_removed
+    path = os.path.join(assets_dir, filename)
+    reclaimed = 0
+    if os.path.exists(path):
+        reclaimed = os.path.getsize(path)
+        os.remove(path)
+        record_removed(path, reclaimed)
+    delete_derivatives(filename)
+    return reclaimed
@@ -0,0 +1,146 @@
+"""
+Responsive Image Derivatives for Mind's Eye Photography
+Generates downscaled JPEG copies of uploaded originals (see DERIVATIVE_WIDTHS)
+so grids, admin cards and the slideshow don't download camera originals
+"""
+import os
+from PIL import Image as PILImage, ImageOps
+from src.config import (
+    PHOTOGRAPHY_ASSETS_DIR, DERIVATIVES_DIR, DERIVATIVE_WIDTHS,
+    PHOTOGRAPHY_ASSETS_URL_PREFIX, PUBLIC_SITE_URL
+)
+from src.storage_stats import record_added, record_removed
+
+DERIVATIVE_QUALITY = 82
+EXIF_ORIENTATION_TAG = 0x0112
+ROTATED_ORIENTATIONS = (5, 6, 7, 8)
+
+def derivative_filename(filename, width):
+    """Derivative file name, e.g. sunset-ab12cd34.jpg -> sunset-ab12cd34-800w.jpg"""
+    stem = os.path.splitext(filename)[0]
+    return f"{stem}-{width}w.jpg"
+
+def derivative_path(filename, width):
+    """Absolute path of a derivative on the volume"""
+    return os.path.join(DERIVATIVES_DIR, derivative_filename(filename, width))
+
+def derivative_url(filename, width, absolute=False):
+    """URL of a derivative (served by the photography assets route)"""
+    url = f"{PHOTOGRAPHY_ASSETS_URL_PREFIX}derivatives/{derivative_filename(filename, width)}"
+    return f"{PUBLIC_SITE_URL}{url}" if absolute else url
+
+def parse_widths(value):
+    """Parse the comma separated derivative_widths column"""
+    if not value:
+        return []
+    return sorted(int(width) for width in value.split(',') if width.strip().isdigit())
+
+def format_widths(widths):
+    """Format widths for the derivative_widths column"""
+    return ','.join(str(width) for width in sorted(widths))
+
+def is_derivative_fresh(filename, width, source_mtime):
+    """True if the derivative exists and is not older than its original"""
+    try:
+        return os.path.getmtime(derivative_path(filename, width)) >= source_mtime
+    except OSError:
+        return False
+
+def generate_derivatives(filename, source_dir=PHOTOGRAPHY_ASSETS_DIR, skip_fresh=False):
+    """
+    Create every derivative narrower than the original
+    With skip_fresh, derivatives newer than the original are left alone
+    Returns the list of widths that exist afterwards
+    """
+    source_path = os.path.join(source_dir, filename)
+    source_mtime = os.path.getmtime(source_path)
+    os.makedirs(DERIVATIVES_DIR, exist_ok=True)
+
+    widths = sorted(DERIVATIVE_WIDTHS.values(), reverse=True)
+    generated = []
+
+    with PILImage.open(source_path) as img:
+        # Displayed width, taking EXIF rotation into account
+        original_width = img.size[0]
+        if img.getexif().get(EXIF_ORIENTATION_TAG) in ROTATED_ORIENTATIONS:
+            original_width = img.size[1]
+        targets = [width for width in widths if width < original_width]
+        if not targets:
+            return []
+
+        stale = targets
+        if skip_fresh:
+            stale = [width for width in targets if not is_derivative_fresh(filename, width, source_mtime)]
+            if not stale:
+                return sorted(targets)
+
+        # Let the JPEG decoder downscale by DCT while loading (much faster)
+        largest = targets[0]
+        img.draft('RGB', (largest, largest))
+
+        icc_profile = img.info.get('icc_profile')
+        working = ImageOps.exif_transpose(img)
+        if working.mode not in ('RGB', 'L'):
+            working = working.convert('RGB')
+
+        # Downscale progressively from the largest target to the smallest
+        for width in targets:
+            height = max(1, round(working.size[1] * width / working.size[0]))
+            working = working.resize((width, height), PILImage.LANCZOS)
+            if width not in stale:
+                generated.append(width)
+                continue
+
+            final_path = derivative_path(filename, width)
+            temp_path = f"{final_path}.tmp"
+            save_kwargs = {'quality': DERIVATIVE_QUALITY, 'optimize': True, 'progressive': True}
+            if icc_profile:
+                save_kwargs['icc_profile'] = icc_profile
+            working.save(temp_path, 'JPEG', **save_kwargs)
+            previous_size = os.path.getsize(final_path) if os.path.exists(final_path) else None
+            os.replace(temp_path, final_path)
+            record_added(final_path, previous_size)
+            generated.append(width)
+
+    return sorted(generated)
+
+def delete_derivatives(filename):
+    """Remove all derivatives of an original (missing files are ignored)"""
+    removed = 0
+    for width in DERIVATIVE_WIDTHS.values():
+        path = derivative_path(filename, width)
+        if os.path.exists(path):
+            try:
+                size = os.path.getsize(path)
+                os.remove(path)
+                record_removed(path, size)
+                removed += 1
+            except OSError as e:
+                print(f"❌ Error deleting derivative {path}: {e}")
+    return removed
+
+def build_srcset(filename, widths, original_width=None, absolute=False):
+    """srcset attribute value: derivatives plus the original at its own width"""
+    entries = [f"{derivative_url(filename, width, absolute)} {width}w" for width in widths]
+    if original_width:
+        original_url = f"{PHOTOGRAPHY_ASSETS_URL_PREFIX}{filename}"
+        if absolute:
+            original_url = f"{PUBLIC_SITE_URL}{original_url}"
+        entries.append(f"{original_url} {original_width}w")
+    return ', '.join(entries)
+
+def derivative_payload(image, absolute=True):
+    """Derivative URLs and srcset for an Image row, for API payloads"""
+    widths = parse_widths(getattr(image, 'derivative_widths', None))
+    names = {width: name for name, width in DERIVATIVE_WIDTHS.items()}
+    return {
+        'derivatives': {names.get(width, f"{width}w"): derivative_url(image.filename, width, absolute) for width in widths},
+        'srcset': build_srcset(image.filename, widths, image.width, absolute) if widths else ''
+    }
+
+def thumbnail_url(image):
+    """Smallest available derivative, falling back to the original"""
+    widths = parse_widths(getattr(image, 'derivative_widths', None))
+    if widths:
+        return derivative_url(image.filename, widths[0])
+    return f"{PHOTOGRAPHY_ASSETS_URL_PREFIX}{image.filename}"
@@ -0,0 +1,75 @@
+"""
+Upload Post-Processing Jobs for Mind's Eye Photography
+Handlers that fill in an uploaded image's metadata after the request has
+returned: dimensions/size, EXIF, derivatives and content hash
+"""
+import os
+from PIL import Image as PILImage
+from src.models import db, Image
+from src.config import PHOTOGRAPHY_ASSETS_DIR
+from src.jobs import job_handler, enqueue
+from src.derivatives import generate_derivatives, format_widths
+from src.image_metadata import extract_exif_data, dump_exif
+from src.response_cache import bump_catalog_version
+from src.dedup import file_sha256
+
+IMAGE_JOB_TYPES = ('image.metadata', 'image.exif', 'image.derivatives', 'image.hash')
+# Uploads hash while streaming, so they only need these
+UPLOAD_JOB_TYPES = ('image.metadata', 'image.exif', 'image.derivatives')
+
+def enqueue_image_processing(image_id, batch_id=None, job_types=IMAGE_JOB_TYPES):
+    """Queue post-processing steps (all by default) for a freshly saved upload"""
+    return [enqueue(job_type, {'image_id': image_id}, batch_id=batch_id) for job_type in job_types]
+
+def _load_image(payload):
+    """Image row and path of its original - (None, None) if the image was deleted"""
+    image = db.session.get(Image, payload['image_id'])
+    if image is None:
+        return None, None
+    path = os.path.join(PHOTOGRAPHY_ASSETS_DIR, image.filename)
+    if not os.path.exists(path):
+        raise FileNotFoundError(path)
+    return image, path
+
+@job_handler('image.metadata')
+def extract_image_metadata(payload):
+    """File size and pixel dimensions (header only)"""
+    image, path = _load_image(payload)
+    if image is None:
+        return
+    stat = os.stat(path)
+    image.file_size = stat.st_size
+    image.file_mtime = stat.st_mtime_ns
+    with PILImage.open(path) as img:
+        image.width, image.height = img.size
+    db.session.commit()
+    bump_catalog_version()
+
+@job_handler('image.exif')
+def capture_image_exif(payload):
+    """Camera info for /api/featured"""
+    image, path = _load_image(payload)
+    if image is None:
+        return
+    image.exif_data = dump_exif(extract_exif_data(path))
+    db.session.commit()
+    bump_catalog_version()
+
+@job_handler('image.derivatives')
+def build_image_derivatives(payload):
+    """Downscaled copies for grids, cards and srcset"""
+    image, _ = _load_image(payload)
+    if image is None:
+        return
+    image.derivative_widths = format_widths(generate_derivatives(image.filename)) or None
+    db.session.commit()
+    bump_catalog_version()
+
+@job_handler('image.hash')
+def hash_image(payload):
+    """SHA-256 of the original"""
+    image, path = _load_image(payload)
+    if image is None:
+        return
+    image.content_hash = file_sha256(path)
+    db.session.commit()
@@ -0,0 +1,151 @@
+"""
+EXIF Metadata for Mind's Eye Photography
+Extracts camera information once (at upload, migration or backfill) and
+stores it as JSON in Image.exif_data so API requests never open originals.
+GPS coordinates are stored too, but public payloads go through public_exif(),
+which leaves them out unless PUBLIC_EXIF_GPS is set
+"""
+import json
+from datetime import datetime
+from PIL import Image as PILImage
+from src.config import PUBLIC_EXIF_GPS
+
+# EXIF tag ids
+EXIF_IFD = 0x8769
+GPS_IFD = 0x8825
+TAG_MAKE = 0x010F
+TAG_MODEL = 0x0110
+TAG_DATETIME = 0x0132
+TAG_EXPOSURE_TIME = 0x829A
+TAG_FNUMBER = 0x829D
+TAG_ISO = 0x8827
+TAG_DATETIME_ORIGINAL = 0x9003
+TAG_LENS_MODEL = 0xA434
+GPS_LATITUDE_REF = 1
+GPS_LATITUDE = 2
+GPS_LONGITUDE_REF = 3
+GPS_LONGITUDE = 4
+
+def _clean(value):
+    """EXIF strings are often NUL padded"""
+    if isinstance(value, bytes):
+        value = value.decode('utf-8', errors='ignore')
+    return str(value).strip().strip('\x00').strip() if value is not None else ''
+
+def _format_camera(make, model):
+    """Combine make/model without duplication (e.g. 'Canon' + 'Canon EOS R8')"""
+    if make and model:
+        if model.lower().startswith(make.lower()):
+            return model
+        return f"{make} {model}".strip()
+    return model or make or 'Unknown'
+
+def _format_aperture(value):
+    if value is None:
+        return 'Unknown'
+    try:
+        return f"{float(value):.1f}"
+    except (TypeError, ValueError, ZeroDivisionError):
+        return 'Unknown'
+
+def _format_shutter(value):
+    if value is None:
+        return 'Unknown'
+    try:
+        seconds = float(value)
+    except (TypeError, ValueError, ZeroDivisionError):
+        return 'Unknown'
+    if seconds <= 0:
+        return 'Unknown'
+    if seconds >= 1:
+        return f"{seconds:.1f}"
+    return f"1/{int(round(1 / seconds))}"
+
+def _format_date(value):
+    """EXIF date (YYYY:MM:DD HH:MM:SS) -> mm/dd/yyyy hh:mm AM/PM"""
+    value = _clean(value)
+    if not value:
+        return 'Unknown'
+    try:
+        return datetime.strptime(value, '%Y:%m:%d %H:%M:%S').strftime('%m/%d/%Y %I:%M %p')
+    except ValueError:
+        return value
+
+def _gps_to_degrees(dms, ref):
+    """(degrees, minutes, seconds) rationals -> signed decimal degrees"""
+    degrees, minutes, seconds = (float(part) for part in dms)
+    decimal = degrees + minutes / 60 + seconds / 3600
+    if _clean(ref).upper() in ('S', 'W'):
+        decimal = -decimal
+    return round(decimal, 6)
+
+def _extract_gps(gps):
+    """Decimal latitude/longitude or (None, None)"""
+    try:
+        if GPS_LATITUDE in gps and GPS_LONGITUDE in gps:
+            latitude = _gps_to_degrees(gps[GPS_LATITUDE], gps.get(GPS_LATITUDE_REF))
+            longitude = _gps_to_degrees(gps[GPS_LONGITUDE], gps.get(GPS_LONGITUDE_REF))
+            return latitude, longitude
+    except (TypeError, ValueError, ZeroDivisionError):
+        pass
+    return None, None
+
+def extract_exif_data(image_path):
+    """
+    Read camera information from an image's EXIF header
+    Returns {} when the image has no EXIF data
+    """
+    try:
+        with PILImage.open(image_path) as img:
+            return exif_from_image(img)
+    except Exception as e:
+        print(f"❌ Error extracting EXIF data from {image_path}: {e}")
+        return {}
+
+def exif_from_image(img):
+    """Camera information from an already opened image (header only, pixels aren't decoded)"""
+    exif = img.getexif()
+    if not exif:
+        return {}
+    details = exif.get_ifd(EXIF_IFD)
+    gps = exif.get_ifd(GPS_IFD)
+
+    latitude, longitude = _extract_gps(gps)
+    iso = details.get(TAG_ISO)
+    if isinstance(iso, (tuple, list)):
+        iso = iso[0] if iso else None
+
+    return {
+        'camera': _format_camera(_clean(exif.get(TAG_MAKE)), _clean(exif.get(TAG_MODEL))),
+        'lens': _clean(details.get(TAG_LENS_MODEL)) or 'Unknown',
+        'aperture': _format_aperture(details.get(TAG_FNUMBER)),
+        'shutter_speed': _format_shutter(details.get(TAG_EXPOSURE_TIME)),
+        'iso': str(iso) if iso is not None else 'Unknown',
+        'date_taken': _format_date(details.get(TAG_DATETIME_ORIGINAL) or exif.get(TAG_DATETIME)),
+        'gps_info': f"{latitude:.5f}, {longitude:.5f}" if latitude is not None else 'Unknown',
+        'latitude': latitude,
+        'longitude': longitude
+    }
+
+def dump_exif(exif):
+    """Serialize extracted EXIF for the exif_data column"""
+    return json.dumps(exif or {}, sort_keys=True)
+
+def load_exif(image):
+    """Stored EXIF for an Image row ({} if missing or not extracted yet)"""
+    raw = getattr(image, 'exif_data', None)
+    if not raw:
+        return {}
+    try:
+        return json.loads(raw)
+    except ValueError:
+        return {}
+
+def public_exif(image):
+    """Stored EXIF for a public API payload - location only with PUBLIC_EXIF_GPS"""
+    exif = load_exif(image)
+    if exif and not PUBLIC_EXIF_GPS:
+        exif.pop('latitude', None)
+        exif.pop('longitude', None)
+        exif['gps_info'] = 'Unknown'
+    return exif
@@ -0,0 +1,246 @@
+"""
+On-Demand Image Resizing for Mind's Eye Photography
+Resizes and re-encodes originals from the volume on first request and keeps
+the results in a size-capped LRU cache directory (RESIZE_CACHE_DIR)
+"""
+import os
+import hashlib
+import threading
+from collections import OrderedDict
+from PIL import Image as PILImage, ImageOps
+from werkzeug.security import safe_join
+from src.config import (
+    PHOTOGRAPHY_ASSETS_DIR, RESIZE_CACHE_DIR, RESIZE_CACHE_MAX_BYTES, RESIZE_ALLOWED_WIDTHS
+)
+
+# fmt parameter -> (Pillow format, mimetype, file extension)
+OUTPUT_FORMATS = {
+    'jpeg': ('JPEG', 'image/jpeg', '.jpg'),
+    'jpg': ('JPEG', 'image/jpeg', '.jpg'),
+    'webp': ('WEBP', 'image/webp', '.webp'),
+    'png': ('PNG', 'image/png', '.png'),
+}
+# Encoded without a quality setting - q doesn't change the output
+LOSSLESS_FORMATS = {'PNG'}
+ALLOWED_QUALITIES = (50, 60, 70, 80, 90)
+DEFAULT_FORMAT = 'jpeg'
+DEFAULT_QUALITY = 80
+
+class DiskLRUCache:
+    """Directory of cached files evicted least-recently-used first by total bytes"""
+
+    def __init__(self, directory, max_bytes):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._index = None  # name -> size, least recently used first
+        self._total = 0
+
+    def _load(self):
+        """Build the index from the directory (oldest access first)"""
+        os.makedirs(self.directory, exist_ok=True)
+        entries = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if entry.is_file() and not entry.name.endswith('.tmp'):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, entry.name, stat.st_size))
+        entries.sort()
+        self._index = OrderedDict((name, size) for _, name, size in entries)
+        self._total = sum(self._index.values())
+
+    def path_for(self, name):
+        return os.path.join(self.directory, name)
+
+    def get(self, name):
+        """Path of a cached file (marking it recently used) or None"""
+        with self._lock:
+            if self._index is None:
+                self._load()
+            if name not in self._index:
+                return None
+            path = self.path_for(name)
+            if not os.path.exists(path):
+                self._total -= self._index.pop(name)
+                return None
+            self._index.move_to_end(name)
+        try:
+            # Persist recency so the order survives restarts
+            os.utime(path)
+        except OSError:
+            pass
+        return path
+
+    def add(self, name, size):
+        """Register a file just written into the cache and evict if over budget"""
+        with self._lock:
+            if self._index is None:
+                self._load()
+            if name in self._index:
+                self._total -= self._index.pop(name)
+            self._index[name] = size
+            self._total += size
+            self._evict()
+
+    def discard(self, name):
+        """Remove a cached file - returns the bytes freed (0 if it was already gone)"""
+        with self._lock:
+            if self._index is not None and name in self._index:
+                self._total -= self._index.pop(name)
+        path = self.path_for(name)
+        try:
+            size = os.path.getsize(path)
+            os.remove(path)
+        except FileNotFoundError:
+            return 0
+        return size
+
+    def _evict(self):
+        while self._total > self.max_bytes and len(self._index) > 1:
+            name, size = self._index.popitem(last=False)
+            self._total -= size
+            try:
+                os.remove(self.path_for(name))
+            except OSError:
+                pass
+
+    def stats(self):
+        with self._lock:
+            if self._index is None:
+                self._load()
+            return {'files': len(self._index), 'bytes': self._total, 'max_bytes': self.max_bytes}
+
+resize_cache = DiskLRUCache(RESIZE_CACHE_DIR, RESIZE_CACHE_MAX_BYTES)
+
+_inflight_lock = threading.Lock()
+_inflight = {}
+
+def _variant_lock(name):
+    with _inflight_lock:
+        lock = _inflight.get(name)
+        if lock is None:
+            lock = _inflight[name] = [threading.Lock(), 0]
+        lock[1] += 1
+        return lock
+
+def _release_variant_lock(name, lock):
+    with _inflight_lock:
+        lock[1] -= 1
+        if lock[1] == 0:
+            _inflight.pop(name, None)
+
+def parse_resize_params(width, fmt, quality):
+    """Validate query parameters against the whitelists (raises ValueError)"""
+    try:
+        width = int(width)
+    except (TypeError, ValueError):
+        raise ValueError(f"w must be one of {', '.join(str(w) for w in RESIZE_ALLOWED_WIDTHS)}")
+    if width not in RESIZE_ALLOWED_WIDTHS:
+        raise ValueError(f"w must be one of {', '.join(str(w) for w in RESIZE_ALLOWED_WIDTHS)}")
+
+    fmt = (fmt or DEFAULT_FORMAT).lower()
+    if fmt not in OUTPUT_FORMATS:
+        raise ValueError(f"fmt must be one of {', '.join(OUTPUT_FORMATS)}")
+
+    if quality in (None, ''):
+        quality = DEFAULT_QUALITY
+    else:
+        try:
+            quality = int(quality)
+        except ValueError:
+            raise ValueError("q must be a number")
+        # Snap to the nearest allowed quality so the cache can't be blown up
+        quality = min(ALLOWED_QUALITIES, key=lambda allowed: abs(allowed - quality))
+
+    return width, fmt, quality
+
+def variant_prefix(filename):
+    """Start of every cached variant name of an original (lets deletes and GC find them)"""
+    return f"{hashlib.sha1(filename.encode('utf-8')).hexdigest()[:12]}-"
+
+def purge_variants(filenames):
+    """Drop the cached variants of deleted originals - returns the bytes freed"""
+    prefixes = tuple(variant_prefix(filename) for filename in filenames)
+    if not prefixes:
+        return 0
+    try:
+        names = [name for name in os.listdir(RESIZE_CACHE_DIR) if name.startswith(prefixes)]
+    except FileNotFoundError:
+        return 0
+    return sum(resize_cache.discard(name) for name in names)
+
+def _variant_name(filename, stat, width, fmt, quality):
+    """Cache file name - changes when the original is replaced; one per distinct encoding"""
+    pil_format = OUTPUT_FORMATS[fmt][0]
+    if pil_format in LOSSLESS_FORMATS:
+        quality = None
+    key = f"{filename}|{stat.st_mtime_ns}|{stat.st_size}|{width}|{pil_format}|{quality}"
+    digest = hashlib.sha1(key.encode('utf-8')).hexdigest()[:20]
+    return f"{variant_prefix(filename)}{digest}{OUTPUT_FORMATS[fmt][2]}"
+
+def _encode_variant(source_path, target_path, width, fmt, quality):
+    """Resize (never upscale) and re-encode an original"""
+    pil_format = OUTPUT_FORMATS[fmt][0]
+    with PILImage.open(source_path) as img:
+        img.draft('RGB', (width, width))
+        working = ImageOps.exif_transpose(img)
+        if working.size[0] > width:
+            height = max(1, round(working.size[1] * width / working.size[0]))
+            working = working.resize((width, height), PILImage.LANCZOS)
+
+        if pil_format == 'JPEG' and working.mode not in ('RGB', 'L'):
+            working = working.convert('RGB')
+        elif pil_format == 'WEBP' and working.mode not in ('RGB', 'RGBA'):
+            working = working.convert('RGBA' if 'A' in working.mode else 'RGB')
+
+        save_kwargs = {}
+        if pil_format == 'JPEG':
+            save_kwargs = {'quality': quality, 'optimize': True, 'progressive': True}
+        elif pil_format == 'WEBP':
+            save_kwargs = {'quality': quality, 'method': 4}
+        elif pil_format == 'PNG':
+            save_kwargs = {'optimize': True}
+
+        temp_path = f"{target_path}.{threading.get_ident()}.tmp"
+        try:
+            working.save(temp_path, pil_format, **save_kwargs)
+            os.replace(temp_path, target_path)
+        except Exception:
+            # The LRU never sees temp files - don't leave a partial one behind
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+
+def get_resized_image(filename, width, fmt=None, quality=None):
+    """
+    Path and mimetype of a resized variant, encoding it on first request
+    Raises ValueError for bad parameters and FileNotFoundError for unknown images
+    """
+    width, fmt, quality = parse_resize_params(width, fmt, quality)
+
+    source_path = safe_join(PHOTOGRAPHY_ASSETS_DIR, filename)
+    if source_path is None or not os.path.isfile(source_path):
+        raise FileNotFoundError(filename)
+
+    name = _variant_name(filename, os.stat(source_path), width, fmt, quality)
+    mimetype = OUTPUT_FORMATS[fmt][1]
+
+    cached = resize_cache.get(name)
+    if cached:
+        return cached, mimetype
+
+    # Only one encoder per variant - concurrent requests wait for it
+    lock = _variant_lock(name)
+    try:
+        with lock[0]:
+            cached = resize_cache.get(name)
+            if cached:
+                return cached, mimetype
+
+            os.makedirs(RESIZE_CACHE_DIR, exist_ok=True)
+            target_path = resize_cache.path_for(name)
+            _encode_variant(source_path, target_path, width, fmt, quality)
+            resize_cache.add(name, os.path.getsize(target_path))
+            return target_path, mimetype
+    finally:
+        _release_variant_lock(name, lock)
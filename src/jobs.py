@@ -0,0 +1,145 @@
+"""
+Background Job Queue for Mind's Eye Photography
+In-process worker threads backed by the SQLite jobs table, so queued work
+(upload post-processing etc.) survives restarts and deploys
+"""
+import json
+import threading
+import traceback
+from datetime import datetime, timedelta
+from sqlalchemy import update
+from src.models import db, Job
+from src.config import JOB_WORKERS, JOB_MAX_ATTEMPTS
+
+POLL_INTERVAL = 5  # Seconds between checks when nobody signals new work
+FINISHED_JOB_RETENTION_DAYS = 7
+
+_handlers = {}
+_wakeup = threading.Event()
+_workers = []
+_start_lock = threading.Lock()
+
+def job_handler(job_type):
+    """Register a function(payload) as the handler for a job type"""
+    def decorator(func):
+        _handlers[job_type] = func
+        return func
+    return decorator
+
+def enqueue(job_type, payload=None, batch_id=None):
+    """
+    Add a job to the current session - it runs once the caller commits,
+    so jobs are never visible for rows that were rolled back
+    """
+    job = Job(job_type=job_type, payload=json.dumps(payload or {}), batch_id=batch_id, status='pending')
+    db.session.add(job)
+    return job
+
+def notify_workers():
+    """Wake idle workers (call after committing new jobs)"""
+    _wakeup.set()
+
+def _claim_next_job():
+    """Atomically move the oldest pending job to running (None if idle)"""
+    while True:
+        job_id = db.session.query(Job.id).filter_by(status='pending').order_by(Job.id).limit(1).scalar()
+        if job_id is None:
+            return None
+        result = db.session.execute(
+            update(Job)
+            .where(Job.id == job_id, Job.status == 'pending')
+            .values(status='running', started_date=datetime.utcnow(), attempts=Job.attempts + 1)
+        )
+        db.session.commit()
+        if result.rowcount == 1:
+            return db.session.get(Job, job_id)
+        # Another worker claimed it first - try the next one
+
+def _run_job(job):
+    handler = _handlers.get(job.job_type)
+    job_id, job_type = job.id, job.job_type
+    try:
+        if handler is None:
+            raise ValueError(f"No handler registered for job type '{job_type}'")
+        handler(json.loads(job.payload) if job.payload else {})
+        job = db.session.get(Job, job_id)
+        job.status = 'done'
+        job.error = None
+        job.finished_date = datetime.utcnow()
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        job = db.session.get(Job, job_id)
+        job.error = str(e)
+        if job.attempts >= JOB_MAX_ATTEMPTS:
+            job.status = 'failed'
+            job.finished_date = datetime.utcnow()
+            print(f"❌ Job {job_id} ({job_type}) failed: {e}")
+            print(traceback.format_exc())
+        else:
+            job.status = 'pending'
+            print(f"⚠️  Job {job_id} ({job_type}) error, will retry: {e}")
+        db.session.commit()
+
+def _worker_loop(app):
+    while True:
+        try:
+            with app.app_context():
+                job = _claim_next_job()
+                if job is not None:
+                    _run_job(job)
+                    continue
+        except Exception as e:
+            print(f"❌ Job worker error: {e}")
+        _wakeup.wait(POLL_INTERVAL)
+        _wakeup.clear()
+
+def reset_interrupted_jobs():
+    """Jobs left running by a previous process go back to pending"""
+    count = Job.query.filter_by(status='running').update({'status': 'pending'})
+    db.session.commit()
+    if count:
+        print(f"🔄 Re-queued {count} interrupted job(s)")
+    return count
+
+def prune_finished_jobs(days=FINISHED_JOB_RETENTION_DAYS):
+    """Delete completed jobs older than the retention window (failed ones are kept)"""
+    cutoff = datetime.utcnow() - timedelta(days=days)
+    count = Job.query.filter(Job.status == 'done', Job.finished_date < cutoff).delete(synchronize_session=False)
+    db.session.commit()
+    return count
+
+def start_job_workers(app, workers=JOB_WORKERS):
+    """Start the worker threads once per process"""
+    with _start_lock:
+        if _workers:
+            return
+        with app.app_context():
+            reset_interrupted_jobs()
+            prune_finished_jobs()
+        for index in range(workers):
+            thread = threading.Thread(target=_worker_loop, args=(app,), name=f"job-worker-{index}", daemon=True)
+            thread.start()
+            _workers.append(thread)
+        print(f"✅ Started {workers} background job worker(s)")
+
+def get_batch_status(batch_id):
+    """Job counts by status plus the individual jobs of one batch"""
+    jobs = Job.query.filter_by(batch_id=batch_id).order_by(Job.id).all()
+    counts = {'pending': 0, 'running': 0, 'done': 0, 'failed': 0}
+    for job in jobs:
+        counts[job.status] = counts.get(job.status, 0) + 1
+    return {
+        'batch_id': batch_id,
+        'counts': counts,
+        'total': len(jobs),
+        'complete': counts['pending'] == 0 and counts['running'] == 0,
+        'jobs': [job.to_dict() for job in jobs]
+    }
+
+def get_queue_status():
+    """Job counts by status across the whole queue"""
+    rows = db.session.query(Job.status, db.func.count(Job.id)).group_by(Job.status).all()
+    counts = {'pending': 0, 'running': 0, 'done': 0, 'failed': 0}
+    counts.update({status: count for status, count in rows})
+    return counts
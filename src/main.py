@@ -8,106 +8,16 @@ import json
 # DON'T CHANGE THIS !!!
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
-from flask import Flask, send_from_directory, request, jsonify
-from flask_cors import CORS
-from src.models import db, Image, Category, ImageCategory, SystemConfig, init_default_categories, init_system_config, migrate_existing_images
-from src.routes.user import user_bp
-from src.routes.contact import contact_bp
-from src.routes.admin import admin_bp
-from src.routes.background import background_bp
-from src.routes.featured_image import featured_bp
-from src.routes.portfolio_management import portfolio_mgmt_bp
-from src.routes.category_management import category_mgmt_bp
-from src.routes.debug_migration import debug_migration_bp
-from src.routes.backup_system import backup_system_bp
-from src.routes.og_image import og_bp
-from src.routes.cleanup_api import cleanup_bp
-from src.routes.about_management import about_mgmt_bp
-from src.routes.slideshow_api import slideshow_api_bp  # Simple slideshow API (Option 1)
-from src.routes.enhanced_background import enhanced_bg_bp
-# from src.routes.slideshow_manager import slideshow_bp as slideshow_manager_bp  # Temporarily disabled for deployment fix
-# from src.routes.contact_form import contact_bp  # Temporarily disabled
+from flask import send_from_directory, request, jsonify
+from src.models import db, Image, Category, ImageCategory, SystemConfig
+from src.app_factory import create_app
 
 # Import configuration
 from src.config import PHOTOGRAPHY_ASSETS_DIR
 
-app = Flask(__name__, static_folder=os.path.join(os.path.dirname(__file__), 'static'))
-app.config['SECRET_KEY'] = 'asdf#FGSgvasgf$5$WGT'
-
-# Enable CORS for all routes and origins
-CORS(app, origins="*", methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"], 
-     allow_headers=["Content-Type", "Authorization", "Access-Control-Allow-Credentials"])
-
-# Ensure photography assets directory exists
-os.makedirs(PHOTOGRAPHY_ASSETS_DIR, exist_ok=True)
-
-app.register_blueprint(user_bp, url_prefix='/api')
-app.register_blueprint(contact_bp)
-app.register_blueprint(admin_bp)
-app.register_blueprint(background_bp)
-app.register_blueprint(featured_bp)
-app.register_blueprint(category_mgmt_bp)
-app.register_blueprint(debug_migration_bp)
-app.register_blueprint(backup_system_bp)
-app.register_blueprint(og_bp)
-app.register_blueprint(cleanup_bp)
-app.register_blueprint(about_mgmt_bp)
-app.register_blueprint(slideshow_api_bp)  # Simple slideshow API (Option 1)
-app.register_blueprint(enhanced_bg_bp)
-# Import and register the slideshow fix blueprint
-from src.routes.slideshow_fix import slideshow_fix_bp
-app.register_blueprint(slideshow_fix_bp)  # New slideshow fix
-# app.register_blueprint(slideshow_manager_bp)  # Temporarily disabled for deployment fix
-# app.register_blueprint(portfolio_mgmt_bp)  # Removed - redundant with admin dashboard
-# app.register_blueprint(contact_bp)  # Temporarily disabled
-
-# Database configuration - Use persistent volume for database
-database_path = os.path.join(PHOTOGRAPHY_ASSETS_DIR, 'mindseye.db')
-app.config['SQLALCHEMY_DATABASE_URI'] = f"sqlite:///{database_path}"
-app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
-
-# Initialize database
-db.init_app(app)
-with app.app_context():
-    db.create_all()
-    
-    # Only initialize defaults if database is empty (first run)
-    if Category.query.count() == 0:
-        print("🔄 Empty database detected - initializing default categories...")
-        init_default_categories()
-    else:
-        print(f"✅ Database has {Category.query.count()} categories - skipping initialization")
-    
-    # Only initialize system config if empty
-    if SystemConfig.query.count() == 0:
-        print("🔄 Initializing system configuration...")
-        init_system_config()
-    else:
-        print(f"✅ System config exists - skipping initialization")
-    
-    # Add slideshow column if it doesn't exist
-    try:
-        # Test if the column exists by trying to query it
-        db.session.execute(db.text("SELECT is_slideshow_background FROM images LIMIT 1"))
-        print("✅ Slideshow column already exists")
-    except Exception as e:
-        print("🔄 Adding slideshow column to images table...")
-        try:
-            db.session.execute(db.text("ALTER TABLE images ADD COLUMN is_slideshow_background BOOLEAN DEFAULT FALSE"))
-            db.session.commit()
-            print("✅ Slideshow column added successfully")
-        except Exception as alter_error:
-            print(f"❌ Failed to add slideshow column: {alter_error}")
-            db.session.rollback()
-    
-    # Only migrate images if no images exist in database
-    if Image.query.count() == 0:
-        print("🔄 No images in database - running migration...")
-        migrate_existing_images()
-    else:
-        print(f"✅ Database has {Image.query.count()} images - skipping migration")
-    
-    print("✅ SQL Database initialization complete")
+# Configured app - no database work at import time. Run `python manage.py init`
+# once per deploy to create tables/apply migrations (see app_factory)
+app = create_app()
 
 @app.route('/assets/about/<filename>')
 def serve_about_image(filename):
@@ -166,32 +76,47 @@ def serve_photography_assets(filename):
             return send_from_directory(old_assets_dir, filename)
         return f"Image not found. Checked: {PHOTOGRAPHY_ASSETS_DIR}/{filename} and {old_assets_dir}/{filename}", 404
 
+@app.route('/img/<path:filename>')
+def serve_resized_image(filename):
+    """Serve a resized variant of an original, e.g. /img/photo.jpg?w=800&fmt=webp&q=80"""
+    from flask import send_file
+    from src.image_resizer import get_resized_image
+    try:
+        path, mimetype = get_resized_image(
+            filename, request.args.get('w'), request.args.get('fmt'), request.args.get('q')
+        )
+    except ValueError as e:
+        return f"Invalid resize request: {e}", 400
+    except FileNotFoundError:
+        return f"Image not found: {filename}", 404
+    except Exception as e:
+        print(f"❌ Error resizing {filename}: {e}")
+        return "Error resizing image", 500
+    # Variant names change with the original, so browsers may keep them a while
+    return send_file(path, mimetype=mimetype, conditional=True, max_age=86400)
+
 @app.route('/api/portfolio')
 def get_portfolio():
     """API endpoint to get portfolio data from SQL database"""
     try:
-        # Import models properly - same as admin
-        from src.models import Image, Category, ImageCategory, db
+        from src.portfolio_serializer import load_images_with_categories, get_category_names
         
-        # Use same query method as admin - Image.query.all()
-        images = Image.query.all()
+        # Images + categories in a constant number of queries
+        images = load_images_with_categories()
         portfolio_data = []
         
         print(f"Found {len(images)} images in database")  # Debug log
         
         for image in images:
-            # Get categories for this image - same as admin
-            image_categories = [cat.category.name for cat in image.categories]
-            
             portfolio_item = {
                 'id': str(image.id),  # Convert UUID to string
                 'title': image.title or f"Image {image.id}",
                 'description': image.description or "",
                 'image': image.filename,  # Frontend expects 'image' field
-                'categories': image_categories,
+                'categories': get_category_names(image),
                 'metadata': {
-                    'created_at': image.created_at.isoformat() if image.created_at else None,
-                    'updated_at': image.updated_at.isoformat() if image.updated_at else None
+                    'created_at': image.upload_date.isoformat() if image.upload_date else None,
+                    'updated_at': None
                 }
             }
             portfolio_data.append(portfolio_item)
@@ -207,22 +132,15 @@ def get_portfolio():
 
 @app.route('/api/categories')
 def get_categories():
-    """API endpoint to get all categories"""
+    """API endpoint to get all categories with image counts"""
     try:
-        from src.models import Category
-        
-        categories = Category.query.all()
-        categories_data = []
-        
-        for category in categories:
-            category_item = {
-                'id': str(category.id),
-                'name': category.name,
-                'image_count': len(category.image_categories)
-            }
-            categories_data.append(category_item)
+        from src.category_summary import build_public_categories
+        from src.response_cache import cached_json_response
         
-        return jsonify(categories_data)
+        # One GROUP BY query, cached until the next catalog write
+        response = cached_json_response('public_categories', build_public_categories)
+        response.headers.add('Access-Control-Allow-Origin', '*')
+        return response
         
     except Exception as e:
         print(f"Error loading categories from database: {e}")
@@ -388,49 +306,16 @@ def debug_database():
 
 @app.route('/api/portfolio-new')
 def get_portfolio_new():
-    """BRAND NEW portfolio endpoint - exact copy of working debug code"""
+    """Public portfolio endpoint used by the React portfolio pages"""
     try:
-        # EXACT SAME CODE AS WORKING DEBUG ENDPOINT
-        from src.models import Image
+        from src.portfolio_serializer import build_public_portfolio
+        from src.response_cache import cached_json_response
         
-        # Test getting all images - EXACT SAME AS DEBUG
-        all_images = Image.query.all()
-        
-        portfolio_data = []
+        # Pre-serialized payload, rebuilt only after an admin write;
+        # answers 304 when the client's ETag is still current
+        response = cached_json_response('public_portfolio', build_public_portfolio)
         
-        for image in all_images:
-            try:
-                # Get actual categories for this image - SAME AS ADMIN
-                image_categories = []
-                try:
-                    image_categories = [cat.category.name for cat in image.categories]
-                except Exception as cat_error:
-                    print(f"Category error for image {image.id}: {cat_error}")
-                    image_categories = ['Miscellaneous']
-                
-                # If no categories assigned, use Miscellaneous
-                if not image_categories:
-                    image_categories = ['Miscellaneous']
-                
-                # Create portfolio item with React-expected format
-                portfolio_item = {
-                    'id': str(image.id),
-                    'title': image.title or f"Image {image.id}",
-                    'description': image.description or "",
-                    'filename': image.filename,
-                    'url': f"https://minds-eye-master-production.up.railway.app/static/assets/{image.filename}",  # PERSISTENT VOLUME!
-                    'categories': image_categories,  # ACTUAL CATEGORIES FROM DATABASE
-                    'metadata': {
-                        'created_at': image.upload_date.isoformat() if image.upload_date else None
-                    }
-                }
-                portfolio_data.append(portfolio_item)
-                
-            except Exception as img_error:
-                continue
-        
-        # Create response with CORS headers
-        response = jsonify(portfolio_data)
+        # Add CORS headers
         response.headers.add('Access-Control-Allow-Origin', '*')
         response.headers.add('Access-Control-Allow-Headers', 'Content-Type,Authorization')
         response.headers.add('Access-Control-Allow-Methods', 'GET,PUT,POST,DELETE,OPTIONS')
@@ -438,6 +323,7 @@ def get_portfolio_new():
         return response
         
     except Exception as e:
+        print(f"PORTFOLIO API ERROR: {e}")
         # Return empty array with CORS headers on error
         response = jsonify([])
         response.headers.add('Access-Control-Allow-Origin', '*')
@@ -446,56 +332,60 @@ def get_portfolio_new():
         
         return response, 500
 
+@app.route('/api/portfolio/page')
+def get_portfolio_page():
+    """Paginated public portfolio - ?category=&limit=&cursor=&q= (next page: cursor=next_cursor)"""
+    from src.portfolio_serializer import build_portfolio_page, PAGE_SIZE
+    from src.response_cache import conditional_json_response, serialize_json, get_catalog_version
+    
+    try:
+        limit = int(request.args.get('limit', PAGE_SIZE))
+    except ValueError:
+        return jsonify({'success': False, 'message': 'limit must be a number'}), 400
+    
+    try:
+        page = build_portfolio_page(
+            category=request.args.get('category'),
+            cursor=request.args.get('cursor'),
+            limit=limit,
+            search=request.args.get('q', '').strip() or None
+        )
+    except ValueError as e:
+        return jsonify({'success': False, 'message': str(e)}), 400
+    
+    page['catalog_version'] = get_catalog_version()
+    response = conditional_json_response(serialize_json(page))
+    response.headers.add('Access-Control-Allow-Origin', '*')
+    return response
+
+@app.route('/api/search')
+def search_portfolio():
+    """Ranked full-text search - ?q=&limit=&category= (results carry <mark> highlights)"""
+    from src.search_index import search_images, SEARCH_LIMIT
+    
+    try:
+        limit = int(request.args.get('limit', SEARCH_LIMIT))
+    except ValueError:
+        return jsonify({'success': False, 'message': 'limit must be a number'}), 400
+    
+    results = search_images(request.args.get('q', ''), limit=limit,
+                            category=request.args.get('category') or None)
+    response = jsonify(results)
+    response.headers.add('Access-Control-Allow-Origin', '*')
+    return response
+
 @app.route('/assets/portfolio-data')
 def get_portfolio_data():
-    """API endpoint that React frontend actually calls - USING EXACT DEBUG CODE"""
+    """API endpoint that React frontend actually calls - same payload as /api/portfolio-new"""
     try:
-        # EXACT SAME CODE AS DEBUG ENDPOINT THAT WORKS
-        from src.models import Image
-        
-        # Test getting all images - EXACT SAME AS DEBUG
-        all_images = Image.query.all()
-        print(f"PORTFOLIO API: Total images retrieved = {len(all_images)}")
-        
-        portfolio_data = []
-        
-        for image in all_images:
-            try:
-                # Get actual categories for this image - SAME AS ADMIN
-                image_categories = []
-                try:
-                    image_categories = [cat.category.name for cat in image.categories]
-                except Exception as cat_error:
-                    print(f"Category error for image {image.id}: {cat_error}")
-                    image_categories = ['Miscellaneous']
-                
-                # If no categories assigned, use Miscellaneous
-                if not image_categories:
-                    image_categories = ['Miscellaneous']
-                
-                # Create portfolio item with React-expected format
-                portfolio_item = {
-                    'id': str(image.id),
-                    'title': image.title or f"Image {image.id}",
-                    'description': image.description or "",
-                    'filename': image.filename,
-                    'url': f"https://minds-eye-master-production.up.railway.app/static/assets/{image.filename}",  # PERSISTENT VOLUME!
-                    'categories': image_categories,  # ACTUAL CATEGORIES FROM DATABASE
-                    'metadata': {
-                        'created_at': image.upload_date.isoformat() if image.upload_date else None
-                    }
-                }
-                portfolio_data.append(portfolio_item)
-                print(f"PORTFOLIO API: Added image {image.filename}")
-                
-            except Exception as img_error:
-                print(f"PORTFOLIO API: Error processing image {image.id}: {img_error}")
-                continue
+        from src.portfolio_serializer import build_public_portfolio
+        from src.response_cache import cached_json_response
         
-        print(f"PORTFOLIO API: Returning {len(portfolio_data)} portfolio items")
+        # Pre-serialized payload, rebuilt only after an admin write;
+        # answers 304 when the client's ETag is still current
+        response = cached_json_response('public_portfolio', build_public_portfolio)
         
-        # Create response with CORS headers
-        response = jsonify(portfolio_data)
+        # Add CORS headers
         response.headers.add('Access-Control-Allow-Origin', '*')
         response.headers.add('Access-Control-Allow-Headers', 'Content-Type,Authorization')
         response.headers.add('Access-Control-Allow-Methods', 'GET,PUT,POST,DELETE,OPTIONS')
@@ -0,0 +1,124 @@
+"""
+Schema Migrations for Mind's Eye Photography
+db.create_all() creates missing tables but never alters existing ones, so
+schema changes for deployed databases live here as numbered steps. Applied
+versions are recorded in the schema_version table; each step runs once, in
+order, at startup. Steps are idempotent so a half-applied step can rerun
+"""
+from datetime import datetime
+from src.models import db
+
+def _columns(table):
+    return {row[1] for row in db.session.execute(db.text(f"PRAGMA table_info({table})"))}
+
+def _create_indexes(indexes):
+    for name, table, columns in indexes:
+        db.session.execute(db.text(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({columns})"))
+
+def _add_image_columns():
+    """Columns added to images after the first deployments (slideshow, derivatives, EXIF, hash)"""
+    additions = {
+        'is_slideshow_background': 'BOOLEAN DEFAULT FALSE',
+        'derivative_widths': 'VARCHAR(64)',
+        'exif_data': 'TEXT',
+        'content_hash': 'VARCHAR(64)',
+    }
+    existing = _columns('images')
+    for column, ddl in additions.items():
+        if column not in existing:
+            print(f"🔄 Adding {column} column to images table...")
+            db.session.execute(db.text(f"ALTER TABLE images ADD COLUMN {column} {ddl}"))
+    _create_indexes([('ix_images_content_hash', 'images', 'content_hash')])
+
+def _add_lookup_indexes():
+    """Indexes for the featured/background/slideshow lookups, catalog ordering and the category join"""
+    _create_indexes([
+        ('ix_images_is_featured', 'images', 'is_featured'),
+        ('ix_images_is_background', 'images', 'is_background'),
+        ('ix_images_slideshow_order', 'images', 'is_slideshow_background, display_order, upload_date'),
+        ('ix_images_display_order', 'images', 'display_order, upload_date, id'),
+        ('ix_images_upload_date', 'images', 'upload_date'),
+        # (image_id, category_id) is already covered by the unique constraint's index
+        ('ix_image_categories_category_image', 'image_categories', 'category_id, image_id'),
+        ('ix_slideshow_background_image_id', 'slideshow_background', 'image_id'),
+    ])
+    # No ANALYZE: sqlite_stat1 only records averages, so the flag indexes (one
+    # featured row among thousands) would look like 50% matches and be skipped
+
+def _add_file_mtime():
+    """Modification time of each original, the index the catalog sync compares against"""
+    if 'file_mtime' not in _columns('images'):
+        db.session.execute(db.text("ALTER TABLE images ADD COLUMN file_mtime BIGINT"))
+
+# SQLAlchemy stores DateTime on SQLite as 'YYYY-MM-DD HH:MM:SS.ffffff'
+_NOW = "strftime('%Y-%m-%d %H:%M:%f000', 'now')"
+_STORED_DATETIME = '[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9] [0-9][0-9]:[0-9][0-9]:[0-9][0-9].[0-9][0-9][0-9][0-9][0-9][0-9]'
+
+def _backfill_sort_keys():
+    """Portfolio pages use (display_order, upload_date, id) as a keyset cursor - no NULLs allowed in it"""
+    db.session.execute(db.text("UPDATE images SET display_order = 0 WHERE display_order IS NULL"))
+    db.session.execute(db.text(f"UPDATE images SET upload_date = {_NOW} WHERE upload_date IS NULL"))
+
+def _normalize_upload_dates():
+    """
+    Rewrite upload dates stored in another text format (e.g. datetime('now')
+    from an earlier backfill) the way SQLAlchemy binds them - SQLite compares
+    them as text, so the cursor bound must have the same shape to be exact
+    """
+    db.session.execute(db.text(
+        f"UPDATE images SET upload_date = strftime('%Y-%m-%d %H:%M:%S', upload_date) || '.000000' "
+        f"WHERE upload_date NOT GLOB '{_STORED_DATETIME}' AND strftime('%s', upload_date) IS NOT NULL"
+    ))
+
+def _add_search_index():
+    """FTS5 index over titles, descriptions, stories and category names (see search_index)"""
+    from src.search_index import create_search_index
+    create_search_index()
+
+# (version, description, step) - append only, never renumber
+MIGRATIONS = [
+    (1, 'images columns added after the first deployments', _add_image_columns),
+    (2, 'lookup, ordering and category join indexes', _add_lookup_indexes),
+    (3, 'images.file_mtime for incremental catalog sync', _add_file_mtime),
+    (4, 'non-NULL portfolio sort keys for keyset pagination', _backfill_sort_keys),
+    (5, 'images_fts full-text search index and sync triggers', _add_search_index),
+    (6, 'upload dates in the format keyset cursors bind', _normalize_upload_dates),
+]
+
+def _ensure_version_table():
+    db.session.execute(db.text(
+        "CREATE TABLE IF NOT EXISTS schema_version ("
+        "version INTEGER PRIMARY KEY, description VARCHAR(255), applied_date DATETIME)"
+    ))
+    db.session.commit()
+
+def get_schema_version():
+    """Highest applied migration (0 for a database that has never been migrated)"""
+    _ensure_version_table()
+    return db.session.execute(db.text("SELECT COALESCE(MAX(version), 0) FROM schema_version")).scalar()
+
+def pending_migrations():
+    current = get_schema_version()
+    return [migration for migration in MIGRATIONS if migration[0] > current]
+
+def run_migrations():
+    """Apply pending migrations in order - returns the versions applied"""
+    applied = []
+    for version, description, step in pending_migrations():
+        print(f"🔄 Applying schema migration {version}: {description}...")
+        try:
+            step()
+            db.session.execute(
+                db.text("INSERT OR IGNORE INTO schema_version (version, description, applied_date) "
+                        "VALUES (:version, :description, :applied_date)"),
+                {'version': version, 'description': description, 'applied_date': datetime.utcnow()}
+            )
+            db.session.commit()
+            applied.append(version)
+        except Exception as e:
+            db.session.rollback()
+            print(f"❌ Schema migration {version} failed: {e}")
+            raise
+    if applied:
+        print(f"✅ Database schema at version {MIGRATIONS[-1][0]}")
+    return applied
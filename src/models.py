@@ -22,19 +22,29 @@ class Image(db.Model):
     filename = db.Column(db.String(255), nullable=False, unique=True)
     title = db.Column(db.String(255), nullable=False)
     description = db.Column(db.Text)
-    upload_date = db.Column(db.DateTime, default=datetime.utcnow)
+    upload_date = db.Column(db.DateTime, default=datetime.utcnow, index=True)
     file_size = db.Column(db.Integer)
     width = db.Column(db.Integer)
     height = db.Column(db.Integer)
-    is_featured = db.Column(db.Boolean, default=False)
-    is_background = db.Column(db.Boolean, default=False)
+    is_featured = db.Column(db.Boolean, default=False, index=True)
+    is_background = db.Column(db.Boolean, default=False, index=True)
     is_slideshow_background = db.Column(db.Boolean, default=False)  # New field for slideshow
     featured_story = db.Column(db.Text)
     display_order = db.Column(db.Integer, default=0)
+    derivative_widths = db.Column(db.String(64))  # Comma separated widths of generated derivatives
+    exif_data = db.Column(db.Text)  # JSON camera info extracted at upload (see image_metadata)
+    content_hash = db.Column(db.String(64), index=True)  # SHA-256 of the original file (duplicate detection)
+    file_mtime = db.Column(db.BigInteger)  # mtime_ns of the original when last cataloged (see catalog_sync)
     
     # Relationships
     categories = db.relationship('ImageCategory', back_populates='image', cascade='all, delete-orphan')
     
+    # Indexes (existing databases get these from src/migrations.py)
+    __table_args__ = (
+        db.Index('ix_images_slideshow_order', 'is_slideshow_background', 'display_order', 'upload_date'),
+        db.Index('ix_images_display_order', 'display_order', 'upload_date', 'id'),
+    )
+    
     def __repr__(self):
         return f'<Image {self.title}>'
     
@@ -74,8 +84,12 @@ class Category(db.Model):
     def __repr__(self):
         return f'<Category {self.name}>'
     
-    def to_dict(self):
-        """Convert to dictionary for JSON serialization"""
+    def to_dict(self, image_count=None):
+        """Convert to dictionary for JSON serialization (pass image_count when listing - see category_summary)"""
+        if image_count is None:
+            image_count = db.session.query(db.func.count(ImageCategory.image_id)).filter(
+                ImageCategory.category_id == self.id
+            ).scalar()
         return {
             'id': self.id,
             'name': self.name,
@@ -83,7 +97,7 @@ class Category(db.Model):
             'color': self.color,
             'display_order': self.display_order,
             'is_default': self.is_default,
-            'image_count': len(self.images)
+            'image_count': image_count
         }
 
 class ImageCategory(db.Model):
@@ -100,7 +114,10 @@ class ImageCategory(db.Model):
     category = db.relationship('Category', back_populates='images')
     
     # Unique constraint
-    __table_args__ = (db.UniqueConstraint('image_id', 'category_id', name='unique_image_category'),)
+    __table_args__ = (
+        db.UniqueConstraint('image_id', 'category_id', name='unique_image_category'),
+        db.Index('ix_image_categories_category_image', 'category_id', 'image_id'),
+    )
     
     def __repr__(self):
         return f'<ImageCategory {self.image_id} -> {self.category_id}>'
@@ -143,6 +160,75 @@ class SystemConfig(db.Model):
         else:
             self.value = str(value)
 
+class Job(db.Model):
+    """Background job (upload post-processing etc.) - see src/jobs.py"""
+    __tablename__ = 'jobs'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    job_type = db.Column(db.String(50), nullable=False)
+    payload = db.Column(db.Text)  # JSON arguments for the handler
+    status = db.Column(db.String(20), nullable=False, default='pending', index=True)  # pending, running, done, failed
+    batch_id = db.Column(db.String(36), index=True)  # Groups the jobs of one upload
+    attempts = db.Column(db.Integer, default=0)
+    error = db.Column(db.Text)
+    created_date = db.Column(db.DateTime, default=datetime.utcnow)
+    started_date = db.Column(db.DateTime)
+    finished_date = db.Column(db.DateTime)
+    
+    def __repr__(self):
+        return f'<Job {self.id} {self.job_type} {self.status}>'
+    
+    def to_dict(self):
+        """Convert to dictionary for JSON serialization"""
+        import json
+        return {
+            'id': self.id,
+            'job_type': self.job_type,
+            'payload': json.loads(self.payload) if self.payload else {},
+            'status': self.status,
+            'batch_id': self.batch_id,
+            'attempts': self.attempts,
+            'error': self.error,
+            'created_date': self.created_date.isoformat() if self.created_date else None,
+            'started_date': self.started_date.isoformat() if self.started_date else None,
+            'finished_date': self.finished_date.isoformat() if self.finished_date else None
+        }
+
+class UploadSession(db.Model):
+    """Resumable chunked upload - see src/routes/chunked_upload.py"""
+    __tablename__ = 'upload_sessions'
+    
+    id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    batch_id = db.Column(db.String(36), index=True)
+    client_key = db.Column(db.String(255), index=True)  # name:size:lastModified from the browser, for resume
+    original_name = db.Column(db.String(255))
+    filename = db.Column(db.String(255), nullable=False)  # Final name on the volume
+    title = db.Column(db.String(255), nullable=False)
+    description = db.Column(db.Text)
+    categories = db.Column(db.Text)  # JSON list of category names
+    total_size = db.Column(db.BigInteger, nullable=False)
+    received_bytes = db.Column(db.BigInteger, default=0)
+    status = db.Column(db.String(20), default='uploading')  # uploading, complete
+    image_id = db.Column(db.String(36))
+    created_date = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_date = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    def __repr__(self):
+        return f'<UploadSession {self.filename} {self.received_bytes}/{self.total_size}>'
+    
+    def to_dict(self):
+        """Convert to dictionary for JSON serialization"""
+        return {
+            'upload_id': self.id,
+            'batch_id': self.batch_id,
+            'original_name': self.original_name,
+            'filename': self.filename,
+            'total_size': self.total_size,
+            'offset': self.received_bytes,
+            'status': self.status,
+            'image_id': self.image_id
+        }
+
 # ============================================================================
 # COMPATIBILITY LAYER FOR EXISTING IMPORTS
 # ============================================================================
@@ -255,10 +341,10 @@ def init_system_config():
 # ============================================================================
 
 def migrate_existing_images():
-    """Migrate existing images from volume to database"""
+    """Migrate existing images from volume to database (see volume_import)"""
     from src.config import PHOTOGRAPHY_ASSETS_DIR
+    from src.volume_import import import_volume_images
     import os
-    from PIL import Image as PILImage
     
     print("🔄 Starting image migration from volume to SQL database...")
     
@@ -266,113 +352,20 @@ def migrate_existing_images():
         print(f"❌ Volume directory not found: {PHOTOGRAPHY_ASSETS_DIR}")
         return
     
-    # Get all image files from volume
-    image_extensions = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp'}
-    image_files = []
-    
-    for file in os.listdir(PHOTOGRAPHY_ASSETS_DIR):
-        file_path = os.path.join(PHOTOGRAPHY_ASSETS_DIR, file)
-        if os.path.isfile(file_path):
-            _, ext = os.path.splitext(file.lower())
-            if ext in image_extensions:
-                image_files.append(file)
-    
-    print(f"📁 Found {len(image_files)} image files in volume")
-    
-    if len(image_files) == 0:
-        print("ℹ️  No images to migrate")
-        return
-    
-    # Get all categories for assignment
-    categories = {cat.name.lower(): cat for cat in Category.query.all()}
-    
-    migrated_count = 0
-    skipped_count = 0
-    
-    for filename in image_files:
-        # Check if image already exists in database
-        existing = Image.query.filter_by(filename=filename).first()
-        if existing:
-            print(f"⏭️  Skipping {filename} (already in database)")
-            skipped_count += 1
-            continue
-        
-        # Get image metadata
-        file_path = os.path.join(PHOTOGRAPHY_ASSETS_DIR, filename)
-        try:
-            with PILImage.open(file_path) as img:
-                width, height = img.size
-            file_size = os.path.getsize(file_path)
-        except Exception as e:
-            print(f"⚠️  Could not get info for {filename}: {e}")
-            width, height, file_size = None, None, os.path.getsize(file_path)
-        
-        # Parse filename for title and categories
-        name_without_ext = os.path.splitext(filename)[0]
-        if '_' in name_without_ext and len(name_without_ext.split('_')[0]) > 30:
-            name_without_ext = '_'.join(name_without_ext.split('_')[1:])
-        
-        title = name_without_ext.replace('-', ' ').replace('_', ' ').title()
-        
-        # Detect categories from filename
-        filename_lower = filename.lower()
-        detected_categories = []
-        
-        category_keywords = {
-            'wildlife': ['bird', 'eagle', 'duck', 'rabbit', 'sparrow', 'blackbird', 'woodpecker', 'starling', 'turkey'],
-            'nature': ['sunset', 'landscape', 'tree', 'forest', 'lake', 'mountain'],
-            'portraits': ['portrait', 'executive', 'headshot'],
-            'events': ['festival', 'disability-festival', 'event', 'celebration'],
-            'miscellaneous': ['zoo', 'skyline', 'madison']
-        }
-        
-        for category, keywords in category_keywords.items():
-            if any(keyword in filename_lower for keyword in keywords):
-                detected_categories.append(category.title())
-        
-        if not detected_categories:
-            detected_categories = ['Miscellaneous']
-        
-        # Create image record
-        image = Image(
-            filename=filename,
-            title=title,
-            description=f"Migrated from volume - {title}",
-            file_size=file_size,
-            width=width,
-            height=height,
-            upload_date=datetime.utcnow()
-        )
-        
-        db.session.add(image)
-        db.session.flush()  # Get the image ID
-        
-        # Assign categories
-        assigned_categories = []
-        for cat_name in detected_categories:
-            category = categories.get(cat_name.lower())
-            if category:
-                image_category = ImageCategory(
-                    image_id=image.id,
-                    category_id=category.id
-                )
-                db.session.add(image_category)
-                assigned_categories.append(cat_name)
-        
-        print(f"✅ Migrated: {filename} -> {title} [{', '.join(assigned_categories)}]")
-        migrated_count += 1
-    
-    # Commit all changes
     try:
-        db.session.commit()
-        print(f"\n🎉 Migration completed successfully!")
-        print(f"   📊 Migrated: {migrated_count} images")
-        print(f"   ⏭️  Skipped: {skipped_count} images (already existed)")
-        print(f"   📁 Total in database: {Image.query.count()} images")
+        stats = import_volume_images(PHOTOGRAPHY_ASSETS_DIR)
     except Exception as e:
         db.session.rollback()
         print(f"❌ Migration failed: {e}")
         raise
+    
+    if stats['found'] == 0:
+        print("ℹ️  No images to migrate")
+        return
+    
+    print(f"\n🎉 Migration completed successfully!")
+    print(f"   📊 Migrated: {stats['imported']} images in {stats['seconds']}s")
+    print(f"   📁 Total in database: {Image.query.count()} images")
 
 
 
@@ -417,7 +410,7 @@ class SlideshowBackground(db.Model):
     __tablename__ = 'slideshow_background'
     
     id = db.Column(db.Integer, primary_key=True)
-    image_id = db.Column(db.String(36), db.ForeignKey('images.id'), nullable=False)
+    image_id = db.Column(db.String(36), db.ForeignKey('images.id'), nullable=False, index=True)
     display_order = db.Column(db.Integer, default=0)
     is_active = db.Column(db.Boolean, default=True)
     created_date = db.Column(db.DateTime, default=datetime.utcnow)
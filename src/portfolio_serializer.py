@@ -0,0 +1,180 @@
+"""
+Portfolio Query & Serialization for Mind's Eye Photography
+Loads images together with their category names in a constant number of
+queries and shapes them for the public API, admin dashboard and managers
+"""
+import json
+import base64
+import threading
+from datetime import datetime
+from sqlalchemy.orm import selectinload, joinedload
+from src.models import db, Image, ImageCategory, Category
+from src.config import PUBLIC_SITE_URL, PHOTOGRAPHY_ASSETS_URL_PREFIX
+from src.derivatives import derivative_payload, thumbnail_url
+
+DEFAULT_CATEGORY = 'Miscellaneous'
+ALL_CATEGORIES = 'All Work'  # Category filter value the React pages use for "no filter"
+PAGE_SIZE = 24
+MAX_PAGE_SIZE = 100
+
+_totals_lock = threading.Lock()
+_totals = {}
+
+def load_images_with_categories(query=None):
+    """
+    Load images with their category links eager-loaded
+    Two queries total (images + categories) regardless of catalog size
+    """
+    if query is None:
+        query = Image.query
+    return query.options(
+        selectinload(Image.categories).joinedload(ImageCategory.category)
+    ).all()
+
+def get_category_names(image, fallback=None):
+    """Category names for an image whose categories were eager-loaded"""
+    names = [link.category.name for link in image.categories if link.category is not None]
+    if not names and fallback:
+        return [fallback]
+    return names
+
+def public_image_url(filename):
+    """Absolute URL for an image on the persistent volume"""
+    return f"{PUBLIC_SITE_URL}{PHOTOGRAPHY_ASSETS_URL_PREFIX}{filename}"
+
+def serialize_public_item(image):
+    """React portfolio format (/api/portfolio-new, /assets/portfolio-data)"""
+    item = {
+        'id': str(image.id),
+        'title': image.title or f"Image {image.id}",
+        'description': image.description or "",
+        'filename': image.filename,
+        'url': public_image_url(image.filename),
+        'width': image.width,
+        'height': image.height,
+        'categories': get_category_names(image, fallback=DEFAULT_CATEGORY),
+        'metadata': {
+            'created_at': image.upload_date.isoformat() if image.upload_date else None
+        }
+    }
+    # Downscaled derivative URLs + srcset for responsive <img>
+    item.update(derivative_payload(image))
+    return item
+
+def serialize_admin_item(image):
+    """Admin dashboard card format"""
+    return {
+        'id': image.id,
+        'filename': image.filename,
+        'title': image.title,
+        'description': image.description,
+        'categories': get_category_names(image),
+        'upload_date': image.upload_date.isoformat() if image.upload_date else None,
+        'file_size': image.file_size,
+        'width': image.width,
+        'height': image.height,
+        'is_slideshow_background': getattr(image, 'is_slideshow_background', False),
+        'thumbnail_url': thumbnail_url(image)
+    }
+
+def serialize_manager_item(image):
+    """Featured/background manager format (expects 'image' field)"""
+    return {
+        'id': image.id,
+        'image': image.filename,
+        'thumbnail_url': thumbnail_url(image),
+        'title': image.title,
+        'description': image.description,
+        'categories': get_category_names(image),
+        'upload_date': image.upload_date.isoformat() if image.upload_date else None,
+    }
+
+def build_public_portfolio():
+    """Full public portfolio list"""
+    return [serialize_public_item(image) for image in load_images_with_categories()]
+
+def build_admin_portfolio():
+    """Full admin dashboard list"""
+    return [serialize_admin_item(image) for image in load_images_with_categories()]
+
+def build_manager_portfolio():
+    """Full featured/background manager list"""
+    return [serialize_manager_item(image) for image in load_images_with_categories()]
+
+def encode_cursor(image):
+    """Opaque cursor pointing just after an image in portfolio order"""
+    key = [image.display_order, image.upload_date.isoformat(), image.id]
+    return base64.urlsafe_b64encode(json.dumps(key).encode('utf-8')).decode('ascii').rstrip('=')
+
+def decode_cursor(cursor):
+    """(display_order, upload_date, id) from encode_cursor() - ValueError if malformed"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        display_order, upload_date, image_id = json.loads(base64.urlsafe_b64decode(padded))
+        return int(display_order), datetime.fromisoformat(upload_date), str(image_id)
+    except (TypeError, ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+def _portfolio_filter(query, category_id, search):
+    if category_id is not None:
+        query = query.filter(db.exists().where(
+            ImageCategory.image_id == Image.id, ImageCategory.category_id == category_id
+        ))
+    if search:
+        from src.search_index import build_match_query, matching_image_ids
+        match = build_match_query(search)
+        if match is None:
+            return query.filter(db.false())
+        query = query.filter(Image.id.in_(matching_image_ids(match)))
+    return query
+
+def _portfolio_total(category_id, search):
+    """Matching image count, cached until the next catalog write"""
+    from src.response_cache import get_catalog_version
+    version = get_catalog_version()
+    key = (category_id, search)
+    with _totals_lock:
+        cached = _totals.get(key)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    total = _portfolio_filter(db.session.query(db.func.count(Image.id)), category_id, search).scalar()
+    with _totals_lock:
+        if len(_totals) > 1000:
+            _totals.clear()
+        _totals[key] = (version, total)
+    return total
+
+def build_portfolio_page(category=None, cursor=None, limit=PAGE_SIZE, search=None):
+    """
+    One page of the public portfolio in (display_order, upload_date, id) order
+    Keyset pagination: the cursor is the last row's sort key, so a page is a
+    range scan of ix_images_display_order however deep the client has paged
+    (with a category filter, each scanned row is one probe of the category index)
+    Returns {'items', 'total', 'next_cursor', 'limit'}
+    """
+    limit = max(1, min(int(limit), MAX_PAGE_SIZE))
+    category_id = None
+    if category and category != ALL_CATEGORIES:
+        category_id = db.session.query(Category.id).filter(
+            db.or_(Category.name == category, Category.display_name == category)
+        ).scalar()
+        if category_id is None:
+            return {'items': [], 'total': 0, 'next_cursor': None, 'limit': limit}
+
+    sort_key = db.tuple_(Image.display_order, Image.upload_date, Image.id)
+    query = _portfolio_filter(Image.query, category_id, search)
+    if cursor:
+        query = query.filter(sort_key > db.tuple_(*decode_cursor(cursor)))
+    # One extra row tells whether another page follows
+    images = load_images_with_categories(
+        query.order_by(Image.display_order, Image.upload_date, Image.id).limit(limit + 1)
+    )
+    has_more = len(images) > limit
+    images = images[:limit]
+
+    return {
+        'items': [serialize_public_item(image) for image in images],
+        'total': _portfolio_total(category_id, search),
+        'next_cursor': encode_cursor(images[-1]) if has_more else None,
+        'limit': limit
+    }
@@ -0,0 +1,123 @@
+"""
+Versioned Response Cache for Mind's Eye Photography
+Keeps pre-serialized JSON payloads in memory, keyed by a version counter
+per data scope ('catalog' for images/categories, 'about' for the About
+page) that every admin write bumps. Cached payloads carry a strong ETag
+and Last-Modified so browsers and CDNs can revalidate with a 304
+"""
+import json
+import hashlib
+import threading
+from datetime import datetime, timezone
+from flask import Response, request
+
+CATALOG_SCOPE = 'catalog'
+ABOUT_SCOPE = 'about'
+
+_lock = threading.Lock()
+_build_locks = {}
+_entries = {}
+_versions = {CATALOG_SCOPE: 0, ABOUT_SCOPE: 0}
+_modified = {
+    CATALOG_SCOPE: datetime.now(timezone.utc).replace(microsecond=0),
+    ABOUT_SCOPE: datetime.now(timezone.utc).replace(microsecond=0),
+}
+
+class CachedPayload:
+    """Serialized JSON body with its validators"""
+    __slots__ = ('version', 'body', 'etag', 'last_modified')
+
+    def __init__(self, version, body, last_modified):
+        self.version = version
+        self.body = body
+        self.etag = compute_etag(body)
+        self.last_modified = last_modified
+
+def get_version(scope=CATALOG_SCOPE):
+    """Current version of a data scope"""
+    return _versions[scope]
+
+def get_catalog_version():
+    """Current catalog version"""
+    return _versions[CATALOG_SCOPE]
+
+def bump_version(scope=CATALOG_SCOPE):
+    """Invalidate cached payloads of a scope - call after every admin write"""
+    with _lock:
+        _versions[scope] += 1
+        _modified[scope] = datetime.now(timezone.utc).replace(microsecond=0)
+        for key in [key for key in _entries if key[0] == scope]:
+            del _entries[key]
+        return _versions[scope]
+
+def bump_catalog_version():
+    """Invalidate cached catalog payloads (images, categories, flags)"""
+    return bump_version(CATALOG_SCOPE)
+
+def bump_about_version():
+    """Invalidate cached About page payloads"""
+    return bump_version(ABOUT_SCOPE)
+
+def serialize_json(data):
+    """Serialize to bytes the same way Flask's jsonify does"""
+    return (json.dumps(data, sort_keys=True, separators=(',', ':')) + '\n').encode('utf-8')
+
+def compute_etag(body):
+    """Strong ETag value derived from the response body"""
+    return hashlib.sha256(body).hexdigest()[:32]
+
+def _build_lock_for(cache_key):
+    with _lock:
+        return _build_locks.setdefault(cache_key, threading.Lock())
+
+def get_cached_payload(key, builder, scope=CATALOG_SCOPE):
+    """
+    Return the CachedPayload for key
+    builder() only runs on a miss; concurrent misses for the same key wait
+    for the first build instead of all hitting the database
+    """
+    cache_key = (scope, key)
+    entry = _entries.get(cache_key)
+    if entry is not None and entry.version == _versions[scope]:
+        return entry
+
+    with _build_lock_for(cache_key):
+        # Another request may have filled the entry while we waited
+        entry = _entries.get(cache_key)
+        version = _versions[scope]
+        if entry is not None and entry.version == version:
+            return entry
+
+        entry = CachedPayload(version, serialize_json(builder()), _modified[scope])
+
+        with _lock:
+            # Only store if no write happened while we were building
+            if version == _versions[scope]:
+                _entries[cache_key] = entry
+        return entry
+
+def get_cached_json(key, builder, scope=CATALOG_SCOPE):
+    """Return serialized JSON bytes for key"""
+    return get_cached_payload(key, builder, scope).body
+
+def json_bytes_response(body, status=200):
+    """Build a JSON response from pre-serialized bytes (skips jsonify)"""
+    return Response(body, status=status, mimetype='application/json')
+
+def conditional_json_response(body, etag=None, last_modified=None):
+    """
+    JSON response with ETag/Last-Modified that answers 304 Not Modified
+    when the request's If-None-Match / If-Modified-Since still match
+    """
+    response = json_bytes_response(body)
+    response.set_etag(etag or compute_etag(body))
+    if last_modified is not None:
+        response.last_modified = last_modified
+    # Allow shared caches to store, but always revalidate
+    response.headers['Cache-Control'] = 'public, no-cache'
+    return response.make_conditional(request)
+
+def cached_json_response(key, builder, scope=CATALOG_SCOPE):
+    """Conditional JSON response served from the versioned cache"""
+    payload = get_cached_payload(key, builder, scope)
+    return conditional_json_response(payload.body, payload.etag, payload.last_modified)
@@ -8,6 +8,10 @@ from werkzeug.utils import secure_filename
 from PIL import Image as PILImage
 from ..models import db, AboutContent, AboutImage
 from ..config import PHOTOGRAPHY_ASSETS_DIR
+from ..response_cache import bump_about_version, cached_json_response, ABOUT_SCOPE
+from ..storage_stats import record_added
+from ..jobs import notify_workers
+from ..asset_gc import enqueue_file_removal
 
 about_mgmt_bp = Blueprint('about_mgmt', __name__)
 
@@ -78,6 +82,7 @@ def update_about_content():
             about_content.content = content
         
         db.session.commit()
+        bump_about_version()
         
         return redirect(url_for('about_mgmt.about_management') + '?message=About content updated successfully!&message_type=success')
         
@@ -124,6 +129,7 @@ def upload_about_image():
         # Save file
         file_path = os.path.join(about_images_dir, filename)
         file.save(file_path)
+        record_added(file_path)
         
         # Get next display order
         max_order = db.session.query(db.func.max(AboutImage.display_order)).scalar() or 0
@@ -138,6 +144,7 @@ def upload_about_image():
         
         db.session.add(about_image)
         db.session.commit()
+        bump_about_version()
         
         return redirect(url_for('about_mgmt.about_management') + f'?message=About image "{title}" uploaded successfully!&message_type=success')
         
@@ -154,14 +161,12 @@ def delete_about_image(image_id):
     try:
         about_image = AboutImage.query.get_or_404(image_id)
         
-        # Delete file
-        file_path = os.path.join(PHOTOGRAPHY_ASSETS_DIR, 'about', about_image.filename)
-        if os.path.exists(file_path):
-            os.remove(file_path)
-        
-        # Delete database record
+        # Delete database record; the file is removed by a job committed with it
         db.session.delete(about_image)
+        enqueue_file_removal(about=[about_image.filename])
         db.session.commit()
+        notify_workers()
+        bump_about_version()
         
         return redirect(url_for('about_mgmt.about_management') + f'?message=About image deleted successfully!&message_type=success')
         
@@ -169,25 +174,30 @@ def delete_about_image(image_id):
         db.session.rollback()
         return redirect(url_for('about_mgmt.about_management') + f'?message=Delete failed: {str(e)}&message_type=error')
 
+def build_about_payload():
+    """About page content and images"""
+    about_content = AboutContent.query.first()
+    about_images = AboutImage.query.order_by(AboutImage.display_order, AboutImage.upload_date).all()
+    
+    return {
+        'success': True,
+        'content': about_content.content if about_content else '',
+        'images': [{
+            'id': img.id,
+            'filename': img.filename,
+            'title': img.title,
+            'description': img.description,
+            'image_url': img.image_url,
+            'display_order': img.display_order
+        } for img in about_images]
+    }
+
 @about_mgmt_bp.route('/api/about-content')
 def get_about_content():
     """API endpoint to get about content"""
     try:
-        about_content = AboutContent.query.first()
-        about_images = AboutImage.query.order_by(AboutImage.display_order, AboutImage.upload_date).all()
-        
-        return jsonify({
-            'success': True,
-            'content': about_content.content if about_content else '',
-            'images': [{
-                'id': img.id,
-                'filename': img.filename,
-                'title': img.title,
-                'description': img.description,
-                'image_url': img.image_url,
-                'display_order': img.display_order
-            } for img in about_images]
-        })
+        # Built once per About version, revalidated with ETag/Last-Modified
+        return cached_json_response('about_content', build_about_payload, scope=ABOUT_SCOPE)
         
     except Exception as e:
         return jsonify({
@@ -3,9 +3,15 @@ import json
 import uuid
 import os
 from datetime import datetime
-from flask import Blueprint, request, render_template_string, redirect, url_for, session, flash
+from flask import Blueprint, request, render_template_string, redirect, url_for, session, flash, jsonify
 from werkzeug.utils import secure_filename
 from ..config import PHOTOGRAPHY_ASSETS_DIR, PORTFOLIO_DATA_FILE, CATEGORIES_CONFIG_FILE, get_image_url
+from ..response_cache import bump_catalog_version
+from ..asset_gc import enqueue_file_removal
+from ..jobs import notify_workers, get_batch_status, get_queue_status
+from ..image_jobs import enqueue_image_processing, UPLOAD_JOB_TYPES
+from ..dedup import save_stream_with_hash, find_image_by_hash, link_categories
+from ..storage_stats import record_added
 
 admin_bp = Blueprint('admin', __name__)
 
@@ -155,28 +161,11 @@ def admin_dashboard():
         return redirect(url_for('admin.admin_login'))
     
     # Load data from SQL database instead of JSON files
-    from ..models import Image, Category
+    from ..models import Category
+    from ..portfolio_serializer import build_admin_portfolio
     
-    # Get all images from database
-    images = Image.query.all()
-    portfolio_data = []
-    
-    for image in images:
-        # Get categories for this image
-        image_categories = [cat.category.name for cat in image.categories]
-        
-        portfolio_data.append({
-            'id': image.id,
-            'filename': image.filename,
-            'title': image.title,
-            'description': image.description,
-            'categories': image_categories,
-            'upload_date': image.upload_date.isoformat() if image.upload_date else None,
-            'file_size': image.file_size,
-            'width': image.width,
-            'height': image.height,
-            'is_slideshow_background': getattr(image, 'is_slideshow_background', False)
-        })
+    # Images + categories in a constant number of queries
+    portfolio_data = build_admin_portfolio()
     
     # Get categories from database
     categories = Category.query.all()
@@ -186,7 +175,8 @@ def admin_dashboard():
                                 portfolio_data=portfolio_data,
                                 available_categories=available_categories,
                                 message=request.args.get('message'),
-                                message_type=request.args.get('message_type', 'success'))
+                                message_type=request.args.get('message_type', 'success'),
+                                batch_id=request.args.get('batch_id'))
 
 @admin_bp.route('/admin/upload', methods=['POST'])
 def admin_upload():
@@ -217,6 +207,11 @@ def admin_upload():
             return redirect(url_for('admin.admin_dashboard') + '?message=Please select at least one image file&message_type=error')
         
         uploaded_count = 0
+        duplicate_count = 0
+        batch_id = str(uuid.uuid4())
+        
+        # Look up the selected categories once for the whole batch
+        selected_categories = Category.query.filter(Category.name.in_(categories)).all()
         
         # Process each image file
         for image_file in image_files:
@@ -233,29 +228,32 @@ def admin_upload():
                 
                 filename = f"{safe_title}-{unique_id}{file_extension}"
                 
-                # Save file to photography assets directory
+                # Save file to photography assets directory, hashing while writing
                 os.makedirs(PHOTOGRAPHY_ASSETS_DIR, exist_ok=True)
                 final_path = os.path.join(PHOTOGRAPHY_ASSETS_DIR, filename)
-                image_file.save(final_path)
+                temp_path = f"{final_path}.part"
+                content_hash, file_size = save_stream_with_hash(image_file.stream, temp_path)
                 
-                # Get file size and dimensions
-                file_size = os.path.getsize(final_path)
-                try:
-                    from PIL import Image as PILImage
-                    with PILImage.open(final_path) as img:
-                        width, height = img.size
-                except:
-                    width, height = None, None
+                # Same photo uploaded before - link to it instead of storing a second copy
+                existing = find_image_by_hash(content_hash)
+                if existing:
+                    os.remove(temp_path)
+                    link_categories(existing, categories)
+                    duplicate_count += 1
+                    print(f"♻️  Duplicate upload {image_file.filename} linked to {existing.filename}")
+                    continue
+                os.replace(temp_path, final_path)
+                record_added(final_path)
                 
-                # Create new image in database
+                # Create new image in database - dimensions, EXIF and derivatives
+                # are filled in by background jobs (see image_jobs)
                 final_title = f"{title} {uploaded_count + 1}" if len([f for f in image_files if f.filename]) > 1 else title
                 new_image = Image(
                     filename=filename,
                     title=final_title,
                     description=description,
                     file_size=file_size,
-                    width=width,
-                    height=height,
+                    content_hash=content_hash,
                     upload_date=datetime.now()
                 )
                 
@@ -264,20 +262,23 @@ def admin_upload():
                 db.session.flush()  # Get the ID
                 
                 # Add category associations
-                for category_name in categories:
-                    category = Category.query.filter_by(name=category_name).first()
-                    if category:
-                        image_category = ImageCategory(image_id=new_image.id, category_id=category.id)
-                        db.session.add(image_category)
+                for category in selected_categories:
+                    image_category = ImageCategory(image_id=new_image.id, category_id=category.id)
+                    db.session.add(image_category)
                 
+                enqueue_image_processing(new_image.id, batch_id=batch_id, job_types=UPLOAD_JOB_TYPES)
                 uploaded_count += 1
         
-        # Commit all changes
+        # Commit images and their jobs together
         db.session.commit()
+        bump_catalog_version()
+        notify_workers()
         
         # Redirect with success message
         message = f"{uploaded_count} image(s) uploaded successfully!" if uploaded_count > 1 else "Image uploaded successfully!"
-        return redirect(url_for('admin.admin_dashboard') + f'?message={message}&message_type=success')
+        if duplicate_count:
+            message = f"{uploaded_count} image(s) uploaded, {duplicate_count} duplicate(s) linked to existing images"
+        return redirect(url_for('admin.admin_dashboard') + f'?message={message}&message_type=success&batch_id={batch_id}')
         
     except Exception as e:
         db.session.rollback()
@@ -291,7 +292,7 @@ def bulk_delete():
         return redirect(url_for('admin.admin_login'))
     
     try:
-        from ..models import Image, ImageCategory, db
+        from ..bulk_operations import bulk_delete_images
         
         # Get list of image IDs to delete
         image_ids = request.form.getlist('image_ids')
@@ -299,32 +300,10 @@ def bulk_delete():
         if not image_ids:
             return redirect(url_for('admin.admin_dashboard') + '?message=No images selected for deletion&message_type=error')
         
-        deleted_count = 0
-        
-        # Delete each image from database and filesystem
-        for image_id in image_ids:
-            image = Image.query.get(image_id)
-            if image:
-                # Delete image file from filesystem
-                image_path = os.path.join(PHOTOGRAPHY_ASSETS_DIR, image.filename)
-                if os.path.exists(image_path):
-                    try:
-                        os.remove(image_path)
-                        print(f"✅ Deleted image file: {image_path}")
-                    except Exception as e:
-                        print(f"❌ Error deleting image file {image_path}: {e}")
-                
-                # Delete image categories relationships
-                ImageCategory.query.filter_by(image_id=image_id).delete()
-                
-                # Delete image from database
-                db.session.delete(image)
-                deleted_count += 1
-        
-        # Commit all changes
-        db.session.commit()
+        # Rows in one transaction, then the files
+        result = bulk_delete_images(image_ids)
         
-        return redirect(url_for('admin.admin_dashboard') + f'?message={deleted_count} image(s) deleted successfully!&message_type=success')
+        return redirect(url_for('admin.admin_dashboard') + f'?message={result["deleted"]} image(s) deleted successfully!&message_type=success')
         
     except Exception as e:
         print(f"Bulk delete error: {e}")
@@ -338,7 +317,7 @@ def bulk_update_categories():
         return {'success': False, 'message': 'Not authenticated'}, 401
     
     try:
-        from ..models import Image, Category, ImageCategory, db
+        from ..bulk_operations import bulk_set_categories
         
         data = request.get_json()
         image_ids = data.get('image_ids', [])
@@ -350,39 +329,65 @@ def bulk_update_categories():
         if not categories:
             return {'success': False, 'message': 'No categories selected'}
         
-        # Get category objects from database
-        category_objects = Category.query.filter(Category.name.in_(categories)).all()
-        if len(category_objects) != len(categories):
+        try:
+            result = bulk_set_categories(image_ids, categories)
+        except ValueError:
             return {'success': False, 'message': 'Some categories not found'}
         
-        # Update categories for selected images
-        updated_count = 0
-        for image_id in image_ids:
-            image = Image.query.get(image_id)
-            if image:
-                # Clear existing categories for this image
-                ImageCategory.query.filter_by(image_id=image_id).delete()
-                
-                # Add new categories
-                for category in category_objects:
-                    image_category = ImageCategory(image_id=image_id, category_id=category.id)
-                    db.session.add(image_category)
-                
-                updated_count += 1
-        
-        # Commit all changes
-        db.session.commit()
-        
         return {
             'success': True, 
-            'message': f'Updated {updated_count} image(s) with {len(categories)} categories'
+            'message': f'Updated {result["updated"]} image(s) with {len(categories)} categories'
         }
         
     except Exception as e:
-        db.session.rollback()
         print(f"Bulk update error: {e}")
         return {'success': False, 'message': f'Update failed: {str(e)}'}, 500
 
+@admin_bp.route('/admin/api/bulk/categories', methods=['POST'])
+def api_bulk_categories():
+    """JSON bulk API: {image_ids, categories} - replace categories, per-image results"""
+    if 'admin_logged_in' not in session:
+        return {'success': False, 'message': 'Not authenticated'}, 401
+    
+    from ..bulk_operations import bulk_set_categories
+    
+    data = request.get_json(silent=True) or {}
+    image_ids = data.get('image_ids') or []
+    categories = data.get('categories') or []
+    if not isinstance(image_ids, list) or not isinstance(categories, list) or not image_ids or not categories:
+        return {'success': False, 'message': 'image_ids and categories must be non-empty lists'}, 400
+    
+    try:
+        result = bulk_set_categories(image_ids, categories)
+    except ValueError as e:
+        return {'success': False, 'message': str(e)}, 400
+    except Exception as e:
+        print(f"Bulk categories API error: {e}")
+        return {'success': False, 'message': f'Update failed: {str(e)}'}, 500
+    
+    return {'success': True, 'message': f'Updated {result["updated"]} image(s)', **result}
+
+@admin_bp.route('/admin/api/bulk/delete', methods=['POST'])
+def api_bulk_delete():
+    """JSON bulk API: {image_ids} - delete images, per-image results"""
+    if 'admin_logged_in' not in session:
+        return {'success': False, 'message': 'Not authenticated'}, 401
+    
+    from ..bulk_operations import bulk_delete_images
+    
+    data = request.get_json(silent=True) or {}
+    image_ids = data.get('image_ids') or []
+    if not isinstance(image_ids, list) or not image_ids:
+        return {'success': False, 'message': 'image_ids must be a non-empty list'}, 400
+    
+    try:
+        result = bulk_delete_images(image_ids)
+    except Exception as e:
+        print(f"Bulk delete API error: {e}")
+        return {'success': False, 'message': f'Delete failed: {str(e)}'}, 500
+    
+    return {'success': True, 'message': f'Deleted {result["deleted"]} image(s)', **result}
+
 @admin_bp.route('/admin/delete', methods=['POST'])
 def admin_delete():
     """Delete individual image"""
@@ -401,17 +406,15 @@ def admin_delete():
         if not image:
             return redirect(url_for('admin.admin_dashboard') + '?message=Image not found&message_type=error')
         
-        # Delete the image file from photography assets directory
-        image_path = os.path.join(PHOTOGRAPHY_ASSETS_DIR, image.filename)
-        if os.path.exists(image_path):
-            os.remove(image_path)
-        
         # Delete associated category relationships
         ImageCategory.query.filter_by(image_id=image_id).delete()
         
-        # Delete the image record from database
+        # Delete the image record; its files are removed by a job committed with it
         db.session.delete(image)
+        enqueue_file_removal(originals=[image.filename])
         db.session.commit()
+        notify_workers()
+        bump_catalog_version()
         
         return redirect(url_for('admin.admin_dashboard') + '?message=Image deleted successfully!&message_type=success')
         
@@ -447,6 +450,7 @@ def edit_image():
         image.description = description  # Always update description (allow blank)
         
         db.session.commit()
+        bump_catalog_version()
         
         return redirect(url_for('admin.admin_dashboard') + '?message=Image updated successfully!&message_type=success')
         
@@ -482,6 +486,7 @@ def slideshow_toggle():
         # Update the image
         image.is_slideshow_background = is_slideshow
         db.session.commit()
+        bump_catalog_version()
         
         action = "added to" if is_slideshow else "removed from"
         return jsonify({'success': True, 'message': f'Image {action} slideshow successfully'})
@@ -491,6 +496,21 @@ def slideshow_toggle():
         print(f"Slideshow toggle error: {e}")
         return jsonify({'success': False, 'message': f'Error: {str(e)}'}), 500
 
+@admin_bp.route('/admin/jobs/status')
+def job_status():
+    """Background job progress - one upload batch (?batch_id=...) or the whole queue"""
+    if not session.get('admin_logged_in'):
+        return jsonify({'success': False, 'message': 'Not authenticated'}), 401
+    
+    try:
+        batch_id = request.args.get('batch_id')
+        if batch_id:
+            return jsonify({'success': True, **get_batch_status(batch_id)})
+        return jsonify({'success': True, 'counts': get_queue_status()})
+    except Exception as e:
+        print(f"Job status error: {e}")
+        return jsonify({'success': False, 'message': f'Error: {str(e)}'}), 500
+
 # Dashboard HTML template with dynamic categories and multi-image upload
 dashboard_html = '''
 <!DOCTYPE html>
@@ -794,9 +814,15 @@ dashboard_html = '''
     </div>
     {% endif %}
     
+    {% if batch_id %}
+    <div class="message success-message" id="jobStatus" data-batch-id="{{ batch_id }}">
+        Processing uploads...
+    </div>
+    {% endif %}
+    
     <div class="form-container">
         <h2>Manage Your Portfolio</h2>
-        <form method="POST" action="/admin/upload" enctype="multipart/form-data">
+        <form method="POST" action="/admin/upload" enctype="multipart/form-data" id="uploadForm">
             <div class="form-group">
                 <label for="image">Image Files (JPG/PNG) - Select Multiple</label>
                 <input type="file" id="image" name="image" accept="image/*" multiple required>
@@ -830,6 +856,7 @@ dashboard_html = '''
             </div>
             
             <button type="submit">Upload Image(s)</button>
+            <div id="uploadProgress" style="margin-top: 10px; color: #ff6b35;"></div>
         </form>
     </div>
     
@@ -871,7 +898,7 @@ dashboard_html = '''
             {% for item in portfolio_data %}
             <div class="portfolio-item">
                 <input type="checkbox" class="portfolio-checkbox" name="selected_images" value="{{ item.id }}" onchange="updateSelectedCount()">
-                <img src="/static/assets/{{ item.filename }}" alt="{{ item.title }}">
+                <img src="{{ item.thumbnail_url }}" alt="{{ item.title }}" loading="lazy">
                 <div class="portfolio-info">
                     <h3>{{ item.title }}</h3>
                     <p>{{ item.description }}</p>
@@ -922,6 +949,138 @@ dashboard_html = '''
     </div>
     
     <script>
+        // Poll upload post-processing (dimensions, EXIF, thumbnails) until done
+        async function pollJobStatus() {
+            const statusBox = document.getElementById('jobStatus');
+            if (!statusBox) return;
+            try {
+                const response = await fetch('/admin/jobs/status?batch_id=' + encodeURIComponent(statusBox.dataset.batchId));
+                const result = await response.json();
+                if (!result.success) return;
+                const counts = result.counts;
+                if (result.complete) {
+                    statusBox.textContent = counts.failed
+                        ? `Processing finished with ${counts.failed} failed step(s) - reloading...`
+                        : 'Processing complete - reloading...';
+                    const url = new URL(location.href);
+                    url.searchParams.delete('batch_id');
+                    setTimeout(() => location.replace(url.toString()), 1000);
+                    return;
+                }
+                statusBox.textContent = `Processing uploads: ${counts.done + counts.failed} of ${result.total} steps done...`;
+                setTimeout(pollJobStatus, 2000);
+            } catch (error) {
+                console.error('Error polling job status:', error);
+                setTimeout(pollJobStatus, 5000);
+            }
+        }
+        pollJobStatus();
+        
+        // Chunked, resumable upload - large batches survive slow or dropped connections
+        const CHUNK_SIZE = 8 * 1024 * 1024;
+        
+        async function sendJson(url, method, body) {
+            const response = await fetch(url, {
+                method: method,
+                headers: {'Content-Type': 'application/json'},
+                body: body ? JSON.stringify(body) : undefined
+            });
+            const result = await response.json();
+            return {status: response.status, result: result};
+        }
+        
+        async function uploadFileInChunks(file, fields, index, batchSize, batchId, progress) {
+            const init = await sendJson('/admin/upload/chunked/init', 'POST', {
+                filename: file.name,
+                size: file.size,
+                client_key: `${file.name}:${file.size}:${file.lastModified}`,
+                batch_id: batchId,
+                index: index,
+                batch_size: batchSize,
+                title: fields.title,
+                description: fields.description,
+                categories: fields.categories
+            });
+            if (!init.result.success) throw new Error(init.result.message);
+            const uploadId = init.result.upload_id;
+            let offset = init.result.offset;
+            let failures = 0;
+            
+            while (offset < file.size) {
+                const chunk = file.slice(offset, offset + CHUNK_SIZE);
+                try {
+                    const response = await fetch(`/admin/upload/chunked/${uploadId}?offset=${offset}`, {
+                        method: 'PUT',
+                        headers: {'Content-Type': 'application/octet-stream'},
+                        body: chunk
+                    });
+                    const result = await response.json();
+                    if (response.ok || response.status === 409) {
+                        // 409 = server has a different offset; continue from there
+                        offset = result.offset;
+                        failures = 0;
+                        progress(offset);
+                    } else {
+                        throw new Error(result.message);
+                    }
+                } catch (error) {
+                    failures += 1;
+                    if (failures > 8) throw error;
+                    await new Promise(resolve => setTimeout(resolve, Math.min(30000, 1000 * 2 ** failures)));
+                    const status = await sendJson(`/admin/upload/chunked/${uploadId}`, 'GET');
+                    if (status.result.success) offset = status.result.offset;
+                }
+            }
+            
+            const done = await sendJson(`/admin/upload/chunked/${uploadId}/complete`, 'POST', {});
+            if (!done.result.success) throw new Error(done.result.message);
+            return done.result;
+        }
+        
+        const uploadForm = document.getElementById('uploadForm');
+        if (uploadForm && window.fetch && window.Blob && Blob.prototype.slice) {
+            uploadForm.addEventListener('submit', async function(event) {
+                event.preventDefault();
+                const files = Array.from(document.getElementById('image').files);
+                const fields = {
+                    title: document.getElementById('title').value.trim(),
+                    description: document.getElementById('description').value.trim(),
+                    categories: Array.from(uploadForm.querySelectorAll('input[name="categories"]:checked')).map(cb => cb.value)
+                };
+                if (!fields.categories.length) {
+                    alert('Please select at least one category');
+                    return;
+                }
+                
+                const progressBox = document.getElementById('uploadProgress');
+                const submitButton = uploadForm.querySelector('button[type="submit"]');
+                submitButton.disabled = true;
+                
+                const totalBytes = files.reduce((sum, file) => sum + file.size, 0);
+                const batchId = (window.crypto && crypto.randomUUID) ? crypto.randomUUID() : String(Date.now());
+                let finishedBytes = 0;
+                let duplicates = 0;
+                
+                try {
+                    for (let i = 0; i < files.length; i++) {
+                        const result = await uploadFileInChunks(files[i], fields, i, files.length, batchId, (offset) => {
+                            const percent = Math.floor(100 * (finishedBytes + offset) / totalBytes);
+                            progressBox.textContent = `Uploading ${i + 1} of ${files.length} (${percent}%)...`;
+                        });
+                        finishedBytes += files[i].size;
+                        if (result.duplicate) duplicates += 1;
+                    }
+                    let message = files.length > 1 ? `${files.length} image(s) uploaded successfully!` : 'Image uploaded successfully!';
+                    if (duplicates) message = `${files.length - duplicates} image(s) uploaded, ${duplicates} duplicate(s) linked to existing images`;
+                    location.href = `/admin/dashboard?message=${encodeURIComponent(message)}&message_type=success&batch_id=${batchId}`;
+                } catch (error) {
+                    console.error('Upload error:', error);
+                    progressBox.textContent = 'Upload interrupted: ' + error.message + ' - submit again with the same files to resume.';
+                    submitButton.disabled = false;
+                }
+            });
+        }
+        
         function selectAll() {
             const checkboxes = document.querySelectorAll('.portfolio-checkbox');
             checkboxes.forEach(cb => cb.checked = true);
@@ -9,6 +9,7 @@ from flask import Blueprint, request, render_template_string, redirect, url_for,
 from werkzeug.utils import secure_filename
 import uuid
 from ..config import PHOTOGRAPHY_ASSETS_DIR, PORTFOLIO_DATA_FILE, LEGACY_ASSETS_DIR
+from ..response_cache import bump_catalog_version, cached_json_response
 
 background_bp = Blueprint('background', __name__)
 
@@ -50,28 +51,12 @@ def set_background_image(filename):
         json.dump(config, f)
 
 def load_portfolio_data():
-    """Load portfolio data from SQL database - EXACT SAME AS ADMIN DASHBOARD"""
+    """Load portfolio data from SQL database - shared portfolio serializer"""
     try:
-        from ..models import Image, Category
+        from ..portfolio_serializer import build_manager_portfolio
         
-        # Get all images from database - EXACT SAME QUERY
-        images = Image.query.all()
-        portfolio_data = []
-        
-        for image in images:
-            # Get categories for this image
-            image_categories = [cat.category.name for cat in image.categories]
-            
-            portfolio_data.append({
-                'id': image.id,
-                'image': image.filename,  # Background manager expects 'image' fieldd
-                'title': image.title,
-                'description': image.description,
-                'categories': image_categories,
-                'upload_date': image.upload_date.isoformat() if image.upload_date else None,
-            })
-        
-        return portfolio_data
+        # Background manager expects 'image' field
+        return build_manager_portfolio()
     except Exception as e:
         print(f"Error loading portfolio data from SQL: {e}")
     return []
@@ -250,7 +235,7 @@ def background_manager():
                     {% if item.image == current_bg %}
                     <div class="current-indicator">CURRENT</div>
                     {% endif %}
-                    <img src="/static/assets/{{ item.image }}" alt="{{ item.title }}">
+                    <img src="{{ item.thumbnail_url }}" alt="{{ item.title }}" loading="lazy">
                     <div class="info">
                         <h4>{{ item.title }}</h4>
                         <div class="categories">{{ item.get('categories', [item.get('category', 'Unknown')]) | join(', ') }}</div>
@@ -323,6 +308,7 @@ def set_background_from_portfolio():
         if selected_image:
             selected_image.is_background = True
             db.session.commit()
+            bump_catalog_version()
             print(f"✅ Set background to: {image_filename}")
         else:
             print(f"❌ Image not found in database: {image_filename}")
@@ -336,5 +322,5 @@ def set_background_from_portfolio():
 @background_bp.route('/api/background')
 def get_background_api():
     """API endpoint to get current background"""
-    return jsonify({'background_image': get_current_background()})
+    return cached_json_response('background', lambda: {'background_image': get_current_background()})
 
@@ -1,13 +1,16 @@
-from flask import Blueprint, jsonify, send_file, render_template_string, request, redirect, url_for, session
+from flask import Blueprint, jsonify, render_template_string, request, redirect, url_for, session, Response, stream_with_context
 import os
 import json
-import tarfile
-import shutil
 import subprocess
 from datetime import datetime
 from src.models import db, Image, Category, ImageCategory, SystemConfig
 from src.config import PHOTOGRAPHY_ASSETS_DIR
-import tempfile
+from src.portfolio_serializer import load_images_with_categories, get_category_names
+from src.archive_stream import stream_zip, file_entry, temp_file_entry, bytes_entry, directory_entries, is_archivable
+from src.db_backup import DATABASE_PATH, backup_database_to_temp, recent_backup_stats
+from src.snapshots import create_snapshot, list_snapshots, load_manifest, snapshot_archive_entries
+from src.backup_scheduler import get_scheduler_status
+from src.storage_stats import get_storage_stats, reconcile as reconcile_storage_stats
 
 backup_system_bp = Blueprint('backup_system', __name__)
 
@@ -24,39 +27,20 @@ def emergency_backup_download():
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         backup_name = f"emergency_backup_{timestamp}"
         
-        # Create temporary directory for backup
-        with tempfile.TemporaryDirectory() as temp_dir:
-            backup_dir = os.path.join(temp_dir, backup_name)
-            os.makedirs(backup_dir)
-            
+        def entries():
             # Emergency backup - just essentials
-            # 1. Database file
-            db_file = os.path.join(PHOTOGRAPHY_ASSETS_DIR, 'mindseye.db')
-            if os.path.exists(db_file):
-                shutil.copy2(db_file, backup_dir)
+            # 1. Database file (consistent online snapshot, not a raw copy of the live file)
+            if os.path.exists(DATABASE_PATH):
+                yield temp_file_entry(f"{backup_name}/mindseye.db", lambda: backup_database_to_temp()[0])
             
-            # 2. All images
-            if os.path.exists(PHOTOGRAPHY_ASSETS_DIR):
-                for file in os.listdir(PHOTOGRAPHY_ASSETS_DIR):
-                    file_path = os.path.join(PHOTOGRAPHY_ASSETS_DIR, file)
-                    if os.path.isfile(file_path) and not file.endswith('.db'):
-                        shutil.copy2(file_path, backup_dir)
+            # 2. All images, read straight from the volume
+            for name, path in list_volume_files():
+                yield file_entry(f"{backup_name}/{name}", path)
             
             # 3. Emergency restore instructions
-            emergency_instructions = create_emergency_restore_instructions()
-            with open(os.path.join(backup_dir, 'EMERGENCY_RESTORE.txt'), 'w') as f:
-                f.write(emergency_instructions)
-            
-            # 4. Create TAR.GZ file
-            tar_path = os.path.join(temp_dir, f"{backup_name}.tar.gz")
-            with tarfile.open(tar_path, 'w:gz') as tar:
-                tar.add(backup_dir, arcname=backup_name)
-            
-            # Return the TAR.GZ file for download
-            return send_file(tar_path, 
-                           as_attachment=True, 
-                           download_name=f"{backup_name}.tar.gz",
-                           mimetype='application/gzip')
+            yield bytes_entry(f"{backup_name}/EMERGENCY_RESTORE.txt", create_emergency_restore_instructions())
+        
+        return zip_download_response(entries(), f"{backup_name}.zip")
     
     except Exception as e:
         return f"Emergency backup failed: {str(e)}", 500
@@ -77,29 +61,21 @@ def backup_system_dashboard():
     image_count = Image.query.count()
     category_count = Category.query.count()
     
-    # Check volume usage
-    volume_files = []
-    volume_size = 0
-    if os.path.exists(PHOTOGRAPHY_ASSETS_DIR):
-        for file in os.listdir(PHOTOGRAPHY_ASSETS_DIR):
-            file_path = os.path.join(PHOTOGRAPHY_ASSETS_DIR, file)
-            if os.path.isfile(file_path):
-                size = os.path.getsize(file_path)
-                volume_size += size
-                volume_files.append({
-                    'name': file,
-                    'size': size,
-                    'size_mb': round(size / (1024 * 1024), 2)
-                })
+    # Volume usage from precomputed counters (see storage_stats) - no directory walk
+    storage = get_storage_stats()
     
     # Format volume size
-    volume_size_mb = round(volume_size / (1024 * 1024), 2)
+    volume_size_mb = round(storage['total_bytes'] / (1024 * 1024), 2)
     
     return render_template_string(backup_dashboard_html,
                                 image_count=image_count,
                                 category_count=category_count,
-                                volume_files_count=len(volume_files),
+                                volume_files_count=storage['total_files'],
+                                storage=storage,
                                 volume_size_mb=volume_size_mb,
+                                db_backup_stats=list(reversed(recent_backup_stats(limit=10))),
+                                snapshots=list_snapshots(),
+                                scheduler=get_scheduler_status(),
                                 message=request.args.get('message'),
                                 message_type=request.args.get('message_type', 'success'))
 
@@ -110,125 +86,118 @@ def create_manual_backup():
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         backup_name = f"mindseye_backup_{timestamp}"
         
-        # Create temporary directory for backup
-        with tempfile.TemporaryDirectory() as temp_dir:
-            backup_dir = os.path.join(temp_dir, backup_name)
-            os.makedirs(backup_dir)
-            
+        # Export all data to JSON (built up front - the stream itself needs no database)
+        backup_data = build_backup_data(timestamp)
+        volume_files = list_volume_files()
+        project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        stats = {}
+        database_stats = {}
+        
+        def snapshot_database():
+            path, backup_stats = backup_database_to_temp()
+            database_stats.update(backup_stats)
+            return path
+        
+        def entries():
             # 1. Backup database
-            db_backup_path = os.path.join(backup_dir, 'database')
-            os.makedirs(db_backup_path)
-            
-            # Export all data to JSON
-            backup_data = {
-                'timestamp': timestamp,
-                'version': '1.0',
-                'images': [],
-                'categories': [],
-                'system_config': []
-            }
-            
-            # Export images
-            for image in Image.query.all():
-                image_data = {
-                    'id': image.id,
-                    'filename': image.filename,
-                    'title': image.title,
-                    'description': image.description,
-                    'file_size': image.file_size,
-                    'width': image.width,
-                    'height': image.height,
-                    'upload_date': image.upload_date.isoformat() if image.upload_date else None,
-                    'categories': [cat.category.name for cat in image.categories]
-                }
-                backup_data['images'].append(image_data)
-            
-            # Export categories
-            for category in Category.query.all():
-                category_data = {
-                    'id': category.id,
-                    'name': category.name,
-                    'display_order': category.display_order
-                }
-                backup_data['categories'].append(category_data)
-            
-            # Export system config
-            for config in SystemConfig.query.all():
-                config_data = {
-                    'key': config.key,
-                    'value': config.value,
-                    'data_type': config.data_type,
-                    'description': config.description
-                }
-                backup_data['system_config'].append(config_data)
+            yield bytes_entry(f"{backup_name}/database/backup_data.json", json.dumps(backup_data, indent=2))
+            if os.path.exists(DATABASE_PATH):
+                yield temp_file_entry(f"{backup_name}/database/mindseye.db", snapshot_database)
             
-            # Save backup data
-            with open(os.path.join(db_backup_path, 'backup_data.json'), 'w') as f:
-                json.dump(backup_data, f, indent=2)
-            
-            # Copy database file
-            db_file = os.path.join(PHOTOGRAPHY_ASSETS_DIR, 'mindseye.db')
-            if os.path.exists(db_file):
-                shutil.copy2(db_file, os.path.join(db_backup_path, 'mindseye.db'))
-            
-            # 2. Backup images
-            images_backup_path = os.path.join(backup_dir, 'images')
-            os.makedirs(images_backup_path)
-            
-            if os.path.exists(PHOTOGRAPHY_ASSETS_DIR):
-                for file in os.listdir(PHOTOGRAPHY_ASSETS_DIR):
-                    file_path = os.path.join(PHOTOGRAPHY_ASSETS_DIR, file)
-                    if os.path.isfile(file_path) and not file.endswith('.db'):
-                        shutil.copy2(file_path, images_backup_path)
+            # 2. Backup images, read straight from the volume
+            for name, path in volume_files:
+                yield file_entry(f"{backup_name}/images/{name}", path)
             
             # 3. Backup source code
-            code_backup_path = os.path.join(backup_dir, 'source_code')
-            os.makedirs(code_backup_path)
-            
-            # Copy main source files
-            src_dir = os.path.dirname(os.path.dirname(__file__))
             for item in ['src', 'requirements.txt', 'README.md']:
-                src_path = os.path.join(src_dir, item)
-                if os.path.exists(src_path):
-                    if os.path.isdir(src_path):
-                        shutil.copytree(src_path, os.path.join(code_backup_path, item))
-                    else:
-                        shutil.copy2(src_path, code_backup_path)
+                src_path = os.path.join(project_root, item)
+                if os.path.isdir(src_path):
+                    yield from directory_entries(src_path, f"{backup_name}/source_code/{item}")
+                elif os.path.exists(src_path):
+                    yield file_entry(f"{backup_name}/source_code/{item}", src_path)
             
             # 4. Create restore instructions
-            restore_instructions = create_restore_instructions()
-            with open(os.path.join(backup_dir, 'RESTORE_INSTRUCTIONS.md'), 'w') as f:
-                f.write(restore_instructions)
+            yield bytes_entry(f"{backup_name}/RESTORE_INSTRUCTIONS.md", create_restore_instructions())
             
-            # 5. Create backup info
+            # 5. Create backup info (last, so it can report what was archived)
             backup_info = {
                 'backup_name': backup_name,
                 'timestamp': timestamp,
                 'image_count': len(backup_data['images']),
                 'category_count': len(backup_data['categories']),
-                'total_files': len(os.listdir(images_backup_path)) if os.path.exists(images_backup_path) else 0,
-                'backup_size_mb': get_directory_size(backup_dir) / (1024 * 1024)
+                'total_files': len(volume_files),
+                'backup_size_mb': stats.get('bytes', 0) / (1024 * 1024),
+                'skipped_files': stats.get('skipped', []),
+                'database_snapshot': database_stats
             }
-            
-            with open(os.path.join(backup_dir, 'backup_info.json'), 'w') as f:
-                json.dump(backup_info, f, indent=2)
-            
-            # 6. Create TAR.GZ file
-            tar_path = os.path.join(temp_dir, f"{backup_name}.tar.gz")
-            with tarfile.open(tar_path, 'w:gz') as tar:
-                tar.add(backup_dir, arcname=backup_name)
-            
-            # Return the TAR.GZ file for download
-            return send_file(tar_path, 
-                           as_attachment=True, 
-                           download_name=f"{backup_name}.tar.gz",
-                           mimetype='application/gzip')
+            yield bytes_entry(f"{backup_name}/backup_info.json", json.dumps(backup_info, indent=2))
+        
+        return zip_download_response(entries(), f"{backup_name}.zip", stats)
     
     except Exception as e:
         return redirect(url_for('backup_system.backup_system_dashboard', 
                               message=f"Backup failed: {str(e)}", 
                               message_type='error'))
 
+@backup_system_bp.route('/admin/backup/snapshot', methods=['POST'])
+def create_incremental_snapshot():
+    """Incremental snapshot - only new/changed files are copied into the backup store"""
+    if not session.get('admin_logged_in'):
+        return redirect(url_for('admin.admin_login'))
+    
+    try:
+        manifest = create_snapshot(label=request.form.get('label') or 'manual')
+        stats = manifest['stats']
+        message = (f"Snapshot {manifest['id']} created: {stats['new_files']} new, {stats['changed_files']} changed, "
+                   f"{stats['unchanged_files']} unchanged files ({stats['bytes_stored'] / (1024 * 1024):.1f} MB stored "
+                   f"in {stats['duration_seconds']}s)")
+        return redirect(url_for('backup_system.backup_system_dashboard', message=message, message_type='success'))
+    
+    except Exception as e:
+        return redirect(url_for('backup_system.backup_system_dashboard',
+                              message=f"Snapshot failed: {str(e)}",
+                              message_type='error'))
+
+@backup_system_bp.route('/admin/backup/snapshot/<snapshot_id>/download')
+def download_snapshot(snapshot_id):
+    """Download a stored snapshot as a ZIP, assembled from the object store (no new backup is taken)"""
+    if not session.get('admin_logged_in'):
+        return redirect(url_for('admin.admin_login'))
+    
+    manifest = load_manifest(snapshot_id)
+    if manifest is None:
+        return redirect(url_for('backup_system.backup_system_dashboard',
+                              message=f"Snapshot {snapshot_id} not found",
+                              message_type='error'))
+    
+    backup_name = f"mindseye_snapshot_{manifest['id']}"
+    return zip_download_response(snapshot_archive_entries(manifest, backup_name), f"{backup_name}.zip", {})
+
+@backup_system_bp.route('/admin/backup/storage-stats')
+def storage_stats():
+    """Per-area file counts and sizes (JSON) - ?refresh=1 rescans the volume first"""
+    if not session.get('admin_logged_in'):
+        return jsonify({'success': False, 'message': 'Not authenticated'}), 401
+    stats = reconcile_storage_stats() if request.args.get('refresh') == '1' else get_storage_stats()
+    return jsonify({'success': True, **stats})
+
+@backup_system_bp.route('/admin/backup/asset-gc', methods=['GET', 'POST'])
+def asset_gc():
+    """Orphan file collector (JSON) - GET: last run, POST: run now (?dry_run=1 only reports)"""
+    if not session.get('admin_logged_in'):
+        return jsonify({'success': False, 'message': 'Not authenticated'}), 401
+    from ..asset_gc import collect_garbage, get_gc_status
+    if request.method == 'POST':
+        return jsonify({'success': True, **collect_garbage(dry_run=request.args.get('dry_run') == '1')})
+    return jsonify({'success': True, **get_gc_status()})
+
+@backup_system_bp.route('/admin/backup/db-stats')
+def database_backup_stats():
+    """Timing/page counts of recent database snapshots (JSON)"""
+    if not session.get('admin_logged_in'):
+        return jsonify({'success': False, 'message': 'Not authenticated'}), 401
+    return jsonify({'success': True, 'runs': recent_backup_stats(limit=int(request.args.get('limit', 50)))})
+
 @backup_system_bp.route('/admin/backup/github-push', methods=['POST'])
 def github_backup_push():
     """Push current state to GitHub with backup tag"""
@@ -270,14 +239,71 @@ def restore_guide():
     instructions = create_restore_instructions()
     return render_template_string(restore_guide_html, instructions=instructions)
 
-def get_directory_size(directory):
-    """Calculate total size of directory"""
-    total_size = 0
-    for dirpath, dirnames, filenames in os.walk(directory):
-        for filename in filenames:
-            filepath = os.path.join(dirpath, filename)
-            total_size += os.path.getsize(filepath)
-    return total_size
+def list_volume_files():
+    """(name, path) of every top-level file on the volume except the database and its journals"""
+    files = []
+    if os.path.exists(PHOTOGRAPHY_ASSETS_DIR):
+        with os.scandir(PHOTOGRAPHY_ASSETS_DIR) as it:
+            for entry in it:
+                if entry.is_file() and not entry.name.endswith('.db') and is_archivable(entry.name):
+                    files.append((entry.name, entry.path))
+    files.sort()
+    return files
+
+def build_backup_data(timestamp):
+    """Catalog export (images, categories, system config) for backup_data.json"""
+    backup_data = {
+        'timestamp': timestamp,
+        'version': '1.0',
+        'images': [],
+        'categories': [],
+        'system_config': []
+    }
+    
+    # Export images (categories eager-loaded)
+    for image in load_images_with_categories():
+        image_data = {
+            'id': image.id,
+            'filename': image.filename,
+            'title': image.title,
+            'description': image.description,
+            'file_size': image.file_size,
+            'width': image.width,
+            'height': image.height,
+            'upload_date': image.upload_date.isoformat() if image.upload_date else None,
+            'categories': get_category_names(image)
+        }
+        backup_data['images'].append(image_data)
+    
+    # Export categories
+    for category in Category.query.all():
+        category_data = {
+            'id': category.id,
+            'name': category.name,
+            'display_order': category.display_order
+        }
+        backup_data['categories'].append(category_data)
+    
+    # Export system config
+    for config in SystemConfig.query.all():
+        config_data = {
+            'key': config.key,
+            'value': config.value,
+            'data_type': config.data_type,
+            'description': config.description
+        }
+        backup_data['system_config'].append(config_data)
+    
+    return backup_data
+
+def zip_download_response(entries, download_name, stats=None):
+    """Stream a ZIP archive to the client as it is built"""
+    response = Response(stream_with_context(stream_zip(entries, stats)), mimetype='application/zip')
+    response.headers['Content-Disposition'] = f'attachment; filename="{download_name}"'
+    response.headers['Cache-Control'] = 'no-store'
+    # Don't let a reverse proxy buffer the whole archive before forwarding it
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
 
 def create_restore_instructions():
     """Create comprehensive restore instructions"""
@@ -285,10 +311,10 @@ def create_restore_instructions():
 
 ## 🚨 EMERGENCY RESTORE PROCEDURES
 
-### SCENARIO 1: Complete System Restore from Backup TAR.GZ
+### SCENARIO 1: Complete System Restore from Backup ZIP
 
-1. **Download your backup TAR.GZ file** (from manual backup)
-2. **Extract the TAR.GZ file** to a temporary location
+1. **Download your backup ZIP file** (from manual backup)
+2. **Extract the ZIP file** to a temporary location
 3. **Stop the current application** (if running)
 
 #### Restore Database:
@@ -441,6 +467,32 @@ backup_dashboard_html = '''
                     <div>Volume Size (MB)</div>
                 </div>
             </div>
+            <h3>Storage by Area</h3>
+            <table style="width: 100%; text-align: left;">
+                <tr><th>Area</th><th>Files</th><th>Size (MB)</th></tr>
+                {% for area, usage in storage.areas.items() %}
+                <tr>
+                    <td>{{ area }}</td>
+                    <td>{{ usage.files }}</td>
+                    <td>{{ '%.2f'|format(usage.bytes / 1048576) }}</td>
+                </tr>
+                {% endfor %}
+            </table>
+            <small>Last full scan: {{ storage.reconciled_at[:19].replace('T', ' ') + ' UTC' if storage.reconciled_at else 'pending' }}</small>
+            {% if db_backup_stats %}
+            <h3>Recent Database Snapshots</h3>
+            <table style="width: 100%; text-align: left;">
+                <tr><th>When (UTC)</th><th>Pages</th><th>Size (MB)</th><th>Duration (ms)</th></tr>
+                {% for run in db_backup_stats %}
+                <tr>
+                    <td>{{ run.timestamp[:19].replace('T', ' ') }}</td>
+                    <td>{{ run.pages }}</td>
+                    <td>{{ '%.2f'|format(run.bytes / 1048576) }}</td>
+                    <td>{{ run.duration_ms }}</td>
+                </tr>
+                {% endfor %}
+            </table>
+            {% endif %}
         </div>
 
         <div class="backup-section">
@@ -449,7 +501,41 @@ backup_dashboard_html = '''
             <form method="POST" action="/admin/backup/create-manual">
                 <button type="submit" class="backup-btn">📥 Create Complete Backup</button>
             </form>
-            <small>Downloads a TAR.GZ file with everything needed for disaster recovery.</small>
+            <small>Downloads a ZIP file with everything needed for disaster recovery.</small>
+        </div>
+
+        <div class="backup-section">
+            <h2>📦 Incremental Snapshot</h2>
+            <p>Snapshot the volume and database on the server. Only new or changed images are copied.</p>
+            <form method="POST" action="/admin/backup/snapshot">
+                <button type="submit" class="backup-btn">📦 Create Snapshot</button>
+            </form>
+            <small>Restore with: python backup_snapshot.py restore latest --target /restore/dir</small>
+            <p>
+                {% if scheduler.enabled %}
+                ⏰ Automatic snapshots every {{ '%g'|format(scheduler.interval_hours) }}h, keeping
+                {{ scheduler.keep_daily }} daily / {{ scheduler.keep_weekly }} weekly.
+                {% if scheduler.next_due %}Next due: {{ scheduler.next_due[:16].replace('T', ' ') }} UTC.{% endif %}
+                {% if scheduler.last_error %}<br>❌ Last scheduled run failed: {{ scheduler.last_error }}{% endif %}
+                {% else %}
+                ⏰ Automatic snapshots are disabled in this process (BACKUP_INTERVAL_HOURS).
+                {% endif %}
+            </p>
+            {% if snapshots %}
+            <table style="width: 100%; text-align: left;">
+                <tr><th>Snapshot</th><th>Created (UTC)</th><th>Files</th><th>Size (MB)</th><th>New data (MB)</th><th></th></tr>
+                {% for snapshot in snapshots %}
+                <tr>
+                    <td>{{ snapshot.id }}{% if snapshot.label %} <small>[{{ snapshot.label }}]</small>{% endif %}</td>
+                    <td>{{ snapshot.created[:19].replace('T', ' ') }}</td>
+                    <td>{{ snapshot.stats.files }}</td>
+                    <td>{{ '%.1f'|format(snapshot.stats.bytes_total / 1048576) }}</td>
+                    <td>{{ '%.1f'|format(snapshot.stats.bytes_stored / 1048576) }}</td>
+                    <td><a href="/admin/backup/snapshot/{{ snapshot.id }}/download">📥 Download</a></td>
+                </tr>
+                {% endfor %}
+            </table>
+            {% endif %}
         </div>
 
         <div class="backup-section">
@@ -1,6 +1,8 @@
 import os
 import json
+from datetime import datetime, timezone
 from flask import Blueprint, request, render_template_string, redirect, url_for, session, jsonify
+from ..response_cache import bump_catalog_version, conditional_json_response, serialize_json
 
 category_mgmt_bp = Blueprint('category_mgmt', __name__)
 
@@ -89,15 +91,14 @@ def category_management():
         return redirect(url_for('admin.admin_login'))
     
     # Get categories from database instead of JSON
-    from ..models import Category, Image, ImageCategory
+    from ..models import Category
+    from ..category_summary import category_image_counts
     
     categories = Category.query.all()
     
-    # Get usage counts from database
-    usage = {}
-    for category in categories:
-        count = ImageCategory.query.filter_by(category_id=category.id).count()
-        usage[category.name] = count
+    # Usage counts for all categories in one query
+    counts = category_image_counts()
+    usage = {category.name: counts.get(category.id, 0) for category in categories}
     
     # Create config structure for template compatibility
     config = {
@@ -524,6 +525,7 @@ def add_category():
         )
         db.session.add(new_category)
         db.session.commit()
+        bump_catalog_version()
         
         print(f"Category '{category_name}' added successfully to database")
         return redirect(url_for('category_mgmt.category_management', 
@@ -578,6 +580,7 @@ def rename_category():
         # Update the category name in database
         category.name = new_name
         db.session.commit()
+        bump_catalog_version()
         
         return redirect(url_for('category_mgmt.category_management', 
                               message=f'Category renamed from "{old_name}" to "{new_name}"', 
@@ -598,6 +601,7 @@ def delete_category():
     
     try:
         from ..models import Category, ImageCategory, db
+        from ..category_summary import category_image_count
         
         data = request.get_json()
         category_name = data.get('category_name', '').strip()
@@ -611,7 +615,7 @@ def delete_category():
             return jsonify({'success': False, 'message': f'Category "{category_name}" not found'})
         
         # Check if category is being used by images
-        usage_count = ImageCategory.query.filter_by(category_id=category.id).count()
+        usage_count = category_image_count(category.id)
         
         # Delete all image-category relationships first
         ImageCategory.query.filter_by(category_id=category.id).delete()
@@ -619,6 +623,7 @@ def delete_category():
         # Delete the category itself
         db.session.delete(category)
         db.session.commit()
+        bump_catalog_version()
         
         return jsonify({
             'success': True, 
@@ -696,7 +701,12 @@ def get_categories_config():
     """API endpoint to get categories configuration for frontend"""
     try:
         config = load_categories_config()
-        return jsonify(config)
+        
+        # ETag from the body, Last-Modified from the config file when present
+        last_modified = None
+        if os.path.exists(CATEGORIES_CONFIG_FILE):
+            last_modified = datetime.fromtimestamp(int(os.path.getmtime(CATEGORIES_CONFIG_FILE)), timezone.utc)
+        return conditional_json_response(serialize_json(config), last_modified=last_modified)
     except Exception as e:
         print(f"Get categories config error: {e}")
         return jsonify({'error': 'Failed to load categories configuration'}), 500
@@ -0,0 +1,333 @@
+"""
+Chunked Upload API for Mind's Eye Photography
+Resumable uploads (init / append / complete) that stream each chunk straight
+into a .part file next to its final location on the volume and hash it on
+the fly, so large batches survive slow links and interrupted connections
+"""
+import os
+import json
+import uuid
+import hashlib
+import threading
+from datetime import datetime, timedelta
+from flask import Blueprint, request, session, jsonify
+from werkzeug.utils import secure_filename
+from ..config import PHOTOGRAPHY_ASSETS_DIR
+from ..response_cache import bump_catalog_version
+from ..jobs import notify_workers
+from ..storage_stats import record_added
+
+chunked_upload_bp = Blueprint('chunked_upload', __name__)
+
+STREAM_BLOCK_SIZE = 1024 * 1024
+STALE_UPLOAD_DAYS = 2
+ALLOWED_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp', '.tif', '.tiff'}
+
+# Running SHA-256 per upload: upload_id -> (offset, hasher)
+_hashers = {}
+_upload_locks = {}
+_locks_lock = threading.Lock()
+
+def _lock_for(upload_id):
+    with _locks_lock:
+        return _upload_locks.setdefault(upload_id, threading.Lock())
+
+def _part_path(upload):
+    return os.path.join(PHOTOGRAPHY_ASSETS_DIR, f"{upload.filename}.part")
+
+def _hasher_at(upload):
+    """SHA-256 state covering the first received_bytes of the part file"""
+    offset, hasher = _hashers.get(upload.id, (None, None))
+    if offset == upload.received_bytes:
+        return hasher
+    # Process restarted (or chunk was rewound) - rebuild from what's on disk
+    hasher = hashlib.sha256()
+    remaining = upload.received_bytes
+    if remaining:
+        with open(_part_path(upload), 'rb') as f:
+            while remaining:
+                block = f.read(min(STREAM_BLOCK_SIZE, remaining))
+                if not block:
+                    raise IOError(f"Part file shorter than recorded offset for {upload.filename}")
+                hasher.update(block)
+                remaining -= len(block)
+    return hasher
+
+def _not_authenticated():
+    return jsonify({'success': False, 'message': 'Not authenticated'}), 401
+
+def cleanup_stale_uploads(days=STALE_UPLOAD_DAYS):
+    """Drop unfinished uploads that haven't received data for a while"""
+    from ..models import db, UploadSession
+    cutoff = datetime.utcnow() - timedelta(days=days)
+    stale = UploadSession.query.filter(UploadSession.status == 'uploading', UploadSession.updated_date < cutoff).all()
+    for upload in stale:
+        try:
+            if os.path.exists(_part_path(upload)):
+                os.remove(_part_path(upload))
+        except OSError as e:
+            print(f"⚠️  Could not remove {_part_path(upload)}: {e}")
+        _hashers.pop(upload.id, None)
+        db.session.delete(upload)
+    if stale:
+        db.session.commit()
+        print(f"🧹 Removed {len(stale)} stale chunked upload(s)")
+    return len(stale)
+
+@chunked_upload_bp.route('/admin/upload/chunked/init', methods=['POST'])
+def init_chunked_upload():
+    """Start (or resume) an upload - returns the upload_id and the offset to send from"""
+    if not session.get('admin_logged_in'):
+        return _not_authenticated()
+
+    try:
+        from ..models import db, UploadSession
+
+        data = request.get_json() or {}
+        original_name = data.get('filename', '')
+        title = (data.get('title') or '').strip()
+        categories = data.get('categories') or []
+        client_key = data.get('client_key')
+        batch_id = data.get('batch_id') or str(uuid.uuid4())
+        try:
+            total_size = int(data.get('size'))
+        except (TypeError, ValueError):
+            return jsonify({'success': False, 'message': 'File size is required'}), 400
+
+        if not title:
+            return jsonify({'success': False, 'message': 'Please enter an image title'}), 400
+        if not categories:
+            return jsonify({'success': False, 'message': 'Please select at least one category'}), 400
+        if total_size <= 0:
+            return jsonify({'success': False, 'message': 'File is empty'}), 400
+
+        file_extension = os.path.splitext(original_name)[1].lower() or '.jpg'
+        if file_extension not in ALLOWED_EXTENSIONS:
+            return jsonify({'success': False, 'message': f'Unsupported file type: {file_extension}'}), 400
+
+        # Same browser file already in progress -> resume it
+        if client_key:
+            existing = UploadSession.query.filter_by(client_key=client_key, status='uploading', total_size=total_size).first()
+            if existing:
+                # Resumed uploads join the new batch so its job status covers them
+                existing.batch_id = batch_id
+                db.session.commit()
+                return jsonify({'success': True, 'resumed': True, **existing.to_dict()})
+
+        cleanup_stale_uploads()
+
+        # Titles/filenames follow the regular multi-image upload
+        index = int(data.get('index', 0))
+        batch_size = int(data.get('batch_size', 1))
+        safe_title = secure_filename(title.lower().replace(' ', '-'))
+        if index > 0:
+            safe_title = f"{safe_title}-{index + 1}"
+        filename = f"{safe_title}-{str(uuid.uuid4())[:8]}{file_extension}"
+        final_title = f"{title} {index + 1}" if batch_size > 1 else title
+
+        upload = UploadSession(
+            batch_id=batch_id,
+            client_key=client_key,
+            original_name=original_name,
+            filename=filename,
+            title=final_title,
+            description=(data.get('description') or '').strip(),
+            categories=json.dumps(categories),
+            total_size=total_size,
+            received_bytes=0
+        )
+        db.session.add(upload)
+
+        os.makedirs(PHOTOGRAPHY_ASSETS_DIR, exist_ok=True)
+        open(_part_path(upload), 'wb').close()
+        db.session.commit()
+
+        return jsonify({'success': True, 'resumed': False, **upload.to_dict()})
+
+    except Exception as e:
+        db.session.rollback()
+        print(f"Chunked upload init error: {e}")
+        return jsonify({'success': False, 'message': f'Error: {str(e)}'}), 500
+
+@chunked_upload_bp.route('/admin/upload/chunked/<upload_id>', methods=['PUT'])
+def append_chunk(upload_id):
+    """
+    Append the raw request body at ?offset=N
+    The body is streamed to disk - it is never parsed as a form or buffered whole
+    """
+    if not session.get('admin_logged_in'):
+        return _not_authenticated()
+
+    from ..models import db, UploadSession
+
+    with _lock_for(upload_id):
+        try:
+            upload = db.session.get(UploadSession, upload_id)
+            if not upload or upload.status != 'uploading':
+                return jsonify({'success': False, 'message': 'Upload not found'}), 404
+
+            offset = request.args.get('offset', type=int)
+            if offset != upload.received_bytes:
+                # Client is out of sync (e.g. lost response) - tell it where to continue
+                return jsonify({'success': False, 'message': 'Offset mismatch', 'offset': upload.received_bytes}), 409
+
+            # Hash into a copy - the cached state stays valid if this chunk is rejected
+            hasher = _hasher_at(upload).copy()
+            remaining = upload.total_size - offset
+            written = 0
+
+            with open(_part_path(upload), 'r+b') as f:
+                # Drop bytes a crashed request may have written past the recorded offset
+                f.seek(offset)
+                f.truncate()
+                while True:
+                    block = request.stream.read(STREAM_BLOCK_SIZE)
+                    if not block:
+                        break
+                    if written + len(block) > remaining:
+                        f.truncate(offset)
+                        return jsonify({'success': False, 'message': 'Chunk exceeds declared file size',
+                                        'offset': upload.received_bytes}), 400
+                    f.write(block)
+                    hasher.update(block)
+                    written += len(block)
+                f.flush()
+                os.fsync(f.fileno())
+
+            upload.received_bytes = offset + written
+            db.session.commit()
+            _hashers[upload_id] = (upload.received_bytes, hasher)
+
+            return jsonify({'success': True, 'offset': upload.received_bytes, 'total_size': upload.total_size})
+
+        except Exception as e:
+            db.session.rollback()
+            _hashers.pop(upload_id, None)
+            print(f"Chunked upload append error: {e}")
+            return jsonify({'success': False, 'message': f'Error: {str(e)}'}), 500
+
+@chunked_upload_bp.route('/admin/upload/chunked/<upload_id>', methods=['GET'])
+def chunked_upload_status(upload_id):
+    """Current offset of an upload (used to resume)"""
+    if not session.get('admin_logged_in'):
+        return _not_authenticated()
+
+    from ..models import db, UploadSession
+    upload = db.session.get(UploadSession, upload_id)
+    if not upload:
+        return jsonify({'success': False, 'message': 'Upload not found'}), 404
+    return jsonify({'success': True, **upload.to_dict()})
+
+@chunked_upload_bp.route('/admin/upload/chunked/batch/<batch_id>', methods=['GET'])
+def chunked_batch_status(batch_id):
+    """All uploads of a batch, so an interrupted batch can pick up where it stopped"""
+    if not session.get('admin_logged_in'):
+        return _not_authenticated()
+
+    from ..models import UploadSession
+    uploads = UploadSession.query.filter_by(batch_id=batch_id).order_by(UploadSession.created_date).all()
+    return jsonify({
+        'success': True,
+        'batch_id': batch_id,
+        'uploads': [upload.to_dict() for upload in uploads],
+        'complete': bool(uploads) and all(upload.status == 'complete' for upload in uploads)
+    })
+
+@chunked_upload_bp.route('/admin/upload/chunked/<upload_id>/complete', methods=['POST'])
+def complete_chunked_upload(upload_id):
+    """Move the finished file into place and create the Image record"""
+    if not session.get('admin_logged_in'):
+        return _not_authenticated()
+
+    from ..models import db, Image, UploadSession
+    from ..image_jobs import enqueue_image_processing, UPLOAD_JOB_TYPES
+    from ..dedup import find_image_by_hash, link_categories
+
+    with _lock_for(upload_id):
+        try:
+            upload = db.session.get(UploadSession, upload_id)
+            if not upload:
+                return jsonify({'success': False, 'message': 'Upload not found'}), 404
+            if upload.status == 'complete':
+                return jsonify({'success': True, **upload.to_dict()})
+            if upload.received_bytes != upload.total_size:
+                return jsonify({'success': False, 'message': 'Upload incomplete', 'offset': upload.received_bytes}), 409
+
+            content_hash = _hasher_at(upload).hexdigest()
+            expected_hash = (request.get_json(silent=True) or {}).get('sha256')
+            if expected_hash and expected_hash.lower() != content_hash:
+                return jsonify({'success': False, 'message': 'Checksum mismatch - upload the file again'}), 422
+
+            category_names = json.loads(upload.categories) if upload.categories else []
+
+            # Same photo uploaded before - link to it instead of keeping a second copy
+            existing = find_image_by_hash(content_hash)
+            if existing:
+                link_categories(existing, category_names)
+                upload.status = 'complete'
+                upload.image_id = existing.id
+                db.session.commit()
+                # Only once the session is complete - until then a retry still needs the part
+                os.remove(_part_path(upload))
+                bump_catalog_version()
+                _hashers.pop(upload_id, None)
+                print(f"♻️  Duplicate upload {upload.original_name} linked to {existing.filename}")
+                return jsonify({'success': True, 'duplicate': True, 'existing_filename': existing.filename, **upload.to_dict()})
+
+            # Same filesystem - a rename, not a second copy
+            final_path = os.path.join(PHOTOGRAPHY_ASSETS_DIR, upload.filename)
+            os.replace(_part_path(upload), final_path)
+            try:
+                new_image = Image(
+                    filename=upload.filename,
+                    title=upload.title,
+                    description=upload.description,
+                    file_size=upload.total_size,
+                    content_hash=content_hash,
+                    upload_date=datetime.now()
+                )
+                db.session.add(new_image)
+                db.session.flush()  # Get the ID
+
+                link_categories(new_image, category_names)
+
+                # Hash is already known - queue the remaining post-processing
+                enqueue_image_processing(new_image.id, batch_id=upload.batch_id, job_types=UPLOAD_JOB_TYPES)
+
+                upload.status = 'complete'
+                upload.image_id = new_image.id
+                db.session.commit()
+            except Exception:
+                # Nothing was recorded - put the part back so complete can be retried
+                os.replace(final_path, _part_path(upload))
+                raise
+            record_added(final_path)
+            bump_catalog_version()
+            notify_workers()
+            _hashers.pop(upload_id, None)
+
+            return jsonify({'success': True, 'duplicate': False, **upload.to_dict()})
+
+        except Exception as e:
+            db.session.rollback()
+            print(f"Chunked upload complete error: {e}")
+            return jsonify({'success': False, 'message': f'Error: {str(e)}'}), 500
+
+@chunked_upload_bp.route('/admin/upload/chunked/<upload_id>', methods=['DELETE'])
+def abort_chunked_upload(upload_id):
+    """Cancel an unfinished upload and remove its partial file"""
+    if not session.get('admin_logged_in'):
+        return _not_authenticated()
+
+    from ..models import db, UploadSession
+
+    with _lock_for(upload_id):
+        upload = db.session.get(UploadSession, upload_id)
+        if not upload or upload.status != 'uploading':
+            return jsonify({'success': False, 'message': 'Upload not found'}), 404
+        if os.path.exists(_part_path(upload)):
+            os.remove(_part_path(upload))
+        _hashers.pop(upload_id, None)
+        db.session.delete(upload)
+        db.session.commit()
+        return jsonify({'success': True, 'message': 'Upload cancelled'})
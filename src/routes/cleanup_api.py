@@ -5,6 +5,8 @@ API endpoint to trigger database cleanup and optimization
 import re
 from flask import Blueprint, jsonify
 from ..models import db, Image
+from ..response_cache import bump_catalog_version
+from ..migrations import run_migrations
 
 cleanup_bp = Blueprint('cleanup', __name__)
 
@@ -38,13 +40,11 @@ def cleanup_database():
         
         # Commit changes
         db.session.commit()
+        bump_catalog_version()
         
-        # Add database indexes for better performance (if they don't exist)
+        # Make sure the lookup indexes exist (normally already applied at startup)
         try:
-            db.engine.execute('CREATE INDEX IF NOT EXISTS idx_image_title ON image(title)')
-            db.engine.execute('CREATE INDEX IF NOT EXISTS idx_image_upload_date ON image(upload_date)')
-            db.engine.execute('CREATE INDEX IF NOT EXISTS idx_image_category_image_id ON image_category(image_id)')
-            db.engine.execute('CREATE INDEX IF NOT EXISTS idx_image_category_category_id ON image_category(category_id)')
+            run_migrations()
             optimized = True
         except Exception as e:
             print(f'Index optimization note: {e}')
@@ -2,6 +2,7 @@ from flask import Blueprint, jsonify
 from src.models import db, Image, Category, migrate_existing_images
 import os
 from src.config import PHOTOGRAPHY_ASSETS_DIR
+from src.response_cache import bump_catalog_version
 
 debug_migration_bp = Blueprint('debug_migration', __name__)
 
@@ -27,6 +28,7 @@ def force_migration():
     # Force run migration
     try:
         migrate_existing_images()
+        bump_catalog_version()
         migration_success = True
         migration_error = None
     except Exception as e:
@@ -71,6 +73,7 @@ def clear_images():
         Image.query.delete()
         
         db.session.commit()
+        bump_catalog_version()
         
         return jsonify({
             'success': True,
@@ -1,34 +1,19 @@
 import os
 import json
 from flask import Blueprint, request, render_template_string, redirect, url_for, session, jsonify
-from PIL import Image
-from PIL.ExifTags import TAGS
 from datetime import datetime
 from ..config import PHOTOGRAPHY_ASSETS_DIR, PORTFOLIO_DATA_FILE
+from ..response_cache import bump_catalog_version, cached_json_response
+from ..derivatives import derivative_payload
+from ..image_metadata import public_exif
 
 def load_portfolio_data():
-    """Load portfolio data from SQL database - EXACT SAME AS ADMIN DASHBOARD"""
+    """Load portfolio data from SQL database - shared portfolio serializer"""
     try:
-        from ..models import Image, Category
+        from ..portfolio_serializer import build_manager_portfolio
         
-        # Get all images from database - EXACT SAME QUERY
-        images = Image.query.all()
-        portfolio_data = []
-        
-        for image in images:
-            # Get categories for this image
-            image_categories = [cat.category.name for cat in image.categories]
-            
-            portfolio_data.append({
-                'id': image.id,
-                'image': image.filename,  # Featured manager expects 'image' field
-                'title': image.title,
-                'description': image.description,
-                'categories': image_categories,
-                'upload_date': image.upload_date.isoformat() if image.upload_date else None,
-            })
-        
-        return portfolio_data
+        # Featured manager expects 'image' field
+        return build_manager_portfolio()
     except Exception as e:
         print(f"Error loading portfolio data from SQL: {e}")
     return []
@@ -59,7 +44,8 @@ def load_featured_data():
                 'categories': image_categories,
                 'story': featured_image.featured_story or '',
                 'set_date': featured_image.upload_date.strftime('%Y-%m-%d %H:%M:%S') if featured_image.upload_date else 'Unknown',
-                'exif_data': {}  # Will be populated if needed
+                'exif_data': public_exif(featured_image),
+                **derivative_payload(featured_image)
             }
     except Exception as e:
         print(f"Error loading featured data from SQL: {e}")
@@ -80,6 +66,7 @@ def save_featured_data(image_id, story):
             featured_image.featured_story = story
             
             db.session.commit()
+            bump_catalog_version()
             return True
         else:
             print(f"Image with ID {image_id} not found")
@@ -90,116 +77,16 @@ def save_featured_data(image_id, story):
         db.session.rollback()
         return False
 
-def extract_exif_data(image_path):
-    """Extract EXIF data from image"""
-    try:
-        print(f"Extracting EXIF from: {image_path}")
-        with Image.open(image_path) as img:
-            exif_dict = img._getexif()
-            
-            if exif_dict is not None:
-                exif = {TAGS[key]: value for key, value in exif_dict.items() if key in TAGS}
-                print(f"Found EXIF tags: {list(exif.keys())}")
-                
-                # Format camera make/model - fix duplication
-                make = exif.get('Make', '').strip()
-                model = exif.get('Model', '').strip()
-                
-                # Check if model already contains make to avoid duplication
-                if make and model:
-                    if model.lower().startswith(make.lower()):
-                        # Model already includes make (e.g., "Canon R8")
-                        camera = model
-                    else:
-                        # Model doesn't include make, combine them
-                        camera = f"{make} {model}".strip()
-                elif model:
-                    # Only model available
-                    camera = model
-                elif make:
-                    # Only make available
-                    camera = make
-                else:
-                    camera = 'Unknown'
-                
-                # Format aperture
-                aperture = exif.get('FNumber', 'Unknown')
-                if aperture != 'Unknown' and isinstance(aperture, (int, float)):
-                    aperture = f"{aperture:.1f}"
-                elif aperture != 'Unknown' and hasattr(aperture, 'real'):
-                    aperture = f"{float(aperture):.1f}"
-                
-                # Format shutter speed
-                shutter = exif.get('ExposureTime', 'Unknown')
-                if shutter != 'Unknown' and isinstance(shutter, (int, float)):
-                    if shutter >= 1:
-                        shutter = f"{shutter:.1f}"
-                    else:
-                        shutter = f"1/{int(1/shutter)}"
-                elif shutter != 'Unknown' and hasattr(shutter, 'real'):
-                    shutter_val = float(shutter)
-                    if shutter_val >= 1:
-                        shutter = f"{shutter_val:.1f}"
-                    else:
-                        shutter = f"1/{int(1/shutter_val)}"
-                
-                # Extract specific EXIF data
-                # Format date to mm/dd/yyyy hh:mm AM/PM
-                date_taken = exif.get('DateTime', exif.get('DateTimeOriginal', 'Unknown'))
-                if date_taken != 'Unknown':
-                    try:
-                        # Parse the EXIF date format (YYYY:MM:DD HH:MM:SS)
-                        from datetime import datetime
-                        dt = datetime.strptime(date_taken, '%Y:%m:%d %H:%M:%S')
-                        # Format to mm/dd/yyyy hh:mm AM/PM
-                        date_taken = dt.strftime('%m/%d/%Y %I:%M %p')
-                    except:
-                        pass  # Keep original if parsing fails
-                
-                camera_info = {
-                    'camera': camera,
-                    'lens': exif.get('LensModel', exif.get('Lens', 'Unknown')),
-                    'aperture': str(aperture),
-                    'shutter_speed': str(shutter),
-                    'iso': str(exif.get('ISOSpeedRatings', exif.get('ISO', 'Unknown'))),
-                    'date_taken': date_taken,
-                    'gps_info': 'Unknown'  # Simplified for now
-                }
-                
-                print(f"Extracted EXIF: {camera_info}")
-                return camera_info
-            else:
-                print("No EXIF data found in image")
-                return {}
-    except Exception as e:
-        print(f"Error extracting EXIF data: {e}")
-        return {}
+def build_featured_payload():
+    """Current featured image data with stored EXIF (None if nothing is featured)"""
+    # EXIF comes from the database - no image I/O per request
+    return load_featured_data()
 
 @featured_bp.route('/api/featured')
 def get_featured_image():
     """API endpoint to get current featured image data with EXIF"""
-    featured_data = load_featured_data()
-    
-    if featured_data and featured_data.get('image'):
-        # Try multiple possible image locations
-        possible_paths = [
-            os.path.join(STATIC_ASSETS_DIR, featured_data['image']),  # Photography assets dir
-            os.path.join(os.path.dirname(__file__), '..', 'static', 'assets', featured_data['image']),  # Static assets
-            os.path.join('/home/ubuntu/mindseye-complete-restore/src/static/assets', featured_data['image'])  # Absolute static path
-        ]
-        
-        exif_data = {}
-        for image_path in possible_paths:
-            if os.path.exists(image_path):
-                print(f"Found image at: {image_path}")
-                exif_data = extract_exif_data(image_path)
-                break
-            else:
-                print(f"Image not found at: {image_path}")
-        
-        featured_data['exif_data'] = exif_data
-    
-    return jsonify(featured_data)
+    # Built once per catalog version, revalidated with ETag/Last-Modified
+    return cached_json_response('featured', build_featured_payload)
 
 @featured_bp.route('/admin/featured-image')
 def featured_admin():
@@ -412,7 +299,7 @@ def featured_admin():
             <div class="portfolio-grid">
                 {% for image in portfolio_data %}
                     <div class="portfolio-item">
-                        <img src="/static/assets/{{ image.image }}" alt="{{ image.title }}">
+                        <img src="{{ image.thumbnail_url }}" alt="{{ image.title }}" loading="lazy">
                         <div class="portfolio-item-info">
                             <h3>{{ image.title }}</h3>
                             <p>{{ image.description }}</p>
@@ -469,6 +356,7 @@ def set_featured_image():
             image.is_featured = True
             image.featured_story = featured_story
             db.session.commit()
+            bump_catalog_version()
             
             return redirect(url_for('featured.featured_admin') + '?success=Featured image and story saved successfully!')
         else:
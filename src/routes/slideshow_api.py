@@ -5,30 +5,39 @@ Uses existing Image table with is_slideshow_background field
 
 from flask import Blueprint, request, jsonify, session, redirect, url_for
 from ..models import db, Image
+from ..response_cache import bump_catalog_version, cached_json_response
+from ..derivatives import derivative_payload
 
 slideshow_api_bp = Blueprint('slideshow_api', __name__)
 
+def build_slideshow_payload():
+    """Images marked for slideshow background (limit 5 for performance)"""
+    slideshow_images = Image.query.filter_by(is_slideshow_background=True).limit(5).all()
+    
+    images_data = []
+    for image in slideshow_images:
+        image_data = {
+            'id': image.id,
+            'filename': image.filename,
+            'title': image.title,
+            'url': f'https://minds-eye-master-production.up.railway.app/static/assets/{image.filename}'
+        }
+        # Downscaled derivative URLs + srcset for responsive <img>
+        image_data.update(derivative_payload(image))
+        images_data.append(image_data)
+    
+    return {
+        'success': True,
+        'images': images_data,
+        'count': len(images_data)
+    }
+
 @slideshow_api_bp.route('/api/slideshow-images')
 def get_slideshow_images():
     """Get images marked for slideshow background"""
     try:
-        # Get images marked for slideshow (limit to 5 for performance)
-        slideshow_images = Image.query.filter_by(is_slideshow_background=True).limit(5).all()
-        
-        images_data = []
-        for image in slideshow_images:
-            images_data.append({
-                'id': image.id,
-                'filename': image.filename,
-                'title': image.title,
-                'url': f'https://minds-eye-master-production.up.railway.app/static/assets/{image.filename}'
-            })
-        
-        return jsonify({
-            'success': True,
-            'images': images_data,
-            'count': len(images_data)
-        })
+        # Built once per catalog version, revalidated with ETag/Last-Modified
+        return cached_json_response('slideshow_images', build_slideshow_payload)
         
     except Exception as e:
         print(f"Slideshow API error: {e}")
@@ -104,6 +113,7 @@ def toggle_slideshow_image():
         old_status = getattr(image, 'is_slideshow_background', False)
         image.is_slideshow_background = is_slideshow
         db.session.commit()
+        bump_catalog_version()
         print(f"✅ Updated image slideshow status from {old_status} to: {is_slideshow}")
         
         action = 'added to' if is_slideshow else 'removed from'
@@ -5,6 +5,7 @@ Bypasses potential issues with the existing endpoint
 
 from flask import Blueprint, request, jsonify, session
 from ..models import db, Image
+from ..response_cache import bump_catalog_version
 from sqlalchemy import text
 import traceback
 
@@ -111,6 +112,7 @@ def toggle_slideshow_new():
             {'status': is_slideshow, 'image_id': image_id}
         )
         db.session.commit()
+        bump_catalog_version()
         
     except Exception as e:
         db.session.rollback()
@@ -0,0 +1,152 @@
+"""
+Full-Text Search for Mind's Eye Photography
+images_fts is an FTS5 index over each image's title, description, featured
+story and category names. SQLite triggers on images, image_categories and
+categories keep it in step with every write - ORM, bulk inserts from the
+volume import and raw SQL alike - so nothing in the app has to remember to
+update it. Index rows share the image's rowid (what the triggers key on);
+results and portfolio filters go through the stored image_id, so rowids
+renumbered by a VACUUM can't return the wrong image - rebuild_search_index()
+re-keys them
+"""
+import re
+import html
+from src.models import db, Image
+
+FTS_TABLE = 'images_fts'
+SEARCH_COLUMNS = ('title', 'description', 'featured_story', 'categories')
+# bm25() weights in table column order: image_id, title, description, featured_story, categories
+BM25_WEIGHTS = (0.0, 10.0, 3.0, 2.0, 5.0)
+HIGHLIGHT_OPEN, HIGHLIGHT_CLOSE = '\x02', '\x03'  # Swapped for <mark> after HTML escaping
+SEARCH_LIMIT = 20
+MAX_SEARCH_LIMIT = 100
+MAX_QUERY_TERMS = 8
+
+# Index row of one image (alias i), category names space separated
+_ROW_SELECT = (
+    "SELECT i.rowid, i.id, COALESCE(i.title, ''), COALESCE(i.description, ''), "
+    "COALESCE(i.featured_story, ''), "
+    "COALESCE((SELECT group_concat(c.name || ' ' || c.display_name, ' ') FROM image_categories ic "
+    "JOIN categories c ON c.id = ic.category_id WHERE ic.image_id = i.id), '') "
+    "FROM images i"
+)
+_INSERT = f"INSERT INTO {FTS_TABLE} (rowid, image_id, title, description, featured_story, categories) {_ROW_SELECT}"
+
+def _refresh_image(image_id_sql):
+    """Trigger statements that rewrite the index row of one image"""
+    return (f"DELETE FROM {FTS_TABLE} WHERE rowid = (SELECT rowid FROM images WHERE id = {image_id_sql}); "
+            f"{_INSERT} WHERE i.id = {image_id_sql};")
+
+_IMAGES_IN_CATEGORY = "SELECT image_id FROM image_categories WHERE category_id = new.id"
+
+TRIGGERS = {
+    'images_fts_insert': f"AFTER INSERT ON images BEGIN {_INSERT} WHERE i.rowid = new.rowid; END",
+    'images_fts_update': f"AFTER UPDATE OF title, description, featured_story ON images BEGIN "
+                         f"DELETE FROM {FTS_TABLE} WHERE rowid = old.rowid; "
+                         f"{_INSERT} WHERE i.rowid = new.rowid; END",
+    'images_fts_delete': f"AFTER DELETE ON images BEGIN DELETE FROM {FTS_TABLE} WHERE rowid = old.rowid; END",
+    'image_categories_fts_insert': f"AFTER INSERT ON image_categories BEGIN {_refresh_image('new.image_id')} END",
+    'image_categories_fts_delete': f"AFTER DELETE ON image_categories BEGIN {_refresh_image('old.image_id')} END",
+    'categories_fts_update': f"AFTER UPDATE OF name, display_name ON categories BEGIN "
+                             f"DELETE FROM {FTS_TABLE} WHERE rowid IN "
+                             f"(SELECT rowid FROM images WHERE id IN ({_IMAGES_IN_CATEGORY})); "
+                             f"{_INSERT} WHERE i.id IN ({_IMAGES_IN_CATEGORY}); END",
+}
+
+def create_search_index():
+    """Create the FTS5 table and its triggers, then fill it (idempotent)"""
+    db.session.execute(db.text(
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+        f"image_id UNINDEXED, title, description, featured_story, categories, "
+        f"tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')"
+    ))
+    for name, body in TRIGGERS.items():
+        db.session.execute(db.text(f"DROP TRIGGER IF EXISTS {name}"))
+        db.session.execute(db.text(f"CREATE TRIGGER {name} {body}"))
+    rebuild_search_index()
+
+def rebuild_search_index():
+    """Re-index every image from scratch - returns the number of rows indexed"""
+    db.session.execute(db.text(f"DELETE FROM {FTS_TABLE}"))
+    db.session.execute(db.text(_INSERT))
+    db.session.execute(db.text(f"INSERT INTO {FTS_TABLE} ({FTS_TABLE}) VALUES ('optimize')"))
+    return db.session.execute(db.text(f"SELECT COUNT(*) FROM {FTS_TABLE}")).scalar()
+
+def build_match_query(text):
+    """
+    FTS5 MATCH expression for free text typed by a visitor
+    Every word must match (any searched column); the last word is a prefix so
+    results appear while typing. None when there is nothing searchable
+    """
+    terms = re.findall(r'\w+', text or '')[:MAX_QUERY_TERMS]
+    if not terms:
+        return None
+    # Quoted, so FTS5 operators (AND, NEAR, column:...) in the input are plain words
+    phrases = [f'"{term}"' for term in terms]
+    phrases[-1] += '*'
+    return f"{{{' '.join(SEARCH_COLUMNS)}}} : ({' '.join(phrases)})"
+
+def matching_image_ids(match):
+    """Subquery of the image ids matching an FTS expression (for Image.id.in_() filters)"""
+    return db.text(
+        f"SELECT image_id FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH :match"
+    ).bindparams(match=match).columns(image_id=db.String)
+
+def render_highlight(text):
+    """HTML-escape highlight()/snippet() output, then turn its markers into <mark>"""
+    return html.escape(text or '').replace(HIGHLIGHT_OPEN, '<mark>').replace(HIGHLIGHT_CLOSE, '</mark>')
+
+def search_images(text, limit=SEARCH_LIMIT, category=None):
+    """
+    Ranked full-text search (bm25, title matches weigh most)
+    Returns {'query', 'total', 'results'}; each result is the public portfolio
+    item plus 'score' and 'highlight' (title and a snippet as safe HTML)
+    """
+    from src.portfolio_serializer import load_images_with_categories, serialize_public_item
+
+    limit = max(1, min(int(limit), MAX_SEARCH_LIMIT))
+    match = build_match_query(text)
+    if match is None:
+        return {'query': text, 'total': 0, 'results': []}
+
+    weights = ', '.join(str(weight) for weight in BM25_WEIGHTS)
+    params = {'match': match, 'limit': limit}
+    category_filter = ''
+    if category:
+        category_filter = ("AND image_id IN (SELECT ic.image_id FROM image_categories ic "
+                           "JOIN categories c ON c.id = ic.category_id WHERE c.name = :category OR c.display_name = :category)")
+        params['category'] = category
+
+    # Rank first, then highlight only the rows that are returned
+    ranked = db.session.execute(db.text(f"""
+        SELECT rowid, image_id, bm25({FTS_TABLE}, {weights}) AS score FROM {FTS_TABLE}
+        WHERE {FTS_TABLE} MATCH :match {category_filter}
+        ORDER BY score LIMIT :limit
+    """), params).fetchall()
+    total = db.session.execute(db.text(
+        f"SELECT COUNT(*) FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH :match {category_filter}"
+    ), params).scalar()
+
+    highlights = {}
+    if ranked:
+        rowids = ', '.join(str(int(row[0])) for row in ranked)
+        highlights = {row[0]: tuple(row[1:]) for row in db.session.execute(db.text(f"""
+            SELECT rowid, highlight({FTS_TABLE}, 1, '{HIGHLIGHT_OPEN}', '{HIGHLIGHT_CLOSE}'),
+                   snippet({FTS_TABLE}, -1, '{HIGHLIGHT_OPEN}', '{HIGHLIGHT_CLOSE}', '…', 16)
+            FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH :match AND rowid IN ({rowids})
+        """), {'match': match})}
+
+    image_ids = [row[1] for row in ranked]
+    images = {image.id: image for image in load_images_with_categories(Image.query.filter(Image.id.in_(image_ids)))}
+    results = []
+    for rowid, image_id, score in ranked:
+        image = images.get(image_id)
+        if image is None:
+            continue  # Stale index row - rebuild_search_index() clears these
+        title, snippet = highlights.get(rowid, (image.title, ''))
+        item = serialize_public_item(image)
+        # bm25 is lower-is-better; flip it so clients can sort descending
+        item['score'] = round(-score, 4)
+        item['highlight'] = {'title': render_highlight(title), 'snippet': render_highlight(snippet)}
+        results.append(item)
+    return {'query': text, 'total': total, 'results': results}
@@ -0,0 +1,74 @@
+"""
+Background Service Helpers for Mind's Eye Photography
+Shared by the long-running threads (backup scheduler, storage stats,
+catalog sync, asset GC): low-priority execution and one-runner-per-volume locks
+"""
+import os
+import sys
+import ctypes
+import platform
+import threading
+
+try:
+    import fcntl
+except ImportError:  # Windows - no cross-process lock, every process may run the service
+    fcntl = None
+
+# ioprio_set / ioprio_get have no libc wrapper - (set, get) syscall numbers per architecture
+IOPRIO_SYSCALLS = {'x86_64': (251, 252), 'aarch64': (30, 31)}
+IOPRIO_WHO_PROCESS = 1  # With a thread id: that thread only
+IOPRIO_CLASS_SHIFT = 13
+IOPRIO_CLASS_IDLE = 3
+
+_held_locks = {}
+
+def _ioprio_syscall(index, *args):
+    numbers = IOPRIO_SYSCALLS.get(platform.machine())
+    if not sys.platform.startswith('linux') or numbers is None:
+        raise OSError(f"ioprio syscalls not available on {sys.platform}/{platform.machine()}")
+    libc = ctypes.CDLL(None, use_errno=True)
+    result = libc.syscall(numbers[index], *(ctypes.c_int(arg) for arg in args))
+    if result < 0:
+        error = ctypes.get_errno()
+        raise OSError(error, os.strerror(error))
+    return result
+
+def set_idle_io_priority():
+    """Put this thread's disk I/O in the idle class - served only when no one else wants the disk"""
+    _ioprio_syscall(0, IOPRIO_WHO_PROCESS, threading.get_native_id(), IOPRIO_CLASS_IDLE << IOPRIO_CLASS_SHIFT)
+
+def get_io_priority_class():
+    """I/O scheduling class of this thread (IOPRIO_CLASS_*; 0 = none set)"""
+    return _ioprio_syscall(1, IOPRIO_WHO_PROCESS, threading.get_native_id()) >> IOPRIO_CLASS_SHIFT
+
+def lower_thread_priority():
+    """
+    Drop this thread to nice 19 and idle I/O class (both per-thread on Linux)
+    Each falls back to a warning where the platform doesn't support it
+    """
+    name = threading.current_thread().name
+    try:
+        os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), 19)
+    except (AttributeError, OSError) as e:
+        print(f"⚠️  Could not lower {name} CPU priority: {e}")
+    try:
+        set_idle_io_priority()
+    except (AttributeError, OSError) as e:
+        print(f"⚠️  Could not lower {name} I/O priority: {e}")
+
+def acquire_process_lock(path):
+    """
+    Non-blocking exclusive lock held for the life of the process
+    False if another process (e.g. another gunicorn worker) already holds it
+    """
+    if fcntl is None or path in _held_locks:
+        return True
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    handle = open(path, 'w')
+    try:
+        fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        handle.close()
+        return False
+    _held_locks[path] = handle
+    return True
@@ -0,0 +1,296 @@
+"""
+Incremental Backup Snapshots for Mind's Eye Photography
+Content-addressed store under BACKUPS_DIR:
+  objects/<ab>/<sha256>              - every distinct file, stored once
+  snapshots/<id>/manifest.json       - full file list (name, size, mtime, hash) + database object
+A snapshot only copies files that are new or changed since the previous one;
+unchanged files (same size and mtime) reuse the previous hash without being
+read. Every manifest is complete, so any snapshot restores on its own
+"""
+import os
+import json
+import time
+import uuid
+import shutil
+import hashlib
+import tempfile
+import threading
+from datetime import datetime
+from src.config import PHOTOGRAPHY_ASSETS_DIR, BACKUPS_DIR
+from src.db_backup import backup_database_to_temp
+from src.storage_stats import record_added, record_removed
+
+OBJECTS_DIR = os.path.join(BACKUPS_DIR, 'objects')
+SNAPSHOTS_DIR = os.path.join(BACKUPS_DIR, 'snapshots')
+MANIFEST_NAME = 'manifest.json'
+DATABASE_NAME = 'mindseye.db'
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Regenerable or internal directories on the volume that are not backed up
+EXCLUDED_DIRS = {'backups', 'derivatives', 'cache'}
+EXCLUDED_SUFFIXES = ('.db', '-wal', '-shm', '-journal', '.part', '.tmp')
+
+# Unreferenced objects younger than this are left alone - they may belong
+# to a snapshot another process is still writing
+GC_GRACE_SECONDS = 6 * 60 * 60
+
+_snapshot_lock = threading.Lock()
+
+def object_path(content_hash):
+    """Location of a stored object"""
+    return os.path.join(OBJECTS_DIR, content_hash[:2], content_hash)
+
+def _copy_with_hash(source, destination):
+    """Copy source to destination and return its SHA-256 (one read pass)"""
+    digest = hashlib.sha256()
+    with open(source, 'rb') as src, open(destination, 'wb') as dst:
+        for chunk in iter(lambda: src.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+            dst.write(chunk)
+    return digest.hexdigest()
+
+def store_object(path):
+    """
+    Add a file to the object store (no-op if the content is already there)
+    Returns (sha256, bytes newly stored)
+    """
+    os.makedirs(OBJECTS_DIR, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=OBJECTS_DIR, suffix='.tmp')
+    os.close(fd)
+    try:
+        content_hash = _copy_with_hash(path, temp_path)
+        destination = object_path(content_hash)
+        if os.path.exists(destination):
+            # Touch it so a concurrent garbage collection sees it as in use
+            os.utime(destination)
+            return content_hash, 0
+        os.makedirs(os.path.dirname(destination), exist_ok=True)
+        os.replace(temp_path, destination)
+        record_added(destination)
+        return content_hash, os.path.getsize(destination)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+def iter_volume_files(root=PHOTOGRAPHY_ASSETS_DIR):
+    """(relative name, os.stat_result) for every file that belongs in a backup"""
+    stack = ['']
+    while stack:
+        relative_dir = stack.pop()
+        with os.scandir(os.path.join(root, relative_dir)) as it:
+            for entry in it:
+                name = f"{relative_dir}/{entry.name}" if relative_dir else entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    if not (relative_dir == '' and entry.name in EXCLUDED_DIRS):
+                        stack.append(name)
+                elif entry.is_file(follow_symlinks=False) and not entry.name.endswith(EXCLUDED_SUFFIXES):
+                    yield name, entry.stat()
+
+def list_snapshots():
+    """Manifests of all complete snapshots, newest first"""
+    snapshots = []
+    if not os.path.exists(SNAPSHOTS_DIR):
+        return snapshots
+    for snapshot_id in os.listdir(SNAPSHOTS_DIR):
+        manifest = load_manifest(snapshot_id)
+        if manifest:
+            snapshots.append(manifest)
+    snapshots.sort(key=lambda manifest: manifest['created'], reverse=True)
+    return snapshots
+
+def load_manifest(snapshot_id):
+    """Manifest of a snapshot (None if it doesn't exist or never completed)"""
+    path = os.path.join(SNAPSHOTS_DIR, os.path.basename(snapshot_id), MANIFEST_NAME)
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def latest_snapshot():
+    snapshots = list_snapshots()
+    return snapshots[0] if snapshots else None
+
+def _write_manifest(snapshot_id, manifest):
+    """Manifest written last and atomically - a snapshot exists only once it's complete"""
+    snapshot_dir = os.path.join(SNAPSHOTS_DIR, snapshot_id)
+    os.makedirs(snapshot_dir, exist_ok=True)
+    temp_path = os.path.join(snapshot_dir, f"{MANIFEST_NAME}.tmp")
+    with open(temp_path, 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(temp_path, os.path.join(snapshot_dir, MANIFEST_NAME))
+
+def create_snapshot(label=None):
+    """
+    Take an incremental snapshot of the volume and database
+    Returns the manifest (including copy statistics)
+    """
+    with _snapshot_lock:
+        started = time.time()
+        created = datetime.utcnow()
+        snapshot_id = f"{created.strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
+        previous = latest_snapshot()
+        previous_files = previous['files'] if previous else {}
+
+        stats = {'files': 0, 'new_files': 0, 'changed_files': 0, 'unchanged_files': 0,
+                 'bytes_total': 0, 'bytes_read': 0, 'bytes_stored': 0}
+        files = {}
+
+        for name, stat in iter_volume_files():
+            stats['files'] += 1
+            stats['bytes_total'] += stat.st_size
+            before = previous_files.get(name)
+            if before and before['size'] == stat.st_size and before['mtime_ns'] == stat.st_mtime_ns \
+                    and os.path.exists(object_path(before['sha256'])):
+                # Unchanged since the last snapshot - reuse its hash without reading the file
+                files[name] = before
+                stats['unchanged_files'] += 1
+                continue
+
+            try:
+                content_hash, stored = store_object(os.path.join(PHOTOGRAPHY_ASSETS_DIR, name))
+            except OSError as e:
+                # File removed while the snapshot was running
+                print(f"⚠️  Skipping {name}: {e}")
+                continue
+            stats['bytes_read'] += stat.st_size
+            stats['bytes_stored'] += stored
+            stats['changed_files' if before else 'new_files'] += 1
+            files[name] = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha256': content_hash}
+
+        # Consistent database copy, stored as an object like any other file
+        database = None
+        database_path = os.path.join(PHOTOGRAPHY_ASSETS_DIR, DATABASE_NAME)
+        if os.path.exists(database_path):
+            dump_path, backup_stats = backup_database_to_temp(database_path)
+            try:
+                content_hash, stored = store_object(dump_path)
+                database = {'size': backup_stats['bytes'], 'sha256': content_hash,
+                            'pages': backup_stats['pages'], 'backup_ms': backup_stats['duration_ms']}
+                stats['bytes_stored'] += stored
+            finally:
+                os.remove(dump_path)
+
+        stats['duration_seconds'] = round(time.time() - started, 2)
+        manifest = {
+            'id': snapshot_id,
+            'label': label,
+            'created': created.isoformat(),
+            'parent': previous['id'] if previous else None,
+            'database': database,
+            'files': files,
+            'stats': stats
+        }
+        _write_manifest(snapshot_id, manifest)
+
+        print(f"✅ Snapshot {snapshot_id}: {stats['files']} files "
+              f"({stats['new_files']} new, {stats['changed_files']} changed, {stats['unchanged_files']} unchanged), "
+              f"{stats['bytes_stored'] / (1024 * 1024):.1f} MB stored in {stats['duration_seconds']}s")
+        return manifest
+
+def restore_snapshot(snapshot_id, target_dir, verify=True):
+    """
+    Rebuild the volume (files + mindseye.db) as of a snapshot into target_dir
+    Returns the number of files restored
+    """
+    manifest = load_manifest(snapshot_id)
+    if manifest is None:
+        raise FileNotFoundError(f"Snapshot {snapshot_id} not found")
+
+    entries = list(manifest['files'].items())
+    if manifest.get('database'):
+        entries.append((DATABASE_NAME, manifest['database']))
+
+    restored = 0
+    for name, entry in entries:
+        destination = os.path.join(target_dir, *name.split('/'))
+        os.makedirs(os.path.dirname(destination), exist_ok=True)
+        source = object_path(entry['sha256'])
+        if verify:
+            if _copy_with_hash(source, destination) != entry['sha256']:
+                raise IOError(f"Checksum mismatch restoring {name} - object store is damaged")
+        else:
+            shutil.copyfile(source, destination)
+        if 'mtime_ns' in entry:
+            os.utime(destination, ns=(entry['mtime_ns'], entry['mtime_ns']))
+        restored += 1
+    return restored
+
+def snapshot_archive_entries(manifest, arc_prefix):
+    """Archive entries (see archive_stream) rebuilding a snapshot straight from the object store"""
+    from src.archive_stream import file_entry
+    for name, entry in sorted(manifest['files'].items()):
+        yield file_entry(f"{arc_prefix}/{name}", object_path(entry['sha256']))
+    if manifest.get('database'):
+        yield file_entry(f"{arc_prefix}/{DATABASE_NAME}", object_path(manifest['database']['sha256']))
+
+def snapshots_to_keep(snapshots, keep_daily, keep_weekly):
+    """
+    Ids retained by the policy: the newest snapshot of each of the last
+    keep_daily days and of each of the last keep_weekly ISO weeks that have one
+    (the most recent snapshot is always kept)
+    """
+    keep = set()
+    days, weeks = set(), set()
+    for manifest in sorted(snapshots, key=lambda manifest: manifest['created'], reverse=True):
+        created = datetime.fromisoformat(manifest['created'])
+        day = created.date()
+        week = created.isocalendar()[:2]
+        if day not in days and len(days) < keep_daily:
+            days.add(day)
+            keep.add(manifest['id'])
+        if week not in weeks and len(weeks) < keep_weekly:
+            weeks.add(week)
+            keep.add(manifest['id'])
+    if snapshots:
+        keep.add(max(snapshots, key=lambda manifest: manifest['created'])['id'])
+    return keep
+
+def delete_snapshot(snapshot_id):
+    """Remove a snapshot's manifest (its objects go at the next garbage collection)"""
+    snapshot_dir = os.path.join(SNAPSHOTS_DIR, os.path.basename(snapshot_id))
+    if os.path.isdir(snapshot_dir):
+        shutil.rmtree(snapshot_dir)
+
+def prune_snapshots(keep_daily, keep_weekly):
+    """Delete snapshots outside the retention policy, then unreferenced objects"""
+    with _snapshot_lock:
+        snapshots = list_snapshots()
+        keep = snapshots_to_keep(snapshots, keep_daily, keep_weekly)
+        removed = [manifest['id'] for manifest in snapshots if manifest['id'] not in keep]
+        for snapshot_id in removed:
+            delete_snapshot(snapshot_id)
+        objects_removed, bytes_freed = collect_garbage()
+    print(f"🧹 Pruned {len(removed)} snapshot(s), {objects_removed} object(s), "
+          f"{bytes_freed / (1024 * 1024):.1f} MB freed")
+    return {'snapshots_removed': removed, 'objects_removed': objects_removed, 'bytes_freed': bytes_freed}
+
+def collect_garbage(grace_seconds=GC_GRACE_SECONDS):
+    """Delete objects no manifest references - returns (objects removed, bytes freed)"""
+    referenced = set()
+    for manifest in list_snapshots():
+        referenced.update(entry['sha256'] for entry in manifest['files'].values())
+        if manifest.get('database'):
+            referenced.add(manifest['database']['sha256'])
+
+    cutoff = time.time() - grace_seconds
+    removed = 0
+    freed = 0
+    if not os.path.exists(OBJECTS_DIR):
+        return removed, freed
+    for dirpath, dirnames, filenames in os.walk(OBJECTS_DIR):
+        for filename in filenames:
+            if filename in referenced:
+                continue
+            path = os.path.join(dirpath, filename)
+            try:
+                stat = os.stat(path)
+                if stat.st_mtime > cutoff:
+                    continue
+                os.remove(path)
+                record_removed(path, stat.st_size)
+            except OSError:
+                continue
+            removed += 1
+            freed += stat.st_size
+    return removed, freed
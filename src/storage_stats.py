@@ -0,0 +1,191 @@
+"""
+Storage Statistics for Mind's Eye Photography
+File count and bytes per area of the volume, kept as running counters:
+uploads/deletes/derivative writes adjust them as they happen and a
+background scan reconciles them periodically (and at startup), so the
+dashboard never has to walk the volume. The counters live in one file on
+the volume and every change is applied to it under an exclusive lock, so
+all workers and CLI scripts share the same figures and restarts lose nothing
+"""
+import os
+import json
+import time
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from src.config import PHOTOGRAPHY_ASSETS_DIR, DERIVATIVES_DIR, BACKUPS_DIR, RESIZE_CACHE_DIR
+
+try:
+    import fcntl
+except ImportError:  # Windows - only the thread lock, like service_utils
+    fcntl = None
+
+AREAS = ('originals', 'derivatives', 'about', 'backups', 'other')
+DATABASE_FILES = ('mindseye.db', 'mindseye.db-wal', 'mindseye.db-shm', 'mindseye.db-journal')
+CACHE_DIR = os.path.join(PHOTOGRAPHY_ASSETS_DIR, 'cache')
+STATS_FILE = os.path.join(CACHE_DIR, 'storage_stats.json')
+LOCK_FILE = f"{STATS_FILE}.lock"
+RECONCILER_LOCK_FILE = os.path.join(CACHE_DIR, 'storage_stats_reconcile.lock')
+RECONCILE_INTERVAL_SECONDS = int(os.environ.get('STORAGE_STATS_RECONCILE_SECONDS', 60 * 60))
+
+# Configured directories first - they may live outside the volume root
+_AREA_ROOTS = (
+    (os.path.abspath(DERIVATIVES_DIR), 'derivatives'),
+    (os.path.abspath(BACKUPS_DIR), 'backups'),
+    (os.path.abspath(os.path.join(PHOTOGRAPHY_ASSETS_DIR, 'about')), 'about'),
+)
+
+_lock = threading.Lock()
+_thread = None
+
+def _empty_counters():
+    return {area: {'files': 0, 'bytes': 0} for area in AREAS}
+
+def area_for_path(path):
+    """Area a file on the volume counts towards (None for the database and resize cache, measured live)"""
+    path = os.path.abspath(path)
+    for root, area in _AREA_ROOTS:
+        if path.startswith(root + os.sep):
+            return area
+    if path.startswith(os.path.abspath(CACHE_DIR) + os.sep):
+        return None
+    volume = os.path.abspath(PHOTOGRAPHY_ASSETS_DIR)
+    if os.path.dirname(path) == volume:
+        return None if os.path.basename(path) in DATABASE_FILES else 'originals'
+    return 'other'
+
+@contextmanager
+def _locked():
+    """Exclusive access to the counters file (threads of this process and other processes)"""
+    with _lock:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(LOCK_FILE, 'a') as handle:
+            if fcntl is not None:
+                fcntl.flock(handle, fcntl.LOCK_EX)
+            yield  # Closing the handle releases the flock
+
+def _load():
+    """Counters saved by the last reconcile/update (zeros if never computed)"""
+    try:
+        with open(STATS_FILE) as f:
+            saved = json.load(f)
+        counters = _empty_counters()
+        counters.update({area: saved['areas'][area] for area in AREAS if area in saved.get('areas', {})})
+        return {'areas': counters, 'reconciled_at': saved.get('reconciled_at')}
+    except (OSError, ValueError, KeyError):
+        return {'areas': _empty_counters(), 'reconciled_at': None}
+
+def _save(state):
+    """Atomic replace - readers never see a half-written file"""
+    temp_path = f"{STATS_FILE}.{os.getpid()}.tmp"
+    with open(temp_path, 'w') as f:
+        json.dump(state, f)
+    os.replace(temp_path, STATS_FILE)
+
+def record_change(path, old_size, new_size):
+    """Adjust counters for a file written/replaced/deleted (size None = file absent)"""
+    area = area_for_path(path)
+    if area is None:
+        return
+    try:
+        with _locked():
+            state = _load()
+            counters = state['areas'][area]
+            counters['files'] += (new_size is not None) - (old_size is not None)
+            counters['bytes'] += (new_size or 0) - (old_size or 0)
+            _save(state)
+    except OSError as e:
+        # The next reconcile corrects the counters
+        print(f"⚠️  Could not update storage stats: {e}")
+
+def record_added(path, previous_size=None):
+    """Call after writing a file (previous_size if it overwrote an existing one)"""
+    try:
+        record_change(path, previous_size, os.path.getsize(path))
+    except OSError:
+        pass
+
+def record_removed(path, size):
+    """Call after deleting a file, with the size it had"""
+    record_change(path, size, None)
+
+def reconcile():
+    """Recount every area with a scandir walk of the volume and replace the counters"""
+    started = time.time()
+    counters = _empty_counters()
+    roots = [PHOTOGRAPHY_ASSETS_DIR] + [root for root, _ in _AREA_ROOTS
+                                        if not root.startswith(os.path.abspath(PHOTOGRAPHY_ASSETS_DIR) + os.sep)]
+    skip = {os.path.abspath(CACHE_DIR)}
+    stack = [os.path.abspath(root) for root in roots if os.path.isdir(root)]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.path not in skip:
+                            stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        area = area_for_path(entry.path)
+                        if area is not None:
+                            counters[area]['files'] += 1
+                            counters[area]['bytes'] += entry.stat().st_size
+        except OSError as e:
+            print(f"⚠️  Storage scan skipped {directory}: {e}")
+
+    try:
+        with _locked():
+            _save({'areas': counters, 'reconciled_at': datetime.utcnow().isoformat()})
+    except OSError as e:
+        print(f"⚠️  Could not save storage stats: {e}")
+    print(f"📊 Storage stats reconciled in {time.time() - started:.2f}s")
+    return get_storage_stats()
+
+def _database_usage():
+    files = 0
+    size = 0
+    for name in DATABASE_FILES:
+        try:
+            size += os.path.getsize(os.path.join(PHOTOGRAPHY_ASSETS_DIR, name))
+            files += 1
+        except OSError:
+            continue
+    return {'files': files, 'bytes': size}
+
+def get_storage_stats():
+    """Precomputed per-area usage plus live database and resize-cache figures"""
+    from src.image_resizer import resize_cache
+    state = _load()
+    areas = state['areas']
+    reconciled_at = state['reconciled_at']
+    areas['database'] = _database_usage()
+    cache = resize_cache.stats()
+    areas['cache'] = {'files': cache['files'], 'bytes': cache['bytes']}
+    return {
+        'areas': areas,
+        'total_files': sum(counters['files'] for counters in areas.values()),
+        'total_bytes': sum(counters['bytes'] for counters in areas.values()),
+        'reconciled_at': reconciled_at
+    }
+
+def _reconcile_loop():
+    from src.service_utils import lower_thread_priority
+    lower_thread_priority()
+    while True:
+        try:
+            reconcile()
+        except Exception as e:
+            print(f"❌ Storage stats reconcile failed: {e}")
+        time.sleep(RECONCILE_INTERVAL_SECONDS)
+
+def start_storage_stats():
+    """Start the background reconcile thread (one process per volume - the counters are shared)"""
+    global _thread
+    from src.service_utils import acquire_process_lock
+    with _lock:
+        if _thread is not None:
+            return
+        if not acquire_process_lock(RECONCILER_LOCK_FILE):
+            return
+        _thread = threading.Thread(target=_reconcile_loop, name='storage-stats', daemon=True)
+        _thread.start()
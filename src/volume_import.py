@@ -0,0 +1,139 @@
+"""
+Volume Import for Mind's Eye Photography
+Catalogs image files found on the volume that have no database row yet:
+- known filenames are loaded in one query
+- each new file is opened once in a thread pool to read dimensions and EXIF
+  from its header (pixels are never decoded)
+- rows are bulk-inserted and committed in batches, so an interrupted import
+  keeps what it finished and a rerun picks up the remaining files
+"""
+import os
+import time
+import uuid
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from PIL import Image as PILImage
+from src.models import db, Image, Category, ImageCategory
+from src.config import PHOTOGRAPHY_ASSETS_DIR
+from src.image_metadata import exif_from_image, dump_exif
+
+IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp'}
+IMPORT_WORKERS = 8
+IMPORT_BATCH_SIZE = 500
+
+CATEGORY_KEYWORDS = {
+    'wildlife': ['bird', 'eagle', 'duck', 'rabbit', 'sparrow', 'blackbird', 'woodpecker', 'starling', 'turkey'],
+    'nature': ['sunset', 'landscape', 'tree', 'forest', 'lake', 'mountain'],
+    'portraits': ['portrait', 'executive', 'headshot'],
+    'events': ['festival', 'disability-festival', 'event', 'celebration'],
+    'miscellaneous': ['zoo', 'skyline', 'madison']
+}
+
+def title_from_filename(filename):
+    """Readable title from a file name (drops a long uploader prefix before the first _)"""
+    name_without_ext = os.path.splitext(filename)[0]
+    if '_' in name_without_ext and len(name_without_ext.split('_')[0]) > 30:
+        name_without_ext = '_'.join(name_without_ext.split('_')[1:])
+    return name_without_ext.replace('-', ' ').replace('_', ' ').title()
+
+def categories_from_filename(filename):
+    """Category names guessed from keywords in the file name (Miscellaneous if none match)"""
+    filename_lower = filename.lower()
+    detected = [category.title() for category, keywords in CATEGORY_KEYWORDS.items()
+                if any(keyword in filename_lower for keyword in keywords)]
+    return detected or ['Miscellaneous']
+
+def find_unimported_files(assets_dir=PHOTOGRAPHY_ASSETS_DIR):
+    """Image files on the volume without an Image row (one query for all known names)"""
+    known = {filename for (filename,) in db.session.query(Image.filename)}
+    found = []
+    with os.scandir(assets_dir) as it:
+        for entry in it:
+            if entry.name in known or not entry.is_file():
+                continue
+            if os.path.splitext(entry.name)[1].lower() in IMAGE_EXTENSIONS:
+                found.append(entry.name)
+    return sorted(found)
+
+def read_image_header(path):
+    """Size, mtime, dimensions and EXIF from one open of the file - header only"""
+    stat = os.stat(path)
+    info = {'file_size': stat.st_size, 'file_mtime': stat.st_mtime_ns,
+            'width': None, 'height': None, 'exif_data': dump_exif({})}
+    try:
+        with PILImage.open(path) as img:
+            info['width'], info['height'] = img.size
+            info['exif_data'] = dump_exif(exif_from_image(img))
+    except Exception as e:
+        print(f"⚠️  Could not get info for {os.path.basename(path)}: {e}")
+    return info
+
+def _build_rows(filename, info, categories):
+    image_id = str(uuid.uuid4())
+    title = title_from_filename(filename)
+    image_row = {
+        'id': image_id,
+        'filename': filename,
+        'title': title,
+        'description': f"Migrated from volume - {title}",
+        'upload_date': datetime.utcnow(),
+        **info
+    }
+    link_rows = [{'id': str(uuid.uuid4()), 'image_id': image_id, 'category_id': categories[name.lower()]}
+                 for name in categories_from_filename(filename) if name.lower() in categories]
+    return image_row, link_rows
+
+def _insert_batch(image_rows, link_rows):
+    db.session.execute(db.insert(Image), image_rows)
+    if link_rows:
+        db.session.execute(db.insert(ImageCategory), link_rows)
+    db.session.commit()
+
+def import_files(filenames, assets_dir=PHOTOGRAPHY_ASSETS_DIR, workers=IMPORT_WORKERS, batch_size=IMPORT_BATCH_SIZE):
+    """
+    Catalog the given files (names relative to assets_dir) in committed batches
+    Returns the ids of the new Image rows
+    """
+    started = time.time()
+    categories = {name.lower(): category_id for category_id, name in db.session.query(Category.id, Category.name)}
+    image_ids = []
+
+    def read(filename):
+        return filename, read_image_header(os.path.join(assets_dir, filename))
+
+    image_rows, link_rows = [], []
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for filename, info in pool.map(read, filenames):
+            image_row, links = _build_rows(filename, info, categories)
+            image_rows.append(image_row)
+            link_rows.extend(links)
+            if len(image_rows) >= batch_size:
+                _insert_batch(image_rows, link_rows)
+                image_ids.extend(row['id'] for row in image_rows)
+                image_rows, link_rows = [], []
+                elapsed = time.time() - started
+                print(f"📊 Imported {len(image_ids)}/{len(filenames)} "
+                      f"({len(image_ids) / max(elapsed, 0.001):.0f} images/sec)")
+        if image_rows:
+            _insert_batch(image_rows, link_rows)
+            image_ids.extend(row['id'] for row in image_rows)
+    return image_ids
+
+def import_volume_images(assets_dir=PHOTOGRAPHY_ASSETS_DIR, workers=IMPORT_WORKERS, batch_size=IMPORT_BATCH_SIZE):
+    """
+    Import every uncataloged image file on the volume (call inside an app context)
+    Returns stats: found, imported, seconds
+    """
+    from src.response_cache import bump_catalog_version
+
+    started = time.time()
+    filenames = find_unimported_files(assets_dir)
+    stats = {'found': len(filenames), 'imported': 0, 'seconds': 0}
+    print(f"📁 Found {len(filenames)} new image files in volume")
+    if not filenames:
+        return stats
+
+    stats['imported'] = len(import_files(filenames, assets_dir, workers, batch_size))
+    bump_catalog_version()
+    stats['seconds'] = round(time.time() - started, 2)
+    return stats
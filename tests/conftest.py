@@ -0,0 +1,101 @@
+"""
+Shared fixtures: every test gets a fresh volume (database + asset
+directories) under one scratch directory. Config is read at import time,
+so the environment is set before anything from src is imported
+"""
+import os
+import sys
+import shutil
+import tempfile
+import pytest
+
+VOLUME = tempfile.mkdtemp(prefix='mindseye-tests-')
+os.environ['RAILWAY_VOLUME_MOUNT_PATH'] = VOLUME
+os.environ['BACKUPS_DIR'] = os.path.join(VOLUME, 'backups')
+# Background services are started explicitly by the tests that need them
+os.environ['CATALOG_SYNC_INTERVAL_SECONDS'] = '0'
+os.environ['ASSET_GC_INTERVAL_HOURS'] = '0'
+os.environ['BACKUP_INTERVAL_HOURS'] = '0'
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+def _clear_volume():
+    for name in os.listdir(VOLUME):
+        path = os.path.join(VOLUME, name)
+        if os.path.isdir(path) and not os.path.islink(path):
+            shutil.rmtree(path)
+        else:
+            os.remove(path)
+
+@pytest.fixture
+def app(monkeypatch):
+    """src.main's app on an empty, initialized database (inside an app context)"""
+    import src.app_factory
+    from src import main
+    from src.models import db
+    from src.response_cache import bump_catalog_version, bump_about_version
+
+    monkeypatch.setattr(src.app_factory, '_services_started', True)
+    _clear_volume()
+    bump_catalog_version()
+    bump_about_version()
+    init_database = src.app_factory.init_database
+    init_database(main.app, import_volume=False)
+    with main.app.app_context():
+        yield main.app
+        db.session.remove()
+        db.engine.dispose()
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+@pytest.fixture
+def admin_client(app):
+    client = app.test_client()
+    with client.session_transaction() as session:
+        session['admin_logged_in'] = True
+    return client
+
+@pytest.fixture
+def volume(app):
+    """The photography assets directory the app is using"""
+    from src.config import PHOTOGRAPHY_ASSETS_DIR
+    return PHOTOGRAPHY_ASSETS_DIR
+
+@pytest.fixture
+def make_image(app, volume):
+    """Create an Image row (and a real JPEG original on the volume)"""
+    import uuid
+    from datetime import datetime
+    from PIL import Image as PILImage
+    from src.models import db, Image, Category, ImageCategory
+
+    def _make(title='Untitled', categories=('Wildlife',), size=(64, 48), color=(120, 80, 40), **fields):
+        image_id = str(uuid.uuid4())
+        filename = fields.pop('filename', f"{image_id[:8]}.jpg")
+        PILImage.new('RGB', size, color).save(os.path.join(volume, filename), 'JPEG')
+        image = Image(id=image_id, filename=filename, title=title, upload_date=fields.pop('upload_date', datetime.utcnow()),
+                      **fields)
+        db.session.add(image)
+        for name in categories:
+            category = Category.query.filter_by(name=name).first()
+            db.session.add(ImageCategory(image_id=image_id, category_id=category.id))
+        db.session.commit()
+        return image
+    return _make
+
+@pytest.fixture
+def run_jobs(app):
+    """Run queued jobs in this thread until the queue is empty - returns how many ran"""
+    import src.image_jobs  # Handlers register on import
+    import src.asset_gc
+    from src.jobs import _claim_next_job, _run_job
+
+    def _run():
+        count = 0
+        while (job := _claim_next_job()) is not None:
+            _run_job(job)
+            count += 1
+        return count
+    return _run
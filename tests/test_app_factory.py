@@ -0,0 +1,39 @@
+import os
+import threading
+import src.app_factory as app_factory
+from src.app_factory import create_app, init_database
+from src.models import db, Category
+from src.migrations import get_schema_version, MIGRATIONS
+
+def _app(tmp_path, **kwargs):
+    return create_app({'SQLALCHEMY_DATABASE_URI': f"sqlite:///{tmp_path / 'fresh.db'}"}, **kwargs)
+
+def test_create_app_touches_no_database(tmp_path, monkeypatch):
+    started = []
+    monkeypatch.setattr(app_factory, 'start_background_services', started.append)
+    _app(tmp_path)
+    assert not os.path.exists(tmp_path / 'fresh.db')
+    assert started == []
+    assert not any(thread.name.startswith('job-worker') for thread in threading.enumerate())
+
+def test_init_database_creates_schema_and_defaults(tmp_path):
+    app = _app(tmp_path, start_services=False)
+    init_database(app, import_volume=False)
+    with app.app_context():
+        try:
+            assert Category.query.count() > 0
+            assert get_schema_version() == MIGRATIONS[-1][0]
+        finally:
+            db.session.remove()
+            db.engine.dispose()
+
+def test_services_start_on_first_request_only_when_enabled(tmp_path, monkeypatch):
+    started = []
+    monkeypatch.setattr(app_factory, 'start_background_services', started.append)
+    app = _app(tmp_path)
+    app.test_client().get('/no-such-page')
+    assert started == [app]
+
+    started.clear()
+    _app(tmp_path, start_services=False).test_client().get('/no-such-page')
+    assert started == []
@@ -0,0 +1,50 @@
+import io
+import os
+import zipfile
+from src.archive_stream import stream_zip, file_entry, bytes_entry, temp_file_entry, directory_entries
+
+def _zip(chunks):
+    return zipfile.ZipFile(io.BytesIO(b''.join(chunks)))
+
+def test_streams_files_in_chunks_without_staging(tmp_path, monkeypatch):
+    import src.archive_stream as archive_stream
+    monkeypatch.setattr(archive_stream, 'READ_CHUNK_SIZE', 1024)
+    photo = tmp_path / 'photo.jpg'
+    photo.write_bytes(os.urandom(10 * 1024))
+    stats = {}
+    chunks = list(stream_zip([file_entry('b/photo.jpg', str(photo)), bytes_entry('b/info.json', '{"a": 1}')], stats))
+    assert len(chunks) > 5
+    archive = _zip(chunks)
+    assert archive.read('b/photo.jpg') == photo.read_bytes()
+    assert archive.getinfo('b/photo.jpg').compress_type == zipfile.ZIP_STORED
+    assert archive.getinfo('b/info.json').compress_type == zipfile.ZIP_DEFLATED
+    assert stats['files'] == 2 and stats['bytes'] == 10 * 1024 + 8
+
+def test_missing_files_are_skipped_and_temp_files_removed(tmp_path):
+    temp = tmp_path / 'dump.db'
+    temp.write_bytes(b'sqlite')
+    stats = {}
+    archive = _zip(stream_zip([file_entry('gone.jpg', str(tmp_path / 'gone.jpg')),
+                               temp_file_entry('db/mindseye.db', lambda: str(temp))], stats))
+    assert archive.namelist() == ['db/mindseye.db'] and archive.read('db/mindseye.db') == b'sqlite'
+    assert stats['skipped'] == ['gone.jpg']
+    assert not temp.exists()
+
+def test_directory_entries_skip_journals_and_partial_uploads(tmp_path):
+    for name in ('a.jpg', 'mindseye.db-wal', 'upload.jpg.part', 'sub/b.txt'):
+        (tmp_path / name).parent.mkdir(exist_ok=True)
+        (tmp_path / name).write_text('x')
+    names = [arcname for arcname, _, _ in directory_entries(str(tmp_path), 'vol')]
+    assert names == ['vol/a.jpg', 'vol/sub/b.txt']
+
+def test_manual_backup_downloads_a_complete_archive(admin_client, make_image):
+    image = make_image(title='Archived')
+    response = admin_client.post('/admin/backup/create-manual')
+    assert response.status_code == 200 and response.mimetype == 'application/zip'
+    archive = _zip([response.data])
+    names = archive.namelist()
+    prefix = names[0].split('/')[0]
+    assert f"{prefix}/images/{image.filename}" in names
+    assert f"{prefix}/database/mindseye.db" in names
+    assert archive.read(f"{prefix}/database/mindseye.db").startswith(b'SQLite format 3')
+    assert f"{prefix}/backup_info.json" in names
@@ -0,0 +1,24 @@
+import os
+from src.models import db, Image
+from src.derivatives import derivative_path
+from backfill_derivatives import process_image, backfill_derivatives
+
+def test_process_image_is_resumable(make_image):
+    filename = make_image(size=(1000, 500)).filename
+    first = process_image(filename)
+    assert first['widths'] == [320, 800] and first['written'] == 2 and first['error'] is None
+    assert process_image(filename)['written'] == 0
+    assert process_image(filename, force=True)['written'] == 2
+
+def test_process_image_reports_errors(app):
+    assert 'No such file' in process_image('missing.jpg')['error']
+
+def test_backfill_records_widths_for_the_catalog(make_image):
+    ids = [make_image(title=f"Photo {n}", size=(900, 600)).id for n in range(3)]
+    make_image(title='Tiny', size=(100, 80))
+    db.session.remove()
+    backfill_derivatives(workers=2)
+    rows = {image.id: image for image in Image.query}
+    assert all(rows[image_id].derivative_widths == '320,800' for image_id in ids)
+    assert all(os.path.exists(derivative_path(rows[image_id].filename, 800)) for image_id in ids)
+    assert sum(image.derivative_widths is None for image in rows.values()) == 1
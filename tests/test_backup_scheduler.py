@@ -0,0 +1,50 @@
+import os
+import threading
+from datetime import datetime, timedelta
+import pytest
+import src.backup_scheduler as backup_scheduler
+from src.backup_scheduler import run_scheduled_backup, next_backup_due
+from src.snapshots import snapshots_to_keep, list_snapshots
+from src.service_utils import lower_thread_priority, get_io_priority_class, IOPRIO_CLASS_IDLE
+
+def _manifests(*days_ago, now=datetime(2024, 6, 30, 12)):
+    return [{'id': f"s{n}", 'created': (now - timedelta(days=days, hours=hours)).isoformat()}
+            for n, (days, hours) in enumerate(days_ago)]
+
+def test_retention_keeps_newest_per_day_and_week():
+    snapshots = _manifests((0, 0), (0, 3), (1, 0), (2, 0), (9, 0), (16, 0), (40, 0))
+    keep = snapshots_to_keep(snapshots, keep_daily=2, keep_weekly=3)
+    # Days: today's newest + yesterday; weeks: this one, 9 and 16 days back
+    assert keep == {'s0', 's2', 's4', 's5'}
+
+def test_retention_always_keeps_the_latest():
+    assert snapshots_to_keep(_manifests((3, 0), (5, 0)), keep_daily=0, keep_weekly=0) == {'s0'}
+
+def test_scheduled_backup_runs_only_when_due(app, make_image, monkeypatch):
+    # The suite disables the scheduler (interval 0) - schedule daily here
+    monkeypatch.setattr(backup_scheduler, 'next_backup_due', lambda: next_backup_due(interval_hours=24))
+    make_image()
+    first = run_scheduled_backup()
+    assert first is not None and first['stats']['new_files'] == 1
+    assert run_scheduled_backup() is None
+    assert backup_scheduler.next_backup_due() > datetime.utcnow()
+    assert run_scheduled_backup(force=True)['stats']['unchanged_files'] == 1
+    assert len(list_snapshots()) == 1  # Same-day snapshot pruned by the policy
+
+def test_background_thread_gets_idle_io_class():
+    result = {}
+
+    def worker():
+        lower_thread_priority()
+        try:
+            result['class'] = get_io_priority_class()
+        except OSError as e:
+            result['error'] = e
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+    if 'error' in result:
+        pytest.skip(f"ioprio not available here: {result['error']}")
+    assert result['class'] == IOPRIO_CLASS_IDLE
+    assert os.getpriority(os.PRIO_PROCESS, threading.get_native_id()) != 19
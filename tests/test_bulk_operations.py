@@ -0,0 +1,50 @@
+import os
+import pytest
+from src.models import db, Image, ImageCategory
+from src.bulk_operations import bulk_set_categories, bulk_delete_images
+
+def _category_names(image_id):
+    return sorted(link.category.name for link in ImageCategory.query.filter_by(image_id=image_id))
+
+def test_set_categories_replaces_links_and_reports_each_id(make_image, monkeypatch):
+    import src.bulk_operations as bulk_operations
+    monkeypatch.setattr(bulk_operations, 'BULK_CHUNK_SIZE', 2)
+    ids = [make_image(title=f"Photo {n}", categories=('Wildlife', 'Events')).id for n in range(3)]
+
+    result = bulk_set_categories(ids + ['missing', ids[0]], ['Nature', 'Landscapes', 'Nature'])
+    assert result['updated'] == 3
+    assert [entry['status'] for entry in result['results']] == ['updated'] * 3 + ['not_found']
+    assert all(_category_names(image_id) == ['Landscapes', 'Nature'] for image_id in ids)
+
+def test_unknown_category_changes_nothing(make_image):
+    image_id = make_image(title='Owl').id
+    with pytest.raises(ValueError, match='Nope'):
+        bulk_set_categories([image_id], ['Nature', 'Nope'])
+    assert _category_names(image_id) == ['Wildlife']
+
+def test_delete_removes_rows_and_queues_files(make_image, volume, run_jobs):
+    images = [make_image(title=f"Photo {n}") for n in range(3)]
+    ids, filenames = [image.id for image in images], [image.filename for image in images]
+
+    result = bulk_delete_images(ids[:2] + ['missing'])
+    assert result['deleted'] == 2
+    assert [entry['status'] for entry in result['results']] == ['deleted', 'deleted', 'not_found']
+    assert [image_id for (image_id,) in db.session.query(Image.id)] == [ids[2]]
+    assert ImageCategory.query.filter(ImageCategory.image_id.in_(ids[:2])).count() == 0
+
+    run_jobs()
+    assert [os.path.exists(os.path.join(volume, filename)) for filename in filenames] == [False, False, True]
+
+def test_bulk_api(client, admin_client, make_image):
+    image_id = make_image(title='Owl').id
+    assert client.post('/admin/api/bulk/delete', json={'image_ids': [image_id]}).status_code == 401
+    assert admin_client.post('/admin/api/bulk/categories', json={'image_ids': [image_id]}).status_code == 400
+    assert admin_client.post('/admin/api/bulk/categories',
+                             json={'image_ids': [image_id], 'categories': ['Nope']}).status_code == 400
+    assert admin_client.post('/admin/api/bulk/delete', json={'image_ids': 'all'}).status_code == 400
+
+    response = admin_client.post('/admin/api/bulk/categories', json={'image_ids': [image_id], 'categories': ['Portraits']})
+    assert response.get_json()['results'] == [{'id': image_id, 'status': 'updated'}]
+    response = admin_client.post('/admin/api/bulk/delete', json={'image_ids': [image_id]})
+    assert response.get_json()['deleted'] == 1
+    assert Image.query.count() == 0
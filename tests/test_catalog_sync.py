@@ -0,0 +1,64 @@
+import os
+import time
+from PIL import Image as PILImage
+from src.models import db, Image, Job
+from src.catalog_sync import plan_sync, sync_catalog
+
+def _age(path, seconds=3600):
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+def _write(volume, name, size=(40, 30)):
+    path = os.path.join(volume, name)
+    PILImage.new('RGB', size, (30, 60, 90)).save(path, 'JPEG')
+    _age(path)
+    return path
+
+def test_plan_compares_size_and_mtime():
+    catalog = {'same.jpg': ('1', 10, 100), 'resized.jpg': ('2', 10, 100), 'touched.jpg': ('3', 10, 100),
+               'legacy.jpg': ('4', None, None), 'gone.jpg': ('5', 10, 100), 'copying.jpg': ('6', 10, 100)}
+    files = {'same.jpg': (10, 100), 'resized.jpg': (11, 100), 'touched.jpg': (10, 200),
+             'legacy.jpg': (10, 100), 'new.jpg': (10, 100)}
+    assert plan_sync(catalog, files, unsettled={'copying.jpg'}) == {
+        'new': ['new.jpg'], 'changed': ['resized.jpg', 'touched.jpg'], 'adopted': ['legacy.jpg'], 'deleted': ['gone.jpg']
+    }
+
+def test_sync_imports_updates_and_deletes(make_image, volume):
+    kept = make_image(title='Kept')
+    gone = make_image(title='Gone')
+    _age(os.path.join(volume, kept.filename))
+    kept_id, gone_id, gone_file = kept.id, gone.id, gone.filename
+    os.remove(os.path.join(volume, gone_file))
+    _write(volume, 'new-heron.jpg')
+    PILImage.new('RGB', (10, 10)).save(os.path.join(volume, 'still-copying.jpg'), 'JPEG')
+
+    dry = sync_catalog(volume, dry_run=True)
+    assert dry['plan'] == {'new': ['new-heron.jpg'], 'changed': [], 'adopted': [kept.filename], 'deleted': [gone_file]}
+    assert Image.query.count() == 2
+
+    result = sync_catalog(volume)
+    assert (result['new'], result['adopted'], result['deleted']) == (1, 1, 1)
+    assert db.session.get(Image, gone_id) is None
+    assert db.session.get(Image, kept_id).file_mtime is not None
+    assert Image.query.filter_by(filename='still-copying.jpg').count() == 0
+    assert Job.query.filter_by(job_type='image.derivatives').count() == 1
+
+    # Nothing left to do on the next pass; a changed file gets its header re-read
+    assert not any(sync_catalog(volume)['plan'].values())
+    _write(volume, 'new-heron.jpg', size=(80, 60))
+    assert sync_catalog(volume)['plan']['changed'] == ['new-heron.jpg']
+    assert Image.query.filter_by(filename='new-heron.jpg').one().width == 80
+
+def test_mass_or_total_disappearance_deletes_nothing(make_image, volume):
+    images = [make_image(title=f"Photo {n}") for n in range(12)]
+    for image in images:
+        _age(os.path.join(volume, image.filename))
+    for image in images[:11]:
+        os.remove(os.path.join(volume, image.filename))
+    assert sync_catalog(volume)['deleted'] == 0
+    assert Image.query.count() == 12
+    assert sync_catalog(volume, allow_mass_delete=True)['deleted'] == 11
+
+    os.remove(os.path.join(volume, images[11].filename))
+    assert sync_catalog(volume, allow_mass_delete=True)['deleted'] == 0  # Looks unmounted
+    assert Image.query.count() == 1
@@ -0,0 +1,36 @@
+from sqlalchemy import event
+from src.models import db
+from src.response_cache import bump_catalog_version
+from src.category_summary import category_image_counts, category_summaries
+
+def _counts(client):
+    return {category['name']: category['image_count'] for category in client.get('/api/categories').get_json()}
+
+def test_counts_come_from_one_grouped_query(make_image):
+    make_image(title='Owl', categories=('Wildlife', 'Nature'))
+    make_image(title='Fox', categories=('Wildlife',))
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+    event.listen(db.engine, 'before_cursor_execute', count)
+    try:
+        summaries = category_summaries()
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', count)
+
+    assert len(statements) == 2
+    by_name = {summary['name']: summary['image_count'] for summary in summaries}
+    assert (by_name['Wildlife'], by_name['Nature'], by_name['Portraits']) == (2, 1, 0)
+    assert sum(category_image_counts().values()) == 3
+
+def test_public_counts_follow_catalog_writes(client, admin_client, make_image):
+    make_image(title='Owl', categories=('Wildlife',))
+    assert _counts(client)['Wildlife'] == 1
+    make_image(title='Heron', categories=('Wildlife',))
+    bump_catalog_version()  # make_image writes outside the admin routes
+    assert _counts(client)['Wildlife'] == 2
+
+    response = admin_client.post('/admin/category-management/delete', json={'category_name': 'Wildlife'})
+    assert '2 image associations removed' in response.get_json()['message']
+    assert 'Wildlife' not in _counts(client)
@@ -0,0 +1,100 @@
+import io
+import os
+import hashlib
+from PIL import Image as PILImage
+from src.models import db, Image, UploadSession, Job
+
+def _jpeg_bytes(color=(10, 120, 200)):
+    buffer = io.BytesIO()
+    PILImage.new('RGB', (80, 60), color).save(buffer, 'JPEG')
+    return buffer.getvalue()
+
+def _init(client, data, **fields):
+    payload = {'filename': 'heron.jpg', 'title': 'Heron', 'categories': ['Wildlife'], 'size': len(data), **fields}
+    return client.post('/admin/upload/chunked/init', json=payload).get_json()
+
+def _put(client, upload_id, offset, chunk):
+    return client.put(f'/admin/upload/chunked/{upload_id}?offset={offset}', data=chunk)
+
+def test_requires_login(client):
+    assert client.post('/admin/upload/chunked/init', json={}).status_code == 401
+
+def test_upload_in_chunks_creates_image_and_jobs(admin_client, volume):
+    data = _jpeg_bytes()
+    upload = _init(admin_client, data)
+    half = len(data) // 2
+    assert _put(admin_client, upload['upload_id'], 0, data[:half]).get_json()['offset'] == half
+    assert _put(admin_client, upload['upload_id'], half, data[half:]).get_json()['offset'] == len(data)
+
+    response = admin_client.post(f"/admin/upload/chunked/{upload['upload_id']}/complete",
+                                 json={'sha256': hashlib.sha256(data).hexdigest()})
+    assert response.status_code == 200
+    image = Image.query.one()
+    assert image.content_hash == hashlib.sha256(data).hexdigest()
+    with open(os.path.join(volume, image.filename), 'rb') as f:
+        assert f.read() == data
+    assert not os.path.exists(os.path.join(volume, f"{image.filename}.part"))
+    assert Job.query.filter_by(job_type='image.metadata').count() == 1
+
+def test_offset_mismatch_reports_where_to_resume(admin_client):
+    data = _jpeg_bytes()
+    upload = _init(admin_client, data, client_key='browser-file-1')
+    _put(admin_client, upload['upload_id'], 0, data[:100])
+
+    response = _put(admin_client, upload['upload_id'], 50, data[50:200])
+    assert response.status_code == 409
+    assert response.get_json()['offset'] == 100
+
+    # Same browser file again -> the session is resumed, not restarted
+    resumed = _init(admin_client, data, client_key='browser-file-1')
+    assert resumed['resumed'] and resumed['upload_id'] == upload['upload_id'] and resumed['offset'] == 100
+
+def test_chunk_past_declared_size_is_rejected(admin_client):
+    data = _jpeg_bytes()
+    upload = _init(admin_client, data)
+    assert _put(admin_client, upload['upload_id'], 0, data + b'extra').status_code == 400
+    assert admin_client.get(f"/admin/upload/chunked/{upload['upload_id']}").get_json()['offset'] == 0
+
+def test_checksum_mismatch_keeps_the_upload(admin_client):
+    data = _jpeg_bytes()
+    upload = _init(admin_client, data)
+    _put(admin_client, upload['upload_id'], 0, data)
+    response = admin_client.post(f"/admin/upload/chunked/{upload['upload_id']}/complete", json={'sha256': '0' * 64})
+    assert response.status_code == 422
+    assert Image.query.count() == 0
+
+def test_failed_commit_leaves_the_upload_resumable(admin_client, volume, monkeypatch):
+    data = _jpeg_bytes()
+    upload = _init(admin_client, data)
+    _put(admin_client, upload['upload_id'], 0, data)
+
+    def failing_commit():
+        raise RuntimeError('disk I/O error')
+    with monkeypatch.context() as patch:
+        patch.setattr(db.session, 'commit', failing_commit)
+        response = admin_client.post(f"/admin/upload/chunked/{upload['upload_id']}/complete")
+    assert response.status_code == 500
+
+    session = db.session.get(UploadSession, upload['upload_id'])
+    assert session.status == 'uploading'
+    assert os.path.exists(os.path.join(volume, f"{session.filename}.part"))
+    assert not os.path.exists(os.path.join(volume, session.filename))
+
+    response = admin_client.post(f"/admin/upload/chunked/{upload['upload_id']}/complete")
+    assert response.status_code == 200
+    assert Image.query.one().filename == session.filename
+
+def test_rejected_overrun_does_not_corrupt_the_checksum(admin_client, monkeypatch):
+    import src.routes.chunked_upload as chunked_upload
+    monkeypatch.setattr(chunked_upload, 'STREAM_BLOCK_SIZE', 64)  # Overrun noticed after hashing some blocks
+    data = _jpeg_bytes()
+    upload = _init(admin_client, data)
+    half = len(data) // 2
+    _put(admin_client, upload['upload_id'], 0, data[:half])
+    assert _put(admin_client, upload['upload_id'], half, data[half:] + b'extra').status_code == 400
+
+    assert _put(admin_client, upload['upload_id'], half, data[half:]).status_code == 200
+    response = admin_client.post(f"/admin/upload/chunked/{upload['upload_id']}/complete",
+                                 json={'sha256': hashlib.sha256(data).hexdigest()})
+    assert response.status_code == 200
+    assert Image.query.one().content_hash == hashlib.sha256(data).hexdigest()
@@ -0,0 +1,30 @@
+import pytest
+from src.response_cache import bump_catalog_version
+
+PUBLIC_JSON_APIS = ['/api/portfolio-new', '/assets/portfolio-data', '/api/categories', '/api/featured',
+                    '/api/background', '/api/slideshow-images', '/api/about-content', '/api/categories-config',
+                    '/api/portfolio/page']
+
+@pytest.mark.parametrize('url', PUBLIC_JSON_APIS)
+def test_matching_etag_answers_304(client, make_image, url):
+    make_image(is_featured=True)
+    response = client.get(url)
+    assert response.status_code == 200 and response.headers['ETag']
+    assert response.headers['Cache-Control'] == 'public, no-cache'
+    again = client.get(url, headers={'If-None-Match': response.headers['ETag']})
+    assert again.status_code == 304 and again.data == b''
+
+def test_stale_etag_gets_the_new_body(client, make_image):
+    make_image(title='First')
+    etag = client.get('/api/portfolio-new').headers['ETag']
+    make_image(title='Second')
+    bump_catalog_version()
+    response = client.get('/api/portfolio-new', headers={'If-None-Match': etag})
+    assert response.status_code == 200 and len(response.get_json()) == 2
+
+def test_if_modified_since(client, make_image):
+    make_image()
+    last_modified = client.get('/api/portfolio-new').headers['Last-Modified']
+    assert client.get('/api/portfolio-new', headers={'If-Modified-Since': last_modified}).status_code == 304
+    assert client.get('/api/portfolio-new',
+                      headers={'If-Modified-Since': 'Mon, 01 Jan 2001 00:00:00 GMT'}).status_code == 200
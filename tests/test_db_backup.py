@@ -0,0 +1,42 @@
+import sqlite3
+import threading
+from src.models import db
+from src.db_backup import backup_database, backup_database_to_temp, recent_backup_stats
+
+def test_backup_is_a_consistent_copy_taken_while_writing(make_image, tmp_path):
+    make_image(title='Before')
+    stop = threading.Event()
+
+    def writer(app):
+        with app.app_context():
+            n = 0
+            while not stop.is_set():
+                db.session.execute(db.text("UPDATE images SET description = :d"), {'d': f"rev {n}"})
+                db.session.commit()
+                n += 1
+            db.session.remove()
+    from flask import current_app
+    thread = threading.Thread(target=writer, args=(current_app._get_current_object(),))
+    thread.start()
+    try:
+        stats = backup_database(str(tmp_path / 'copy.db'), pages=1)
+    finally:
+        stop.set()
+        thread.join()
+
+    with sqlite3.connect(tmp_path / 'copy.db') as copy:
+        assert copy.execute('PRAGMA integrity_check').fetchone() == ('ok',)
+        assert copy.execute('SELECT title FROM images').fetchall() == [('Before',)]
+    assert stats['pages'] > 1 and stats['steps'] >= 1
+    assert stats['bytes'] == stats['pages'] * stats['page_size']
+
+def test_runs_are_recorded_oldest_first(app, tmp_path):
+    path, first = backup_database_to_temp(directory=str(tmp_path))
+    second = backup_database(str(tmp_path / 'again.db'))
+    history = recent_backup_stats()
+    assert [entry['timestamp'] for entry in history[-2:]] == [first['timestamp'], second['timestamp']]
+    assert path.endswith('.db.tmp')
+
+def test_backup_page_lists_recent_runs(admin_client, tmp_path):
+    backup_database(str(tmp_path / 'copy.db'))
+    assert admin_client.get('/admin/backup-system').status_code == 200
@@ -0,0 +1,43 @@
+import threading
+from sqlalchemy import create_engine
+from sqlalchemy.pool import QueuePool
+from src.models import db
+from src.config import SQLITE_BUSY_TIMEOUT_MS, SQLITE_CACHE_SIZE_KB, DB_POOL_SIZE
+from src.db_profile import engine_options, install_sqlite_profile, describe_connection
+
+def test_app_connections_use_wal_and_the_tuned_pragmas(app):
+    with db.engine.connect() as connection:
+        settings = describe_connection(connection)
+    assert settings['journal_mode'] == 'wal'
+    assert settings['synchronous'] == 1  # NORMAL
+    assert settings['busy_timeout'] == SQLITE_BUSY_TIMEOUT_MS
+    assert settings['cache_size'] == -SQLITE_CACHE_SIZE_KB
+    assert settings['temp_store'] == 2  # MEMORY
+
+def test_app_engine_is_pooled(app):
+    assert isinstance(db.engine.pool, QueuePool)
+    assert db.engine.pool.size() == DB_POOL_SIZE
+
+def test_reader_is_not_blocked_by_an_open_write(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'profile.db'}", **engine_options(pool_size=2))
+    install_sqlite_profile(engine)
+    install_sqlite_profile(engine)  # Installing twice adds no second listener
+    with engine.begin() as connection:
+        connection.exec_driver_sql("CREATE TABLE t (n INTEGER)")
+        connection.exec_driver_sql("INSERT INTO t VALUES (1)")
+
+    writer = engine.connect()
+    transaction = writer.begin()
+    writer.exec_driver_sql("INSERT INTO t VALUES (2)")
+    seen = []
+
+    def read():
+        with engine.connect() as connection:
+            seen.append(connection.exec_driver_sql("SELECT COUNT(*) FROM t").scalar())
+    reader = threading.Thread(target=read)
+    reader.start()
+    reader.join(timeout=2)
+    transaction.commit()
+    writer.close()
+    engine.dispose()
+    assert seen == [1]  # The committed snapshot, read while the write was open
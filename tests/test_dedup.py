@@ -0,0 +1,55 @@
+import io
+import os
+import shutil
+from datetime import datetime, timedelta
+from PIL import Image as PILImage
+from src.models import db, Image
+from src.dedup import file_sha256, find_image_by_hash, merge_duplicate_images
+from find_duplicates import find_duplicates
+
+def _upload(client, data, title, categories):
+    return client.post('/admin/upload', data={'title': title, 'categories': categories,
+                                              'image': (io.BytesIO(data), 'photo.jpg')},
+                       content_type='multipart/form-data')
+
+def test_reupload_links_to_the_existing_image(admin_client, volume):
+    buffer = io.BytesIO()
+    PILImage.new('RGB', (40, 30), (1, 2, 3)).save(buffer, 'JPEG')
+    data = buffer.getvalue()
+    _upload(admin_client, data, 'Original', ['Wildlife'])
+    response = _upload(admin_client, data, 'Again', ['Nature'])
+    assert 'duplicate' in response.headers['Location']
+
+    image = Image.query.one()
+    assert image.title == 'Original'
+    assert sorted(link.category.name for link in image.categories) == ['Nature', 'Wildlife']
+    assert [name for name in os.listdir(volume) if name.endswith('.jpg')] == [image.filename]
+
+def test_merge_moves_categories_and_flags_to_the_keeper(make_image):
+    keeper = make_image(title='Keeper', categories=('Wildlife',))
+    duplicate = make_image(title='Copy', categories=('Nature',), is_featured=True,
+                           featured_story='Dawn', description='From the blind')
+    removed = merge_duplicate_images(keeper, [duplicate])
+    db.session.commit()
+    assert removed == [duplicate.filename]
+    assert Image.query.count() == 1
+    assert keeper.is_featured and keeper.featured_story == 'Dawn' and keeper.description == 'From the blind'
+    assert sorted(link.category.name for link in keeper.categories) == ['Nature', 'Wildlife']
+
+def test_find_duplicates_hashes_merges_and_removes_stray_copies(make_image, volume):
+    keeper = make_image(title='First', upload_date=datetime.utcnow() - timedelta(days=1), color=(9, 9, 9))
+    copy = make_image(title='Second', color=(9, 9, 9))
+    keeper_id, keeper_file, copy_file = keeper.id, keeper.filename, copy.filename
+    Image.query.update({'file_size': os.path.getsize(os.path.join(volume, keeper_file))})
+    db.session.commit()
+    shutil.copy(os.path.join(volume, keeper_file), os.path.join(volume, 'stray-copy.jpg'))
+    db.session.remove()
+
+    find_duplicates(apply=False)
+    assert Image.query.count() == 2 and os.path.exists(os.path.join(volume, 'stray-copy.jpg'))
+
+    find_duplicates(apply=True)
+    assert [image.id for image in Image.query] == [keeper_id]
+    assert find_image_by_hash(file_sha256(os.path.join(volume, keeper_file))).id == keeper_id
+    assert not os.path.exists(os.path.join(volume, copy_file))
+    assert not os.path.exists(os.path.join(volume, 'stray-copy.jpg'))
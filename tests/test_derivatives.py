@@ -0,0 +1,66 @@
+import io
+import os
+from PIL import Image as PILImage
+from src.models import Image
+from src.derivatives import (
+    generate_derivatives, derivative_path, delete_derivatives, derivative_payload, thumbnail_url
+)
+
+def _original(volume, name, size, orientation=None):
+    exif = PILImage.Exif()
+    if orientation:
+        exif[0x0112] = orientation
+    PILImage.new('RGB', size, (90, 90, 90)).save(os.path.join(volume, name), 'JPEG', exif=exif)
+    return name
+
+def test_generates_every_width_narrower_than_the_original(volume):
+    name = _original(volume, 'wide.jpg', (2000, 1000))
+    assert generate_derivatives(name) == [320, 800, 1600]
+    assert PILImage.open(derivative_path(name, 800)).size == (800, 400)
+    assert generate_derivatives(_original(volume, 'small.jpg', (500, 400))) == [320]
+    assert generate_derivatives(_original(volume, 'tiny.jpg', (200, 100))) == []
+
+def test_rotated_originals_use_their_displayed_width(volume):
+    # Stored landscape, displayed portrait (orientation 6 = rotate 90)
+    name = _original(volume, 'rotated.jpg', (1000, 700), orientation=6)
+    assert generate_derivatives(name) == [320]
+    assert PILImage.open(derivative_path(name, 320)).size == (320, 457)
+
+def test_skip_fresh_leaves_current_derivatives_alone(volume):
+    name = _original(volume, 'photo.jpg', (1000, 500))
+    generate_derivatives(name)
+    before = os.stat(derivative_path(name, 320)).st_mtime_ns
+    assert generate_derivatives(name, skip_fresh=True) == [320, 800]
+    assert os.stat(derivative_path(name, 320)).st_mtime_ns == before
+
+def test_delete_derivatives(volume):
+    name = _original(volume, 'gone.jpg', (1000, 500))
+    generate_derivatives(name)
+    assert delete_derivatives(name) == 2
+    assert not os.path.exists(derivative_path(name, 320))
+
+def test_payload_and_thumbnail(app):
+    image = Image(filename='a.jpg', title='A', width=1000, derivative_widths='320,800')
+    payload = derivative_payload(image, absolute=False)
+    assert payload['derivatives'] == {'small': '/static/assets/derivatives/a-320w.jpg',
+                                      'medium': '/static/assets/derivatives/a-800w.jpg'}
+    assert payload['srcset'].endswith('/static/assets/a.jpg 1000w')
+    assert thumbnail_url(image) == '/static/assets/derivatives/a-320w.jpg'
+    assert thumbnail_url(Image(filename='b.jpg', title='B')) == '/static/assets/b.jpg'
+
+def test_upload_generates_derivatives_in_the_background(admin_client, run_jobs, volume):
+    buffer = io.BytesIO()
+    PILImage.new('RGB', (900, 600), (200, 10, 10)).save(buffer, 'JPEG')
+    buffer.seek(0)
+    response = admin_client.post('/admin/upload', data={
+        'title': 'Sunset', 'categories': ['Landscapes'], 'image': (buffer, 'sunset.jpg')
+    }, content_type='multipart/form-data')
+    assert response.status_code == 302 and 'success' in response.headers['Location']
+    image = Image.query.one()
+    assert image.derivative_widths is None
+
+    run_jobs()
+    image = Image.query.one()
+    assert (image.width, image.height) == (900, 600)
+    assert image.derivative_widths == '320,800'
+    assert os.path.exists(derivative_path(image.filename, 800))
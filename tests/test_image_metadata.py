@@ -0,0 +1,51 @@
+import os
+from PIL import Image as PILImage
+from src.models import db
+import src.image_metadata as image_metadata
+from src.image_metadata import GPS_IFD, EXIF_IFD, extract_exif_data, dump_exif
+
+def _photo_with_exif(path):
+    exif = PILImage.Exif()
+    exif[0x010F] = 'Canon'
+    exif[0x0110] = 'Canon EOS R8'
+    exif[EXIF_IFD] = {0x829D: 5.6, 0x829A: 0.004, 0x8827: 400, 0x9003: '2024:05:01 18:30:00'}
+    exif[GPS_IFD] = {1: 'N', 2: (51.0, 30.0, 0.0), 3: 'W', 4: (0.0, 7.0, 30.0)}
+    PILImage.new('RGB', (32, 24)).save(path, 'JPEG', exif=exif)
+
+def test_extracts_camera_settings_and_location(tmp_path):
+    path = str(tmp_path / 'photo.jpg')
+    _photo_with_exif(path)
+    exif = extract_exif_data(path)
+    assert exif['camera'] == 'Canon EOS R8'
+    assert exif['aperture'] == '5.6'
+    assert exif['shutter_speed'] == '1/250'
+    assert exif['iso'] == '400'
+    assert exif['date_taken'] == '05/01/2024 06:30 PM'
+    assert (exif['latitude'], exif['longitude']) == (51.5, -0.125)
+
+def test_no_exif_is_empty(tmp_path):
+    path = str(tmp_path / 'plain.png')
+    PILImage.new('RGB', (8, 8)).save(path)
+    assert extract_exif_data(path) == {}
+
+def _feature_photo(make_image, volume):
+    image = make_image(title='Located', is_featured=True)
+    path = os.path.join(volume, image.filename)
+    _photo_with_exif(path)
+    image.exif_data = dump_exif(extract_exif_data(path))
+    db.session.commit()
+    return image
+
+def test_featured_api_serves_stored_exif_without_location(client, make_image, volume):
+    _feature_photo(make_image, volume)
+    exif = client.get('/api/featured').get_json()['exif_data']
+    assert exif['camera'] == 'Canon EOS R8'
+    assert exif['gps_info'] == 'Unknown'
+    assert 'latitude' not in exif and 'longitude' not in exif
+
+def test_location_is_public_only_when_enabled(client, make_image, volume, monkeypatch):
+    monkeypatch.setattr(image_metadata, 'PUBLIC_EXIF_GPS', True)
+    _feature_photo(make_image, volume)
+    exif = client.get('/api/featured').get_json()['exif_data']
+    assert exif['latitude'] == 51.5
+    assert exif['gps_info'] == '51.50000, -0.12500'
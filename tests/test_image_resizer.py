@@ -0,0 +1,68 @@
+import io
+import os
+import pytest
+from PIL import Image as PILImage
+import src.image_resizer as image_resizer
+from src.config import RESIZE_CACHE_DIR
+from src.image_resizer import DiskLRUCache, get_resized_image, parse_resize_params
+
+@pytest.fixture
+def cache(app, monkeypatch):
+    cache = DiskLRUCache(RESIZE_CACHE_DIR, 10 * 1024 * 1024)
+    monkeypatch.setattr(image_resizer, 'resize_cache', cache)
+    return cache
+
+def test_parameters_are_whitelisted():
+    assert parse_resize_params('800', 'WEBP', '77') == (800, 'webp', 80)
+    for width, fmt in (('801', None), ('abc', None), ('800', 'gif')):
+        with pytest.raises(ValueError):
+            parse_resize_params(width, fmt, None)
+
+def test_resizes_without_upscaling(client, cache, make_image):
+    image = make_image(size=(1000, 500))
+    response = client.get(f'/img/{image.filename}?w=320&fmt=webp')
+    assert response.status_code == 200 and response.mimetype == 'image/webp'
+    assert PILImage.open(io.BytesIO(response.data)).size == (320, 160)
+    small = make_image(size=(200, 100))
+    assert PILImage.open(io.BytesIO(client.get(f'/img/{small.filename}?w=640').data)).size == (200, 100)
+    assert client.get('/img/missing.jpg?w=320').status_code == 404
+
+def test_cache_key_covers_format_and_ignores_quality_for_png(cache, make_image):
+    filename = make_image(size=(400, 300)).filename
+    jpeg, _ = get_resized_image(filename, 320, 'jpeg', 50)
+    assert get_resized_image(filename, 320, 'jpg', 50)[0] == jpeg
+    assert get_resized_image(filename, 320, 'jpeg', 90)[0] != jpeg
+    assert os.path.splitext(jpeg)[0] != os.path.splitext(get_resized_image(filename, 320, 'webp', 50)[0])[0]
+    assert get_resized_image(filename, 320, 'png', 50)[0] == get_resized_image(filename, 320, 'png', 90)[0]
+    assert cache.stats()['files'] == 4
+
+def test_replacing_the_original_changes_the_variant(cache, make_image, volume):
+    image = make_image(size=(400, 300))
+    first, _ = get_resized_image(image.filename, 320)
+    PILImage.new('RGB', (600, 300), (0, 0, 0)).save(os.path.join(volume, image.filename), 'JPEG')
+    second, _ = get_resized_image(image.filename, 320)
+    assert second != first
+    assert PILImage.open(second).size == (320, 160)
+
+def test_lru_evicts_least_recently_used(tmp_path):
+    cache = DiskLRUCache(str(tmp_path), max_bytes=250)
+    for name in ('a', 'b', 'c'):
+        (tmp_path / name).write_bytes(b'x' * 100)
+        if name == 'c':
+            cache.get('a')  # a is now more recent than b
+        cache.add(name, 100)
+    assert cache.get('b') is None and not (tmp_path / 'b').exists()
+    assert cache.get('a') and cache.get('c')
+    assert cache.stats()['bytes'] == 200
+
+def test_failed_encode_leaves_no_temp_file(cache, make_image, monkeypatch):
+    image = make_image(size=(1000, 500))
+
+    def disk_full(self, fp, *args, **kwargs):
+        with open(fp, 'wb') as f:
+            f.write(b'partial')
+        raise OSError(28, 'No space left on device')
+    monkeypatch.setattr(PILImage.Image, 'save', disk_full)
+    with pytest.raises(OSError):
+        get_resized_image(image.filename, 320)
+    assert os.listdir(RESIZE_CACHE_DIR) == []
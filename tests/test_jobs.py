@@ -0,0 +1,83 @@
+import threading
+from datetime import datetime, timedelta
+from src.models import db, Job
+from src.config import JOB_MAX_ATTEMPTS
+from src.jobs import (
+    enqueue, job_handler, _claim_next_job, _run_job, reset_interrupted_jobs, prune_finished_jobs, get_batch_status
+)
+
+calls = []
+
+@job_handler('test.flaky')
+def flaky(payload):
+    calls.append(payload)
+    if len(calls) < payload['succeed_on']:
+        raise RuntimeError('try again')
+
+def _drain():
+    while (job := _claim_next_job()) is not None:
+        _run_job(job)
+
+def test_jobs_run_only_after_commit(app):
+    enqueue('test.flaky', {'succeed_on': 1})
+    db.session.rollback()
+    assert _claim_next_job() is None
+
+def test_failed_job_is_retried_then_succeeds(app):
+    calls.clear()
+    enqueue('test.flaky', {'succeed_on': 2}, batch_id='b1')
+    db.session.commit()
+    _drain()
+    job = Job.query.one()
+    assert (job.status, job.attempts, job.error) == ('done', 2, None)
+    assert get_batch_status('b1')['complete'] is True
+
+def test_job_fails_for_good_after_max_attempts(app):
+    calls.clear()
+    enqueue('test.flaky', {'succeed_on': JOB_MAX_ATTEMPTS + 5})
+    enqueue('test.unknown')
+    db.session.commit()
+    _drain()
+    jobs = Job.query.order_by(Job.id).all()
+    assert [(job.status, job.attempts) for job in jobs] == [('failed', JOB_MAX_ATTEMPTS), ('failed', JOB_MAX_ATTEMPTS)]
+    assert 'No handler registered' in jobs[1].error
+
+def test_each_job_is_claimed_once(app):
+    for _ in range(20):
+        enqueue('test.flaky', {'succeed_on': 1})
+    db.session.commit()
+    claimed, lock = [], threading.Lock()
+
+    def worker():
+        with app.app_context():
+            while (job := _claim_next_job()) is not None:
+                with lock:
+                    claimed.append(job.id)
+            db.session.remove()
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(claimed) == sorted(set(claimed)) and len(claimed) == 20
+
+def test_interrupted_jobs_are_requeued_and_old_ones_pruned(app):
+    enqueue('test.flaky', {'succeed_on': 1})
+    db.session.commit()
+    job = _claim_next_job()
+    assert reset_interrupted_jobs() == 1
+    assert db.session.get(Job, job.id).status == 'pending'
+
+    _drain()
+    done = Job.query.one()
+    assert prune_finished_jobs() == 0
+    done.finished_date = datetime.utcnow() - timedelta(days=8)
+    db.session.commit()
+    assert prune_finished_jobs() == 1
+
+def test_job_status_endpoint(admin_client, client):
+    enqueue('test.flaky', {'succeed_on': 1}, batch_id='batch-x')
+    db.session.commit()
+    assert client.get('/admin/jobs/status').status_code == 401
+    status = admin_client.get('/admin/jobs/status?batch_id=batch-x').get_json()
+    assert status['counts']['pending'] == 1 and status['complete'] is False
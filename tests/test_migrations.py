@@ -0,0 +1,40 @@
+import pytest
+from src.models import db
+from src.migrations import MIGRATIONS, get_schema_version, pending_migrations, run_migrations, _columns
+
+def _indexes(table):
+    return {row[1] for row in db.session.execute(db.text(f"PRAGMA index_list({table})"))}
+
+def test_fresh_database_is_at_the_latest_version(app):
+    assert get_schema_version() == MIGRATIONS[-1][0]
+    assert pending_migrations() == []
+    assert run_migrations() == []
+
+def test_old_database_is_brought_up_to_date(make_image):
+    image_id = make_image(title='Kept').id
+    db.session.execute(db.text("DROP INDEX IF EXISTS ix_images_content_hash"))
+    db.session.execute(db.text("DROP INDEX IF EXISTS ix_images_display_order"))
+    db.session.execute(db.text("ALTER TABLE images DROP COLUMN content_hash"))
+    db.session.execute(db.text("ALTER TABLE images DROP COLUMN file_mtime"))
+    db.session.execute(db.text("DELETE FROM schema_version"))
+    db.session.commit()
+
+    assert run_migrations() == [version for version, _, _ in MIGRATIONS]
+    assert {'content_hash', 'file_mtime'} <= _columns('images')
+    assert {'ix_images_content_hash', 'ix_images_display_order'} <= _indexes('images')
+    assert db.session.execute(db.text("SELECT title FROM images WHERE id = :id"), {'id': image_id}).scalar() == 'Kept'
+    # Every step is idempotent: replaying them all changes nothing
+    db.session.execute(db.text("DELETE FROM schema_version"))
+    db.session.commit()
+    assert run_migrations() == [version for version, _, _ in MIGRATIONS]
+    assert get_schema_version() == MIGRATIONS[-1][0]
+
+def test_failed_step_is_not_recorded(app, monkeypatch):
+    import src.migrations as migrations
+
+    def broken():
+        raise RuntimeError('boom')
+    monkeypatch.setattr(migrations, 'MIGRATIONS', MIGRATIONS + [(MIGRATIONS[-1][0] + 1, 'broken', broken)])
+    with pytest.raises(RuntimeError):
+        run_migrations()
+    assert get_schema_version() == MIGRATIONS[-1][0]
@@ -0,0 +1,67 @@
+from datetime import datetime
+from src.models import db, Image
+from src.migrations import _backfill_sort_keys, _normalize_upload_dates
+from src.portfolio_serializer import build_portfolio_page, decode_cursor, encode_cursor
+
+def _walk(**kwargs):
+    ids, cursor = [], None
+    while True:
+        page = build_portfolio_page(cursor=cursor, limit=2, **kwargs)
+        ids.extend(item['id'] for item in page['items'])
+        cursor = page['next_cursor']
+        if cursor is None:
+            return ids, page['total']
+
+def test_walks_every_image_once_in_portfolio_order(make_image):
+    tied = datetime(2024, 5, 1, 12, 0, 0)
+    images = [make_image(title=f"Tied {n}", upload_date=tied) for n in range(5)]
+    images += [make_image(title='Earlier', upload_date=datetime(2023, 1, 1))]
+    ids, total = _walk()
+    assert total == 6
+    assert ids == [images[5].id] + sorted(image.id for image in images[:5])
+
+def test_backfilled_upload_dates_page_without_skipping(make_image):
+    """Rows backfilled in SQL used to sort below the cursor bound and drop out"""
+    images = [make_image(title=f"Legacy {n}") for n in range(5)]
+    db.session.execute(db.text("UPDATE images SET upload_date = NULL"))
+    _backfill_sort_keys()
+    db.session.commit()
+    ids, _ = _walk()
+    assert sorted(ids) == sorted(image.id for image in images)
+
+def test_normalizes_dates_written_by_sqlite(make_image):
+    images = [make_image(title=f"Old {n}") for n in range(4)]
+    db.session.execute(db.text("UPDATE images SET upload_date = '2020-02-02 10:00:00'"))
+    db.session.commit()
+    _normalize_upload_dates()
+    db.session.commit()
+    stored = {row[0] for row in db.session.execute(db.text("SELECT upload_date FROM images"))}
+    assert stored == {'2020-02-02 10:00:00.000000'}
+    ids, _ = _walk()
+    assert sorted(ids) == sorted(image.id for image in images)
+
+def test_filters_by_category_and_search(make_image):
+    make_image(title='Red fox', categories=('Wildlife',))
+    make_image(title='Fox glacier', categories=('Landscapes',))
+    make_image(title='Heron', categories=('Wildlife',))
+    page = build_portfolio_page(category='Wildlife', search='fox')
+    assert [item['title'] for item in page['items']] == ['Red fox']
+    assert page['total'] == 1
+
+def test_cursor_round_trip_and_rejects_garbage(make_image):
+    image = make_image(display_order=3)
+    assert decode_cursor(encode_cursor(image)) == (3, image.upload_date, image.id)
+    try:
+        decode_cursor('not-a-cursor')
+    except ValueError:
+        pass
+    else:
+        raise AssertionError('malformed cursor accepted')
+
+def test_page_endpoint_validates_limit(client, make_image):
+    make_image()
+    assert client.get('/api/portfolio/page?limit=abc').status_code == 400
+    assert client.get('/api/portfolio/page?cursor=%%%').status_code == 400
+    response = client.get('/api/portfolio/page?limit=10')
+    assert response.status_code == 200
+    assert len(response.get_json()['items']) == 1
@@ -0,0 +1,54 @@
+from contextlib import contextmanager
+from sqlalchemy import event
+from src.models import db
+from src.portfolio_serializer import build_public_portfolio, build_admin_portfolio, build_manager_portfolio
+
+@contextmanager
+def count_queries():
+    statements = []
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)
+    event.listen(db.engine, 'before_cursor_execute', listener)
+    try:
+        yield statements
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', listener)
+
+def test_query_count_does_not_grow_with_the_catalog(make_image):
+    make_image(categories=('Wildlife', 'Nature'))
+    db.session.expire_all()
+    with count_queries() as few:
+        build_public_portfolio()
+    for n in range(10):
+        make_image(title=f"Image {n}", categories=('Landscapes',))
+    db.session.expire_all()
+    with count_queries() as many:
+        items = build_public_portfolio()
+    assert len(items) == 11
+    assert len(many) == len(few) == 2
+
+def test_public_item_shape(make_image):
+    image = make_image(title='Elk', description='Rut', categories=('Wildlife', 'Nature'))
+    item = build_public_portfolio()[0]
+    assert item['id'] == image.id and item['title'] == 'Elk' and item['description'] == 'Rut'
+    assert sorted(item['categories']) == ['Nature', 'Wildlife']
+    assert item['url'].endswith(f"/static/assets/{image.filename}")
+    assert item['metadata']['created_at'] == image.upload_date.isoformat()
+
+def test_uncategorized_images_fall_back_to_miscellaneous(make_image):
+    make_image(categories=())
+    assert build_public_portfolio()[0]['categories'] == ['Miscellaneous']
+    assert build_admin_portfolio()[0]['categories'] == []
+
+def test_admin_and_manager_shapes(make_image):
+    image = make_image(title='Owl')
+    assert build_admin_portfolio()[0]['filename'] == image.filename
+    manager = build_manager_portfolio()[0]
+    assert manager['image'] == image.filename and manager['thumbnail_url']
+
+def test_portfolio_endpoints_share_one_payload(client, make_image):
+    make_image(title='Lynx')
+    new = client.get('/api/portfolio-new')
+    legacy = client.get('/assets/portfolio-data')
+    assert new.status_code == legacy.status_code == 200
+    assert new.data == legacy.data
+    assert [item['title'] for item in new.get_json()] == ['Lynx']
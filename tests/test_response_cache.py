@@ -0,0 +1,51 @@
+import threading
+from src.response_cache import get_cached_payload, bump_catalog_version, bump_about_version, get_version, ABOUT_SCOPE
+from src.bulk_operations import bulk_set_categories
+
+def test_builder_runs_once_per_version(app):
+    calls = []
+    builder = lambda: calls.append(1) or {'n': len(calls)}
+    first = get_cached_payload('test_once', builder)
+    assert get_cached_payload('test_once', builder) is first
+    assert len(calls) == 1
+    bump_catalog_version()
+    assert get_cached_payload('test_once', builder).body != first.body
+    assert len(calls) == 2
+
+def test_scopes_are_invalidated_separately(app):
+    about = get_cached_payload('test_about', lambda: {'about': 1}, scope=ABOUT_SCOPE)
+    version = get_version(ABOUT_SCOPE)
+    bump_catalog_version()
+    assert get_version(ABOUT_SCOPE) == version
+    assert get_cached_payload('test_about', lambda: {'about': 2}, scope=ABOUT_SCOPE) is about
+    bump_about_version()
+    assert get_cached_payload('test_about', lambda: {'about': 2}, scope=ABOUT_SCOPE).body != about.body
+
+def test_payload_built_during_a_write_is_not_kept(app):
+    def builder():
+        bump_catalog_version()  # An admin write lands mid-build
+        return {'stale': True}
+    get_cached_payload('test_race', builder)
+    assert get_cached_payload('test_race', lambda: {'stale': False}).body == b'{"stale":false}\n'
+
+def test_concurrent_misses_build_once(app):
+    calls = []
+    started = threading.Event()
+
+    def builder():
+        calls.append(1)
+        started.wait(1)
+        return {}
+    threads = [threading.Thread(target=get_cached_payload, args=('test_concurrent', builder)) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    started.set()
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 1
+
+def test_admin_write_refreshes_the_public_portfolio(client, make_image):
+    image = make_image(title='Bison', categories=('Wildlife',))
+    assert client.get('/api/portfolio-new').get_json()[0]['categories'] == ['Wildlife']
+    bulk_set_categories([image.id], ['Landscapes'])
+    assert client.get('/api/portfolio-new').get_json()[0]['categories'] == ['Landscapes']
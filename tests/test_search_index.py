@@ -0,0 +1,70 @@
+from src.models import db, Image, Category
+from src.search_index import build_match_query, render_highlight, search_images
+from src.portfolio_serializer import build_portfolio_page
+
+def _titles(text, **kwargs):
+    return [item['title'] for item in search_images(text, **kwargs)['results']]
+
+def test_triggers_follow_inserts_updates_and_deletes(make_image):
+    image = make_image(title='Snowy owl', description='Perched at dusk')
+    assert _titles('owl') == ['Snowy owl']
+    assert _titles('dusk') == ['Snowy owl']
+
+    image.title = 'Barn owl'
+    db.session.commit()
+    assert _titles('snowy') == []
+    assert _titles('barn') == ['Barn owl']
+
+    db.session.delete(image)
+    db.session.commit()
+    assert _titles('owl') == []
+
+def test_category_rename_reindexes_its_images(make_image):
+    make_image(title='Ridge', categories=('Landscapes',))
+    category = Category.query.filter_by(name='Landscapes').first()
+    category.display_name = 'Mountains'
+    db.session.commit()
+    assert _titles('mountains') == ['Ridge']
+
+def test_ranks_title_matches_first_and_prefix_matches_last_word(make_image):
+    make_image(title='Harbour at night', description='Heron')
+    make_image(title='Grey heron')
+    assert _titles('hero') == ['Grey heron', 'Harbour at night']
+    assert _titles('hero', category='Landscapes') == []
+
+def test_highlight_is_escaped_html(make_image):
+    make_image(title='Fox <b>& cubs</b>')
+    result = search_images('fox')['results'][0]
+    assert result['highlight']['title'] == '<mark>Fox</mark> &lt;b&gt;&amp; cubs&lt;/b&gt;'
+    assert render_highlight('\x02a\x03<') == '<mark>a</mark>&lt;'
+
+def test_operators_in_the_query_are_plain_words():
+    assert build_match_query('title: NEAR(fox') == '{title description featured_story categories} : ("title" "NEAR" "fox"*)'
+    assert build_match_query('  ?! ') is None
+
+def test_portfolio_search_survives_vacuum(make_image):
+    """VACUUM may renumber images.rowid - the search filter must not depend on it"""
+    doomed = [make_image(title=f"Gull {n}") for n in range(5)]
+    kept_id = make_image(title='Kingfisher').id
+    rowid = lambda: db.session.execute(db.text("SELECT rowid FROM images WHERE id = :id"), {'id': kept_id}).scalar()
+    before = rowid()
+    for image in doomed:
+        db.session.delete(image)
+    db.session.commit()
+    db.session.remove()
+    with db.engine.connect().execution_options(isolation_level='AUTOCOMMIT') as connection:
+        connection.exec_driver_sql('VACUUM')
+        # SQLite only renumbers when it can't copy rows verbatim - force what it may do
+        connection.exec_driver_sql('UPDATE images SET rowid = rowid + 1000')
+    assert rowid() == before + 1000
+
+    page = build_portfolio_page(search='kingfisher')
+    assert [item['id'] for item in page['items']] == [kept_id]
+    assert page['total'] == 1
+    assert _titles('kingfisher') == ['Kingfisher']
+
+def test_search_endpoint(client, make_image):
+    make_image(title='Kestrel')
+    response = client.get('/api/search?q=kes')
+    assert response.status_code == 200
+    assert [item['title'] for item in response.get_json()['results']] == ['Kestrel']
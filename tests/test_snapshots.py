@@ -0,0 +1,67 @@
+import os
+import json
+import sqlite3
+import pytest
+from src.snapshots import (
+    create_snapshot, restore_snapshot, list_snapshots, object_path, collect_garbage, prune_snapshots, SNAPSHOTS_DIR
+)
+
+def _write(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(data)
+
+def test_second_snapshot_only_copies_changes(make_image, volume):
+    make_image(title='One')
+    make_image(title='Two')
+    _write(os.path.join(volume, 'about', 'me.jpg'), b'about')
+    first = create_snapshot()
+    assert first['stats']['new_files'] == 3
+    assert 'derivatives' not in json.dumps(first['files'])
+
+    _write(os.path.join(volume, 'about', 'me.jpg'), b'about, edited')
+    second = create_snapshot()
+    assert second['parent'] == first['id']
+    assert (second['stats']['unchanged_files'], second['stats']['changed_files']) == (2, 1)
+    assert second['stats']['bytes_read'] == len(b'about, edited')
+    assert len(second['files']) == 3
+
+def test_restore_rebuilds_files_and_database(make_image, volume, tmp_path):
+    image = make_image(title='Restored')
+    manifest = create_snapshot()
+    target = tmp_path / 'restore'
+    assert restore_snapshot(manifest['id'], str(target)) == 2
+    with open(os.path.join(volume, image.filename), 'rb') as f:
+        assert (target / image.filename).read_bytes() == f.read()
+    with sqlite3.connect(target / 'mindseye.db') as connection:
+        assert connection.execute("SELECT title FROM images").fetchall() == [('Restored',)]
+
+def test_restore_detects_a_damaged_object(make_image, tmp_path):
+    image = make_image()
+    manifest = create_snapshot()
+    with open(object_path(manifest['files'][image.filename]['sha256']), 'ab') as f:
+        f.write(b'bitrot')
+    with pytest.raises(IOError):
+        restore_snapshot(manifest['id'], str(tmp_path / 'restore'))
+
+def test_unfinished_snapshots_are_ignored(make_image):
+    make_image()
+    create_snapshot()
+    os.makedirs(os.path.join(SNAPSHOTS_DIR, 'half_written'))
+    assert len(list_snapshots()) == 1
+
+def test_garbage_collection_keeps_referenced_and_recent_objects(make_image, volume):
+    image = make_image()
+    first = create_snapshot()
+    _write(os.path.join(volume, image.filename), b'replaced')
+    old_hash = first['files'][image.filename]['sha256']
+    second = create_snapshot()
+
+    prune_snapshots(keep_daily=1, keep_weekly=0)  # Same day - only the newest survives
+    assert [manifest['id'] for manifest in list_snapshots()] == [second['id']]
+    assert os.path.exists(object_path(old_hash))  # Within the grace period
+
+    removed, freed = collect_garbage(grace_seconds=0)
+    assert not os.path.exists(object_path(old_hash))
+    assert removed >= 1 and freed > 0
+    assert os.path.exists(object_path(second['files'][image.filename]['sha256']))
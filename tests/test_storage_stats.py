@@ -0,0 +1,55 @@
+import os
+import sys
+import subprocess
+from src.config import DERIVATIVES_DIR
+from src.storage_stats import area_for_path, get_storage_stats, reconcile, record_added, record_removed
+
+def _write(path, size):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(b'x' * size)
+    return path
+
+def test_paths_map_to_areas(volume):
+    assert area_for_path(os.path.join(volume, 'photo.jpg')) == 'originals'
+    assert area_for_path(os.path.join(DERIVATIVES_DIR, 'photo_w320.jpg')) == 'derivatives'
+    assert area_for_path(os.path.join(volume, 'about', 'me.jpg')) == 'about'
+    assert area_for_path(os.path.join(volume, 'mindseye.db')) is None
+    assert area_for_path(os.path.join(volume, 'cache', 'resized', 'x.jpg')) is None
+
+def test_changes_are_persisted_as_they_happen(volume):
+    path = _write(os.path.join(volume, 'a.jpg'), 100)
+    record_added(path)
+    _write(path, 150)
+    record_added(path, previous_size=100)
+    assert get_storage_stats()['areas']['originals'] == {'files': 1, 'bytes': 150}
+    os.remove(path)
+    record_removed(path, 150)
+    assert get_storage_stats()['areas']['originals'] == {'files': 0, 'bytes': 0}
+
+def test_other_processes_see_and_add_to_the_same_counters(volume):
+    record_added(_write(os.path.join(volume, 'here.jpg'), 10))
+    script = (
+        "import os\n"
+        "from src.storage_stats import record_added, get_storage_stats\n"
+        "path = os.path.join(os.environ['RAILWAY_VOLUME_MOUNT_PATH'], 'there.jpg')\n"
+        "open(path, 'wb').write(b'y' * 20)\n"
+        "record_added(path)\n"
+        "print(get_storage_stats()['areas']['originals']['bytes'])\n"
+    )
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    output = subprocess.run([sys.executable, '-c', script], cwd=root, env=os.environ,
+                            capture_output=True, text=True, check=True).stdout
+    assert output.strip() == '30'
+    assert get_storage_stats()['areas']['originals'] == {'files': 2, 'bytes': 30}
+
+def test_reconcile_corrects_drift(volume):
+    _write(os.path.join(volume, 'untracked.jpg'), 40)
+    _write(os.path.join(DERIVATIVES_DIR, 'untracked_w320.jpg'), 5)
+    record_added(_write(os.path.join(volume, 'tracked.jpg'), 60))
+    assert get_storage_stats()['areas']['originals']['files'] == 1
+    stats = reconcile()
+    assert stats['areas']['originals'] == {'files': 2, 'bytes': 100}
+    assert stats['areas']['derivatives'] == {'files': 1, 'bytes': 5}
+    assert stats['reconciled_at'] is not None
+    assert stats['areas']['database']['files'] >= 1
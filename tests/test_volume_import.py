@@ -0,0 +1,39 @@
+import os
+import json
+from PIL import Image as PILImage
+from src.models import db, Image
+from src.volume_import import find_unimported_files, import_volume_images, read_image_header, categories_from_filename
+
+def _write(volume, name, size=(40, 30)):
+    PILImage.new('RGB', size, (90, 90, 90)).save(os.path.join(volume, name), 'JPEG')
+
+def test_imports_only_uncataloged_files_in_batches(make_image, volume):
+    make_image(title='Known', filename='known.jpg')
+    for n in range(5):
+        _write(volume, f"eagle-{n}.jpg", size=(40 + n, 30))
+    open(os.path.join(volume, 'notes.txt'), 'w').close()
+
+    assert find_unimported_files(volume) == [f"eagle-{n}.jpg" for n in range(5)]
+    stats = import_volume_images(volume, workers=2, batch_size=2)
+    assert (stats['found'], stats['imported']) == (5, 5)
+
+    image = Image.query.filter_by(filename='eagle-3.jpg').one()
+    assert (image.width, image.height) == (43, 30)
+    assert image.title == 'Eagle 3'
+    assert image.file_mtime == os.stat(os.path.join(volume, 'eagle-3.jpg')).st_mtime_ns
+    assert [link.category.name for link in image.categories] == ['Wildlife']
+    # A rerun finds nothing left to do
+    assert import_volume_images(volume)['found'] == 0
+    assert Image.query.count() == 6
+
+def test_unreadable_file_is_still_cataloged(volume, app):
+    with open(os.path.join(volume, 'broken.jpg'), 'wb') as f:
+        f.write(b'not an image')
+    info = read_image_header(os.path.join(volume, 'broken.jpg'))
+    assert (info['width'], info['height'], info['file_size']) == (None, None, 12)
+    assert json.loads(info['exif_data']) == {}
+    assert import_volume_images(volume)['imported'] == 1
+
+def test_categories_from_keywords():
+    assert categories_from_filename('Sunset-Over-Lake.jpg') == ['Nature']
+    assert categories_from_filename('IMG_0001.jpg') == ['Miscellaneous']